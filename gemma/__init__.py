@@ -1,11 +1,34 @@
 # "noqa" setting stops flake8 from flagging unused imports in __init__
 
 from ._version import __version__  # noqa
-from ._bearings import BearingAbstract, Fallback, Attr, Item, Call, bearing
+from ._bearings import (
+    BearingAbstract,
+    Fallback,
+    AdaptiveFallback,
+    Attr,
+    Item,
+    Call,
+    Where,
+    bearing,
+)
+from ._wildcards import Wildcard, RecursiveWildcard
 from ._course import Course, PORT
+from ._cursor import Cursor
+from ._template import CourseTemplate
 from ._compass import Compass
-from ._surveyor import Surveyor
-from ._cartogrpaher import Cartographer, Coordinate, Coord
+from ._chart import Chart, IndexedChart
+from ._surveyor import Surveyor, SurveyEvent
+from ._flatten import flatten, unflatten
+from ._columns import Columns
+from ._cartogrpaher import Cartographer, Coordinate, Coord, MappingPlan, FetchStats
+from ._cleaners import (
+    register_cleaner,
+    registered_cleaner,
+    batch_cleaner,
+    memoize_cleaner,
+)
+from ._cache import CleanerCache, CacheStats
+from ._serialize import dump_coordinates, load_coordinates
 from ._exceptions import NullNameError, NonNavigableError, SuppressedErrors
 from ._flags import NO_DEFAULT
 
@@ -13,19 +36,41 @@ from ._flags import NO_DEFAULT
     __version__,
     Course,
     PORT,
+    Cursor,
+    CourseTemplate,
     BearingAbstract,
     Fallback,
+    AdaptiveFallback,
     Attr,
     Item,
     Call,
+    Where,
+    Wildcard,
+    RecursiveWildcard,
     NullNameError,
     bearing,
     Compass,
     Surveyor,
+    SurveyEvent,
+    flatten,
+    unflatten,
+    Columns,
+    Chart,
+    IndexedChart,
     NonNavigableError,
     Cartographer,
     Coordinate,
     Coord,
+    MappingPlan,
+    FetchStats,
+    register_cleaner,
+    registered_cleaner,
+    batch_cleaner,
+    memoize_cleaner,
+    CleanerCache,
+    CacheStats,
+    dump_coordinates,
+    load_coordinates,
     SuppressedErrors,
     NO_DEFAULT,
 )
@@ -1,4 +1,7 @@
+import copy
+import dataclasses
 import re
+import threading
 from typing import (
     Any,
     TypeVar,
@@ -20,9 +23,69 @@ _NameType = TypeVar("_NameType")
 FactoryType = TypeVar("FactoryType")
 
 
+# ##### PROTOCOL HOOKS #####
+# Types can opt-in to fast paths by defining these methods. They are looked up on the
+#   type rather than the instance, like other dunder methods, once per type.
+_NO_HOOKS: Tuple[Any, Any] = (None, None)
+
+# type to its (fetch hook, place hook). Cleared when full, so types made on the fly
+#   do not pile up.
+_TYPE_HOOKS: Dict[type, Tuple[Any, Any]] = dict()
+_TYPE_HOOKS_SIZE = 1024
+
+
+def _type_hooks(target: Any) -> Tuple[Any, Any]:
+    """``(__gemma_fetch__, __gemma_place__)`` of the type of ``target``, or ``None``"""
+    kind = type(target)
+    # the common containers cannot define hooks.
+    if kind is dict or kind is list or kind is tuple:
+        return _NO_HOOKS
+
+    hooks = _TYPE_HOOKS.get(kind)
+    if hooks is None:
+        hooks = (
+            getattr(kind, "__gemma_fetch__", None),
+            getattr(kind, "__gemma_place__", None),
+        )
+        if len(_TYPE_HOOKS) >= _TYPE_HOOKS_SIZE:
+            _TYPE_HOOKS.clear()
+        _TYPE_HOOKS[kind] = hooks
+    return hooks
+
+
+def _fetch_hook(target: Any, this_bearing: "BearingAbstract") -> Any:
+    """
+    Calls ``target.__gemma_fetch__(bearing)`` if the type of ``target`` defines it.
+
+    :return: fetched value, or ``NotImplemented`` if there is no hook or the hook
+        declined the bearing.
+    """
+    hook = _type_hooks(target)[0]
+    if hook is None:
+        return NotImplemented
+    return hook(target, this_bearing)
+
+
+def _place_hook(target: Any, this_bearing: "BearingAbstract", value: Any) -> bool:
+    """
+    Calls ``target.__gemma_place__(bearing, value)`` if the type of ``target`` defines
+    it.
+
+    :return: ``True`` if the hook placed the value, ``False`` if there is no hook or
+        the hook returned ``NotImplemented``.
+    """
+    hook = _type_hooks(target)[1]
+    if hook is None:
+        return False
+    return hook(target, this_bearing, value) is not NotImplemented
+
+
 class BearingAbstract(Generic[_NameType]):
     REGEX: Pattern = re.compile(".+")
     NAME_TYPES: List[Union[Type, Any]] = [str]
+    FAN_OUT: bool = False
+    FALLBACK_CANDIDATE: bool = True
+    _sort_key_cache: Optional[Tuple[int, str, str, Any]] = None
 
     def __new__(
         cls,
@@ -59,12 +122,22 @@ class BearingAbstract(Generic[_NameType]):
             - **REGEX**: ( ``re.Pattern`` ) - Regex pattern to match string shorthand
             - **NAME_TYPES** ( ``List[Union[Type, Any]]`` ) - ``type`` ( or ``tuple`` of
               types ) that ``name`` can be.
+            - **FAN_OUT** ( ``bool`` ) - bearing can match many values, and is
+              expanded by :func:`Course.fetch_iter` through a ``fan_out()`` method
+              instead of fetched. See :class:`Wildcard`.
+            - **FALLBACK_CANDIDATE** ( ``bool`` ) - whether :func:`bearing` loads the
+              class into the ``BEARING_CLASSES`` of :class:`Fallback` bearings.
         """
         if isinstance(name, BearingAbstract):
             name = name.name
         self._name: _NameType = name
         self._factory: Optional[Type[FactoryType]] = factory
 
+    def __getnewargs__(self) -> Tuple[Any, ...]:
+        # __new__ checks the name, so it is passed back to it when unpickling. The
+        #   rest of the bearing is restored from its __dict__.
+        return (self._name,)
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, BearingAbstract):
             raise TypeError("bearings cannot be compared to other types")
@@ -119,18 +192,27 @@ class BearingAbstract(Generic[_NameType]):
             1. By class: Item, Attr, Call, [Custom Implementation by name], Bearing
             2. Bearing name type (alphabetical by class, ex: float, int, str)
             3. value of bearing name
+
+        The key is computed once per bearing, then cached. ``name`` is read-only, so
+        the key cannot go stale.
         """
+        key = bearing_obj._sort_key_cache
+        if key is not None:
+            return key
+
         try:
             type_value = TYPE_SORT_ORDER.index(type(bearing_obj))
         except ValueError:
             type_value = TYPE_SORT_ORDER.index("other")
 
-        return (
+        key = (
             type_value,
             type(bearing_obj).__name__,
             type(bearing_obj.name).__name__,
             bearing_obj.name,
         )
+        bearing_obj._sort_key_cache = key
+        return key
 
     @property
     def name(self) -> "_NameType":
@@ -224,6 +306,37 @@ class BearingAbstract(Generic[_NameType]):
         """
         raise NotImplementedError
 
+    def _fetch_unhooked(self, target: Any) -> Any:
+        """As fetch, for a target whose type defines no protocol hooks"""
+        return self.fetch(target)
+
+    def _place_unhooked(self, target: Any, value: Any) -> None:
+        """As place, for a target whose type defines no protocol hooks"""
+        self.place(target, value)
+
+    def place_copy(self, target: Any, value: Any) -> Any:
+        """
+        **MAY BE IMPLEMENTED**
+
+        Returns a copy of ``target`` with ``value`` placed at
+        :func:`BearingAbstract.name`. ``target`` is not changed.
+
+        :param target: object to copy.
+        :param value: value to place on the copy.
+        :return: new object.
+        :raises NullNameError: if bearing cannot be placed.
+        :raises TypeError: When ``target`` is wrong type for Bearing
+
+        DEFAULT IMPLEMENTATION: calls :func:`BearingAbstract.place` on a shallow
+        ``copy.copy()`` of ``target``.
+
+        Copies are shallow, so values other than the one placed are shared with
+        ``target``. Used by :func:`Course.replace_in`.
+        """
+        new = copy.copy(target)
+        self.place(new, value)
+        return new
+
     @classmethod
     def name_from_str(cls, text: str) -> Any:
         """
@@ -321,6 +434,12 @@ class Attr(BearingAbstract[str]):
           ...
         gemma._exceptions.NullNameError: @b>
         """
+        value = _fetch_hook(target, self)
+        if value is not NotImplemented:
+            return value
+        return self._fetch_unhooked(target)
+
+    def _fetch_unhooked(self, target: Any) -> Any:
         try:
             return getattr(target, self.name)
         except AttributeError:
@@ -357,6 +476,11 @@ class Attr(BearingAbstract[str]):
         Unlike ``setattr()``, :func:`Attr.place` cannot be used to declare arbitrary
         attributes. Non-existent attributes will raise a NullNameError.
         """
+        if _place_hook(target, self, value):
+            return
+        self._place_unhooked(target, value)
+
+    def _place_unhooked(self, target: Any, value: Any) -> None:
         try:
             attr = getattr(target, self.name)
         except AttributeError:
@@ -367,6 +491,43 @@ class Attr(BearingAbstract[str]):
 
         setattr(target, self.name, value)
 
+    def place_copy(self, target: Any, value: Any) -> Any:
+        """
+        Returns a copy of ``target`` with the attribute set to ``value``.
+
+        Dataclass instances are copied with ``dataclasses.replace()`` and named tuples
+        with ``_replace()``, so frozen types can be updated. Other types fall back to
+        :func:`BearingAbstract.place_copy`.
+
+        >>> from gemma import Attr
+        >>> from dataclasses import dataclass
+        >>>
+        >>> @dataclass(frozen=True)
+        ... class Frozen:
+        ...     a: str = "value"
+        ...
+        >>> original = Frozen()
+        >>> Attr("a").place_copy(original, "changed")
+        Frozen(a='changed')
+        >>> original
+        Frozen(a='value')
+        """
+        if _type_hooks(target)[1] is not None:
+            return super().place_copy(target, value)
+
+        fields = getattr(target, "_fields", None)
+        if isinstance(target, tuple) and fields is not None:
+            if self.name not in fields:
+                raise NullNameError(str(self))
+            return getattr(target, "_replace")(**{self.name: value})
+
+        if dataclasses.is_dataclass(target) and not isinstance(target, type):
+            for field in dataclasses.fields(target):
+                if field.name == self.name and field.init:
+                    return dataclasses.replace(target, **{self.name: value})
+
+        return super().place_copy(target, value)
+
 
 class Item(BearingAbstract[Any]):
     REGEX = re.compile(r"\[(.+)\]")
@@ -426,6 +587,12 @@ class Item(BearingAbstract[Any]):
             ...
         TypeError: 'int' object is not subscriptable
         """
+        value = _fetch_hook(target, self)
+        if value is not NotImplemented:
+            return value
+        return self._fetch_unhooked(target)
+
+    def _fetch_unhooked(self, target: Any) -> Any:
         try:
             return target[self.name]
         except (KeyError, IndexError):
@@ -517,6 +684,11 @@ class Item(BearingAbstract[Any]):
             ...
         gemma._exceptions.NullNameError: [c]
         """
+        if _place_hook(target, self, value):
+            return
+        self._place_unhooked(target, value)
+
+    def _place_unhooked(self, target: Any, value: Any) -> None:
         try:
             target[self.name] = value
         except KeyError:
@@ -529,6 +701,39 @@ class Item(BearingAbstract[Any]):
                 return
             raise NullNameError(str(self))
 
+    def place_copy(self, target: Any, value: Any) -> Any:
+        """
+        Returns a copy of ``target`` with ``value`` at the index or key.
+
+        Tuples are rebuilt, named tuples through ``_make()``. Other types, like
+        ``dict`` and ``list``, fall back to :func:`BearingAbstract.place_copy`.
+
+        >>> from gemma import Item
+        >>>
+        >>> original = ("zero", "one", "two")
+        >>> Item(1).place_copy(original, "changed")
+        ('zero', 'changed', 'two')
+
+        Unlike :func:`Item.place`, indexes past the end of a tuple raise
+        :class:`NullNameError`.
+        """
+        if not isinstance(target, tuple) or (
+            _type_hooks(target)[1] is not None
+        ):
+            return super().place_copy(target, value)
+
+        values = list(target)
+        try:
+            values[self.name] = value
+        except IndexError:
+            raise NullNameError(str(self))
+
+        if hasattr(target, "_make"):
+            return target._make(values)
+        if type(target) is tuple:
+            return tuple(values)
+        return type(target)(values)
+
 
 class Call(BearingAbstract[str]):
     REGEX = re.compile(r"(.+?)\(\)")
@@ -604,6 +809,12 @@ class Call(BearingAbstract[str]):
         >>> data_list.index("repeat", 1)
         3
         """
+        value = _fetch_hook(target, self)
+        if value is not NotImplemented:
+            return value
+        return self._fetch_unhooked(target)
+
+    def _fetch_unhooked(self, target: Any) -> Any:
         try:
             method = getattr(target, self.name)
         except AttributeError:
@@ -737,6 +948,11 @@ class Call(BearingAbstract[str]):
         >>> inserts_head
         ['zero', 'one', 'two', '3']
         """
+        if _place_hook(target, self, value):
+            return
+        self._place_unhooked(target, value)
+
+    def _place_unhooked(self, target: Any, value: Any) -> None:
         try:
             method = getattr(target, self.name)
         except AttributeError:
@@ -747,18 +963,226 @@ class Call(BearingAbstract[str]):
         method(*args, **kwargs)
 
 
+class Where(BearingAbstract[Tuple[Any, Any]]):
+    REGEX = re.compile(r"\[([^=\[\]]+)=(.*)\]$")
+    NAME_TYPES = [tuple]
+    FALLBACK_CANDIDATE = False
+    INDEXED: bool = False
+    INDEX_CACHE_SIZE: int = 16
+
+    def __init__(self, name: Tuple[Any, Any], indexed: Optional[bool] = None):
+        """
+        Selects the first element of a sequence whose ``field`` equals ``value``.
+
+        :param name: ``(field, value)`` tuple. ``field`` is cast with :func:`bearing`
+            and fetched from each element.
+        :param indexed: build and reuse an index of the sequence. Defaults to
+            ``Where.INDEXED``.
+
+        **inherits from:** :class:`BearingAbstract`
+
+        **name types:** ``tuple`` of ``(field, value)``.
+
+        **shorthand:** ``"[field=value]"``, always parsed to ``str`` values. Not in
+        ``Course.BEARINGS``, so course strings keep ``"[field=value]"`` as an
+        :class:`Item` key. Construct :class:`Where` explicitly in courses.
+
+        Class Attributes:
+            - **INDEXED (** ``bool`` **):** default for ``indexed``.
+            - **INDEX_CACHE_SIZE (** ``int`` **):** number of sequence indexes kept,
+              shared by all :class:`Where` bearings. The least recently used index is
+              dropped first.
+
+        >>> from gemma import PORT, Where
+        >>>
+        >>> order = {"items": [{"sku": "A1", "qty": 1}, {"sku": "B2", "qty": 5}]}
+        >>> (PORT / "items" / Where(("sku", "B2")) / "qty").fetch(order)
+        5
+
+        Without an index, each fetch scans the sequence. With ``indexed=True``, the
+        first fetch maps each element's ``field`` value to its position, and later
+        fetches of the same ``field`` on the same sequence are dict lookups, no matter
+        which value they select. An index is rebuilt when the sequence is a different
+        object or has changed length, when the element it points to no longer
+        matches, or when it has no entry for the value. Replacing or editing an
+        element so that it matches ahead of an indexed match, without changing the
+        sequence length, can leave the later match selected until the index is rebuilt.
+        """
+        super().__init__(name)
+        if indexed is None:
+            indexed = self.INDEXED
+
+        self._indexed: bool = indexed
+        self._field: BearingAbstract = bearing(self.name[0])
+
+    def __str__(self) -> str:
+        return f"[{self.name[0]}={self.name[1]}]"
+
+    @property
+    def field(self) -> BearingAbstract:
+        """
+        :return: bearing fetched from each element.
+        """
+        return self._field
+
+    @property
+    def value(self) -> Any:
+        """
+        :return: value the ``field`` of an element must equal.
+        """
+        return self.name[1]
+
+    def fetch(self, target: Any) -> Any:
+        """
+        Fetches the first element of ``target`` whose ``field`` equals ``value``.
+
+        :param target: sequence to search.
+        :return: matching element.
+        :raises NullNameError: if no element matches.
+        """
+        value = _fetch_hook(target, self)
+        if value is not NotImplemented:
+            return value
+
+        return target[self._find(target)]
+
+    def place(self, target: Any, value: Any, **kwargs: dict) -> None:
+        """
+        Replaces the first element of ``target`` whose ``field`` equals ``value``.
+
+        :param target: sequence to search.
+        :param value: replacement element.
+        :return: None
+        :raises NullNameError: if no element matches.
+        """
+        if _place_hook(target, self, value):
+            return
+
+        target[self._find(target)] = value
+
+    def place_copy(self, target: Any, value: Any) -> Any:
+        """
+        Returns a copy of ``target`` with the first matching element replaced, as
+        :func:`Item.place_copy` would at the element's position.
+        """
+        if _type_hooks(target)[1] is not None:
+            return super().place_copy(target, value)
+        return Item(self._find(target)).place_copy(target, value)
+
+    @classmethod
+    def name_from_str(cls, text: str) -> Tuple[str, str]:
+        """
+        Splits ``"[field=value]"`` into ``(field, value)``
+
+        :raises ValueError: if ``text`` is not a ``str`` in that format.
+        """
+        if not isinstance(text, str):
+            raise ValueError("Where bearings are only cast from strings")
+
+        match = re.match(cls.REGEX, text)
+        if match is None:
+            raise ValueError("text does not match regex")
+        return match.group(1), match.group(2)
+
+    @classmethod
+    def is_compatible(cls, name: Any) -> bool:
+        """
+        ``name`` must be a ``(field, value)`` tuple.
+        """
+        return isinstance(name, tuple) and len(name) == 2
+
+    @classmethod
+    def clear_indexes(cls) -> None:
+        """
+        Drops every cached sequence index.
+        """
+        with _WHERE_INDEXES_LOCK:
+            _WHERE_INDEXES.clear()
+
+    def _matches(self, element: Any) -> bool:
+        try:
+            return self._field.fetch(element) == self.value
+        except (NullNameError, TypeError, ValueError):
+            return False
+
+    def _find(self, target: Any) -> int:
+        """position of the first matching element of ``target``"""
+        if self._indexed:
+            try:
+                position = self._find_indexed(target)
+            except TypeError:
+                # unhashable values cannot be indexed, scan instead.
+                pass
+            else:
+                if position is None:
+                    raise NullNameError(str(self))
+                return position
+
+        for position, element in enumerate(target):
+            if self._matches(element):
+                return position
+
+        raise NullNameError(str(self))
+
+    def _find_indexed(self, target: Any) -> Optional[int]:
+        key = (id(target), self.name[0])
+
+        with _WHERE_INDEXES_LOCK:
+            cached = _WHERE_INDEXES.pop(key, None)
+            if cached is not None:
+                # re-insert to mark as most recently used
+                _WHERE_INDEXES[key] = cached
+
+        if cached is not None and cached[0] is target and cached[1] == len(target):
+            position = cached[2].get(self.value)
+            if position is not None and self._matches(target[position]):
+                return position
+            # a miss may be stale after an element was replaced, so rebuild.
+
+        index = self._build_index(target)
+        with _WHERE_INDEXES_LOCK:
+            _WHERE_INDEXES[key] = (target, len(target), index)
+            while len(_WHERE_INDEXES) > self.INDEX_CACHE_SIZE:
+                del _WHERE_INDEXES[next(iter(_WHERE_INDEXES))]
+
+        return index.get(self.value)
+
+    def _build_index(self, target: Any) -> Dict[Any, int]:
+        """maps each element's field value to its first position"""
+        index: Dict[Any, int] = dict()
+        for position, element in enumerate(target):
+            try:
+                field_value = self._field.fetch(element)
+            except (NullNameError, TypeError, ValueError):
+                continue
+            try:
+                index.setdefault(field_value, position)
+            except TypeError:
+                continue
+        return index
+
+
+# Indexes are keyed by (id(sequence), field). The sequence is stored with its index so
+#   the id cannot be reused while the index is alive.
+_WHERE_INDEXES: Dict[Tuple[int, Any], Tuple[Any, int, Dict[Any, int]]] = dict()
+_WHERE_INDEXES_LOCK = threading.Lock()
+
+
 _BEARING_CLASSES: List[Type[BearingAbstract]] = [Item, Call, Attr]
 
 
 class Fallback(BearingAbstract[Any]):
     NAME_TYPES = [Any]
     BEARING_CLASSES: List[Type[BearingAbstract]] = _BEARING_CLASSES
+    _casts: Tuple[BearingAbstract, ...] = tuple()
+    _casts_source: Optional[List[Type[BearingAbstract]]] = None
 
-    def __init__(self, name: Any):
+    def __init__(self, name: Any, factory: Optional[Type[FactoryType]] = None):
         """
         Attempts to fetch or place data on a target using other bearing class' methods.
 
         :param name: name of bearing.
+        :param factory: As :class:`BearingAbstract`.
 
         **inherits from:** :class:`BearingAbstract`
 
@@ -782,7 +1206,7 @@ class Fallback(BearingAbstract[Any]):
         Meant as a generic class when the bearing type is not well defined in a string
         ( Allows for more compact, generic :class:`Course` declarations ).
         """
-        super().__init__(name)
+        super().__init__(name, factory)
 
     def __str__(self) -> str:
         return str(self.name)
@@ -847,14 +1271,21 @@ class Fallback(BearingAbstract[Any]):
         Both ``Item('a')`` and ``Call('a')`` would return valid values --
         ``"a method"`` and ``"a item"``, respectively -- but since :class:`Item` is
         tried first and gets a valid response, the key value is returned.
+
+        If the type of ``target`` defines ``__gemma_fetch__``, it is called with this
+        bearing before any of the classes are tried. See :ref:`protocol-hooks`.
         """
-        for bearing_type in self.BEARING_CLASSES:
-            try:
-                cast_bearing = bearing_type(self)
-            except TypeError:
-                continue
+        hook = _type_hooks(target)[0]
+        if hook is not None:
+            value = hook(target, self)
+            if value is not NotImplemented:
+                return value
 
+        for cast_bearing in self._cast_bearings():
             try:
+                # without a hook, the cast bearing does not need to look again.
+                if hook is None:
+                    return cast_bearing._fetch_unhooked(target)
                 return cast_bearing.fetch(target)
             except (NullNameError, TypeError, ValueError):
                 pass
@@ -930,22 +1361,222 @@ class Fallback(BearingAbstract[Any]):
         attribute respectively) -- but since :class:`Item` is tried first and does not
         return an error, it is set to the dict's key rather than overriding
         it's ``a`` method.
+
+        If the type of ``target`` defines ``__gemma_place__``, it is called with this
+        bearing before any of the classes are tried. See :ref:`protocol-hooks`.
+        """
+        hook = _type_hooks(target)[1]
+        if hook is not None and hook(target, self, value) is not NotImplemented:
+            return
+
+        for cast_bearing in self._cast_bearings():
+            try:
+                if hook is None:
+                    cast_bearing._place_unhooked(target, value)
+                else:
+                    cast_bearing.place(target, value)
+            except (NullNameError, TypeError, ValueError):
+                pass
+            else:
+                return
+
+        raise NullNameError(repr(self))
+
+    def place_copy(self, target: Any, value: Any) -> Any:
+        """
+        Returns a copy of ``target`` with ``value`` placed by the first class in
+        ``Fallback.BEARING_CLASSES`` that can, following the same rules as
+        :func:`Fallback.place`.
+        """
+        if _type_hooks(target)[1] is not None:
+            return super().place_copy(target, value)
+
+        for cast_bearing in self._cast_bearings():
+            try:
+                return cast_bearing.place_copy(target, value)
+            except (NullNameError, TypeError, ValueError, AttributeError):
+                pass
+
+        raise NullNameError(repr(self))
+
+    def _cast_bearings(self) -> Tuple[BearingAbstract, ...]:
+        """
+        This bearing cast to each of ``BEARING_CLASSES`` that accepts its name, made
+        once. Rebuilt if ``BEARING_CLASSES`` is replaced, as :func:`bearing` does.
         """
+        if self._casts_source is self.BEARING_CLASSES:
+            return self._casts
+
+        casts = list()
         for bearing_type in self.BEARING_CLASSES:
             try:
-                cast_bearing = bearing_type(self)
+                casts.append(bearing_type(self))
             except TypeError:
                 continue
 
+        self._casts = tuple(casts)
+        self._casts_source = self.BEARING_CLASSES
+        return self._casts
+
+
+class AdaptiveFallback(Fallback):
+    def __init__(self, name: Any, factory: Optional[Type[FactoryType]] = None):
+        """
+        :class:`Fallback` that tries the bearing classes which have succeeded most
+        often first.
+
+        :param name: name of bearing.
+        :param factory: As :class:`BearingAbstract`.
+
+        **inherits from:** :class:`Fallback`
+
+        Each instance counts which of its ``BEARING_CLASSES`` fetched or placed data
+        successfully, and moves a class ahead of the ones before it as soon as it has
+        won more often than they have. For attribute-heavy structures, :class:`Attr`
+        quickly becomes the first attempt instead of the last.
+
+        Since a :class:`Course` holds its bearing objects, statistics are kept per
+        course position, and accumulate over every structure the course is used on.
+
+        Ties keep the ``BEARING_CLASSES`` order, so before any data is seen this
+        bearing behaves exactly like :class:`Fallback`. Reordering builds a new order
+        under a lock rather than changing the one in use, so threads sharing a course
+        never skip an attempt while another thread reorders them.
+
+        To have :class:`Course` objects cast names to adaptive bearings, put this class
+        in place of :class:`Fallback` in ``Course.BEARINGS``:
+
+        >>> from gemma import Course, Item, Call, Attr, AdaptiveFallback
+        >>>
+        >>> class AdaptiveCourse(Course):
+        ...     BEARINGS = [Item, Call, Attr, AdaptiveFallback]
+        ...
+        >>> AdaptiveCourse("a/b")[0]
+        <AdaptiveFallback: 'a'>
+        """
+        super().__init__(name, factory)
+        # cast bearings in the order they should be tried. Replaced, never changed, so
+        #   a fetch can keep iterating the order it started with.
+        self._attempts: Tuple[BearingAbstract, ...] = tuple()
+        # wins of each bearing class, changed under _ADAPTIVE_LOCK.
+        self._wins: Dict[Type[BearingAbstract], int] = dict()
+        self._attempts_source: Optional[Tuple[BearingAbstract, ...]] = None
+
+    @property
+    def stats(self) -> Dict[Type[BearingAbstract], int]:
+        """
+        Read-only property.
+
+        :return: number of successful fetches and places for each bearing class, in
+            the order classes are currently attempted.
+
+        >>> from gemma import AdaptiveFallback
+        >>> from gemma.test_objects import test_objects
+        >>>
+        >>> simple, data_dict, data_list, structured, target = test_objects()
+        >>> to_fetch = AdaptiveFallback("text")
+        >>> for _ in range(3):
+        ...     to_fetch.fetch(simple)
+        ...
+        'simple text'
+        'simple text'
+        'simple text'
+        >>> to_fetch.stats
+        {<class 'gemma._bearings.Attr'>: 3, <class 'gemma._bearings.Item'>: 0, ...}
+        """
+        attempts = self._load_attempts()
+        return {type(x): self._wins.get(type(x), 0) for x in attempts}
+
+    def reset_stats(self) -> None:
+        """
+        Clears win counts, restoring the ``BEARING_CLASSES`` order.
+        """
+        self._attempts_source = None
+
+    def fetch(self, target: Any) -> Any:
+        """
+        As :func:`Fallback.fetch`, but attempts classes in order of past success.
+        """
+        hook = _type_hooks(target)[0]
+        if hook is not None:
+            value = hook(target, self)
+            if value is not NotImplemented:
+                return value
+
+        for attempt in self._load_attempts():
             try:
-                cast_bearing.place(target, value)
+                if hook is None:
+                    value = attempt._fetch_unhooked(target)
+                else:
+                    value = attempt.fetch(target)
             except (NullNameError, TypeError, ValueError):
-                pass
-            else:
-                return
+                continue
+
+            self._record_win(type(attempt))
+            return value
+
+        raise NullNameError(repr(self))
+
+    def place(self, target: Any, value: Any, **kwargs: dict) -> None:
+        """
+        As :func:`Fallback.place`, but attempts classes in order of past success.
+        """
+        hook = _type_hooks(target)[1]
+        if hook is not None and hook(target, self, value) is not NotImplemented:
+            return
+
+        for attempt in self._load_attempts():
+            try:
+                if hook is None:
+                    attempt._place_unhooked(target, value)
+                else:
+                    attempt.place(target, value)
+            except (NullNameError, TypeError, ValueError):
+                continue
+
+            self._record_win(type(attempt))
+            return
 
         raise NullNameError(repr(self))
 
+    def _load_attempts(self) -> Tuple[BearingAbstract, ...]:
+        """
+        Bearings cast by :func:`Fallback._cast_bearings`, in the order they are
+        attempted. Rebuilt, with no wins, if the casts are.
+        """
+        casts = self._cast_bearings()
+        if self._attempts_source is casts:
+            return self._attempts
+
+        with _ADAPTIVE_LOCK:
+            if self._attempts_source is not casts:
+                self._wins = dict()
+                self._attempts = casts
+                self._attempts_source = casts
+            return self._attempts
+
+    def _record_win(self, kind: Type[BearingAbstract]) -> None:
+        """counts a win and moves the class ahead of any it has out-won"""
+        with _ADAPTIVE_LOCK:
+            wins = self._wins
+            wins[kind] = wins.get(kind, 0) + 1
+
+            attempts = list(self._attempts)
+            index = next(i for i, x in enumerate(attempts) if type(x) is kind)
+            start = index
+            while index > 0 and wins[kind] > wins.get(type(attempts[index - 1]), 0):
+                index -= 1
+
+            if index != start:
+                attempts.insert(index, attempts.pop(start))
+                # the order is replaced whole, so fetches already iterating the old
+                #   one are not affected.
+                self._attempts = tuple(attempts)
+
+
+# guards the win counts and attempt orders of every AdaptiveFallback.
+_ADAPTIVE_LOCK = threading.Lock()
+
 
 def _order_bearing_classes(
     bearing_classes: Optional[List[Type[BearingAbstract]]] = None,
@@ -1053,7 +1684,11 @@ def bearing(
 
     # load fallback class with class types.
     if isinstance(new, Fallback):
-        classes_loaded = [x for x in classes_loaded if not issubclass(x, Fallback)]
+        classes_loaded = [
+            x
+            for x in classes_loaded
+            if not issubclass(x, Fallback) and x.FALLBACK_CANDIDATE
+        ]
         new.BEARING_CLASSES = classes_loaded
 
     return new
@@ -1065,4 +1700,5 @@ TYPE_SORT_ORDER: List[Union[Type[BearingAbstract], str]] = [
     Call,
     "other",
     Fallback,
+    AdaptiveFallback,
 ]
@@ -0,0 +1,282 @@
+import collections
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+)
+
+
+CACHE_SCOPES = ("persistent", "map")
+
+# clock TTLs are measured with, replaced in tests.
+_now = time.monotonic
+
+
+class CacheStats(NamedTuple):
+    """Lookups and evictions of a :class:`CleanerCache`, as ``CleanerCache.stats``."""
+
+    hits: int
+    """Lookups of keys that were held."""
+    misses: int
+    """Lookups of keys that were not held, or had expired."""
+    evictions: int
+    """Entries dropped for ``max_size`` or ``ttl``."""
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Read-only property.
+
+        :return: share of lookups that were hits, ``0.0`` if there were none.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CleanerCache(MutableMapping[Hashable, Any]):
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+        scope: str = "persistent",
+    ):
+        """
+        Mapping shared by the cleaning functions of a :class:`Cartographer`, as
+        ``Cartographer.cache``.
+
+        :param max_size: most entries held. Once full, setting a new key evicts the
+            least recently used entry. ``None`` for no limit.
+        :param ttl: seconds an entry is held after it is set. ``None`` for no limit.
+        :param scope:
+            - ``"persistent"``: entries are held across runs.
+            - ``"map"``: each run starts with no entries, and holds its own. See
+              :func:`CleanerCache.run`.
+        :raises ValueError: if ``max_size`` is less than 1, ``ttl`` is not positive,
+            or ``scope`` is unknown.
+
+        >>> from gemma import CleanerCache
+        >>>
+        >>> cache = CleanerCache(max_size=2)
+        >>> cache["a"], cache["b"] = 1, 2
+        >>> cache["a"]
+        1
+        >>> cache["c"] = 3
+        >>> list(cache)
+        ['a', 'c']
+        >>> cache.stats
+        CacheStats(hits=1, misses=0, evictions=1)
+
+        Getting a key, including through ``get`` and ``setdefault``, counts as a hit or
+        a miss and marks the entry as recently used; ``in`` does neither. Expired
+        entries are evicted when they are next looked up, and whenever the cache is
+        iterated or measured. Counters are kept for the life of the cache, through
+        ``clear``.
+
+        Access is guarded by a lock, so a cache can be shared by threads mapping with
+        the same cartographer. Pickled caches, like the one sent with a plan to the
+        workers of :func:`MappingPlan.map_parallel`, keep their entries and settings,
+        and start new counters.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        if scope not in CACHE_SCOPES:
+            raise ValueError(f"scope must be one of {CACHE_SCOPES}, not {repr(scope)}")
+
+        self.max_size: Optional[int] = max_size
+        self.ttl: Optional[float] = ttl
+        self.scope: str = scope
+
+        # key to (value, time it expires or None), least recently used first.
+        self._entries: "collections.OrderedDict[Hashable, Any]" = (
+            collections.OrderedDict()
+        )
+        # entries of the run each thread is in, for caches scoped to runs.
+        self._run: threading.local = threading.local()
+        self._lock: threading.RLock = threading.RLock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<CleanerCache: {len(self)} entries, max_size={self.max_size}, "
+            f"ttl={self.ttl}, scope={repr(self.scope)}>"
+        )
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self._lock:
+            entries = self._held()
+            try:
+                value, expires = entries[key]
+            except KeyError:
+                self._misses += 1
+                raise
+
+            if expires is not None and expires <= _now():
+                del entries[key]
+                self._evictions += 1
+                self._misses += 1
+                raise KeyError(key)
+
+            entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        expires = None if self.ttl is None else _now() + self.ttl
+
+        with self._lock:
+            entries = self._held()
+            entries[key] = (value, expires)
+            entries.move_to_end(key)
+
+            if self.max_size is not None:
+                while len(entries) > self.max_size:
+                    entries.popitem(last=False)
+                    self._evictions += 1
+
+    def __delitem__(self, key: Hashable) -> None:
+        with self._lock:
+            del self._held()[key]
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            try:
+                _, expires = self._held()[key]
+            except KeyError:
+                return False
+            return expires is None or expires > _now()
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            self.expire()
+            return iter(list(self._held()))
+
+    def __len__(self) -> int:
+        with self._lock:
+            self.expire()
+            return len(self._held())
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "scope": self.scope,
+            "entries": self._entries,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["max_size"], state["ttl"], state["scope"])  # type: ignore
+        self._entries.update(state["entries"])
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Read-only property.
+
+        :return: :class:`CacheStats` counted since the cache was created.
+        """
+        return CacheStats(self._hits, self._misses, self._evictions)
+
+    def run(self) -> "_CacheRun":
+        """
+        Starts a run of the cache, entered with ``with``, as :class:`Cartographer` and
+        :class:`MappingPlan` do for each of their runs.
+
+        :return: run, which can be entered again to continue it.
+
+        If the scope is ``"map"``, the run has entries of its own, which the thread
+        that entered it reads and writes until it exits. Nested runs, and runs in
+        other threads, do not see or clear each other's entries. Outside of any run,
+        the cache holds the entries of the last run to exit. If the scope is
+        ``"persistent"``, entering a run changes nothing.
+
+        >>> from gemma import CleanerCache
+        >>>
+        >>> cache = CleanerCache(scope="map")
+        >>> with cache.run():
+        ...     cache["a"] = 1
+        ...     with cache.run():
+        ...         "a" in cache
+        ...     cache["a"]
+        False
+        1
+        """
+        return _CacheRun(self if self.scope == "map" else None)
+
+    def clear(self) -> None:
+        """
+        drops every entry, of the calling thread's run if it is in one, without
+        counting them as evictions
+        """
+        with self._lock:
+            self._held().clear()
+
+    def expire(self) -> None:
+        """evicts every entry whose ``ttl`` has passed"""
+        if self.ttl is None:
+            return
+
+        with self._lock:
+            entries = self._held()
+            now = _now()
+            expired = [k for k, (_, t) in entries.items() if t <= now]
+            for key in expired:
+                del entries[key]
+            self._evictions += len(expired)
+
+    def _held(self) -> "collections.OrderedDict[Hashable, Any]":
+        """entries of the calling thread's run, or of the cache outside of runs"""
+        entries = getattr(self._run, "entries", None)
+        return self._entries if entries is None else entries
+
+
+class _CacheRun:
+    """
+    One run of a :class:`CleanerCache`, made by :func:`CleanerCache.run`. Runs of
+    caches that are not scoped to runs do nothing.
+    """
+
+    __slots__ = ("_cache", "_entries", "_outer")
+
+    def __init__(self, cache: Optional[CleanerCache]):
+        self._cache: Optional[CleanerCache] = cache
+        self._entries: "collections.OrderedDict[Hashable, Any]" = (
+            collections.OrderedDict()
+        )
+        # entries the thread was using before each time the run was entered.
+        self._outer: List[Any] = list()
+
+    def __enter__(self) -> None:
+        cache = self._cache
+        if cache is None:
+            return
+        self._outer.append(getattr(cache._run, "entries", None))
+        cache._run.entries = self._entries
+
+    def __exit__(self, *exc_info: Any) -> None:
+        cache = self._cache
+        if cache is None:
+            return
+        outer = self._outer.pop()
+        cache._run.entries = outer
+        if outer is None:
+            # the entries of the last run to exit stay readable outside of runs.
+            with cache._lock:
+                cache._entries = self._entries
+
+
+def _run_of(cache: Any) -> _CacheRun:
+    """run of ``cache``, which does nothing if it is not a :class:`CleanerCache`"""
+    if isinstance(cache, CleanerCache):
+        return cache.run()
+    return _CacheRun(None)
@@ -1,12 +1,40 @@
+import collections
+import copy
+import functools
 import itertools
+import os
+import pickle
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 
 from ._surveyor import Surveyor
 from ._course import Course
-from ._bearings import Fallback
+from ._bearings import BearingAbstract, Attr, Item, Fallback
+from ._chart import IndexedChart, _TrieNode
+from ._cache import CleanerCache, _run_of
+from ._cleaners import _NamedCleaner, _batch_of
 from ._exceptions import NullNameError, SuppressedErrors, NonNavigableError
 from ._flags import NO_DEFAULT
 
-from typing import Any, Callable, Optional, Iterable, List, Union, Tuple, Type
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Optional,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Union,
+    Tuple,
+    Type,
+    Sequence,
+)
 from dataclasses import dataclass, field, InitVar
 
 
@@ -16,18 +44,31 @@ class Coordinate:
     """Origin course(s)"""
     dst: Optional[Union[Course, Tuple[Course, ...]]] = None
     """Destination course(s)"""
-    clean_org: Optional[Callable] = None
-    """Callable to clean origin course(s) path."""
-    clean_dst: Optional[Callable] = None
-    """Callable to clean destination course(s) path."""
-    clean_value: Optional[Callable] = None
-    """Callable to clean value(s) before they are set."""
+    clean_org: Optional[Union[Callable, str]] = None
+    """
+    Callable to clean origin course(s) path, or the name it was registered as with
+    :func:`register_cleaner`.
+    """
+    clean_dst: Optional[Union[Callable, str]] = None
+    """
+    Callable to clean destination course(s) path, or the name it was registered as
+    with :func:`register_cleaner`.
+    """
+    clean_value: Optional[Union[Callable, str]] = None
+    """
+    Callable to clean value(s) before they are set, or the name it was registered as
+    with :func:`register_cleaner`.
+    """
     default: Union[Any, Tuple[Any, ...]] = NO_DEFAULT
     """
     Default value. If Coordinate.NO_DEFAULT, NullNameError will be thrown. Can use
     Coordinate.NO_DEFAULT or Tuple of source defaults.
     """
-    clean: "CleanData" = field(init=False)
+    clean: "CleanData" = field(init=False, repr=False, compare=False)
+    """
+    State of one mapping run. Only set on the copy of a coordinate made for each run,
+    which is the one passed to cleaning functions. See :func:`Cartographer.map`.
+    """
 
     def __post_init__(self) -> None:
         self._validate_default_length()
@@ -86,22 +127,86 @@ Coord: Type[Coordinate] = Coordinate
 CleanerArgsType = List[Union[Optional[Course], Course, Coordinate]]
 
 
+class FetchStats(NamedTuple):
+    """
+    Origin prefix lookups of a :func:`Cartographer.map` run, as read from
+    ``Cartographer.fetch_stats``.
+    """
+
+    hits: int
+    """Prefixes whose node was already fetched by an earlier coordinate."""
+    misses: int
+    """Prefixes fetched from the origin."""
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Read-only property.
+
+        :return: share of prefix lookups that were hits, ``0.0`` if there were none.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+_NO_FETCHES = FetchStats(0, 0)
+
+
 class Cartographer:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache_size: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        cache_scope: str = "persistent",
+    ) -> None:
         """
         Maps data from one object to another.
 
+        :param cache_size: ``max_size`` of ``Cartographer.cache``.
+        :param cache_ttl: ``ttl`` of ``Cartographer.cache``, in seconds.
+        :param cache_scope: ``scope`` of ``Cartographer.cache``:
+            ``"persistent"`` to keep entries across runs, or ``"map"`` to give each run
+            entries of its own.
+        :raises ValueError: As :class:`CleanerCache`.
+
         Attributes:
-          - **cache (** ``dict`` **):** dict for storing information
-            during :func:`Cartographer.map`. The cache is cleared each time
-            :func:`Cartographer.map` is run, and is available to :class:`Coordinate`
+          - **cache (** :class:`CleanerCache` **):** mapping for storing information
+            during :func:`Cartographer.map`, available to :class:`Coordinate`
             cleaning functions and overridden :class:`Cartographer` cleaning functions.
+            By default it is unbounded and never cleared; see :class:`CleanerCache`
+            for eviction, and :func:`memoize_cleaner` for memoizing cleaners in it.
+
+          - **fetch_stats (** :class:`FetchStats` **):** read-only, origin prefix
+            lookups of the most recent :func:`Cartographer.map` run made by the
+            calling thread.
 
         Primary interaction is through :func:`Cartographer.map`, which iterates over a
         ``list`` of :class:`Coordinate` objects, fetching data from ``origin_root`` and
         placing on ``dst_root``.
         """
-        self.cache: dict = dict()
+        self.cache: MutableMapping = CleanerCache(cache_size, cache_ttl, cache_scope)
+        # stats are set by each run for its own thread, so concurrent runs do not
+        #   overwrite each other.
+        self._run_stats: threading.local = threading.local()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_run_stats"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._run_stats = threading.local()
+
+    @property
+    def fetch_stats(self) -> FetchStats:
+        """
+        Read-only property.
+
+        :return: :class:`FetchStats` of the most recent :func:`Cartographer.map` run
+            made by the calling thread, all ``0`` if it did not set ``memoize``.
+        """
+        return getattr(self._run_stats, "fetch_stats", _NO_FETCHES)
 
     def clean_org(self, course: Course, coordinate: Coordinate) -> Course:
         """
@@ -160,6 +265,7 @@ class Cartographer:
         coordinates: Optional[Iterable[Coordinate]] = None,
         surveyor: Optional[Surveyor] = None,
         exceptions: bool = True,
+        memoize: bool = False,
     ) -> None:
         """
         Map data from one object to another.
@@ -172,6 +278,8 @@ class Cartographer:
         :param exceptions:
             - ``True``: raise :class:`NullNameError` and :class:`NonNavigableError`
             - ``False``: suppress until end, then raise :class:`SuppressedErrors`
+        :param memoize: fetch each origin course prefix, and each destination parent,
+            once per run. Off by default. See below.
 
         :raises NullNameError: when Course cannot be found
         :raises NonNavigableError: If surveyor cannot chart object.
@@ -180,27 +288,66 @@ class Cartographer:
 
         :return: ``None`` Data is applied in-place.
 
+        ``coordinates`` are not changed by mapping. Each run works on copies of them,
+        which are the coordinates passed to cleaning functions, so the same
+        coordinates can be mapped by several threads, or nested runs, at once.
+        ``Cartographer.cache`` is shared by every run of a cartographer, unless its
+        scope is ``"map"``, in which case each run has entries of its own.
+
+        With ``memoize`` set, the node reached by each prefix of an origin course is
+        kept for the rest of the run, so coordinates reading sibling fields, like
+        ``customer/address/street`` and ``customer/address/city``, fetch
+        ``customer/address`` once. Prefixes are shared by bearings of the same type
+        and name. Only :class:`Item`, :class:`Attr` and :class:`Fallback` bearings are
+        kept; the rest of a course from any other bearing is fetched every time.
+        Origin prefixes are not kept when ``origin_root`` is ``dst_root``, since
+        placing values can replace the nodes they reached. Hits and misses of the run
+        are set as ``Cartographer.fetch_stats`` for the calling thread, and reset to
+        ``0`` by runs without ``memoize``.
+
+        Destination parents are kept the same way, so placing sibling fields, like
+        ``shipping/address/street`` and ``shipping/address/city``, resolves
+        ``shipping/address``, creating it from bearing factories if needed, once.
+        Kept parents below a node are dropped whenever a value or factory-created
+        node is placed on it. Only set ``memoize`` if cleaning functions leave the
+        origin and destination alone while they are being mapped.
+
         See documentation for further details and examples.
         """
 
         if coordinates is None:
             coordinates = tuple()
 
-        # We need to make empty clean data here in case these coords are being re-used.
-        for coord in coordinates:
-            object.__setattr__(coord, "clean", CleanData(coord))
+        # Each run works on its own copies of the coordinates, so the same coordinates
+        #   can be mapped by many runs at once.
+        runs = [_run_coordinate(x) for x in coordinates]
 
-        # Map the explicitly passed coordinates.
-        mapped_courses, error_list = _map_coordinates(
-            self, origin_root, dst_root, coordinates, exceptions
-        )
+        # Mapping in-place can replace origin nodes, so their prefixes are not kept.
+        in_place = origin_root is dst_root
+        memo = _PrefixMemo(origin_root) if memoize and not in_place else None
+        parents = _ParentMemo(dst_root) if memoize else None
 
-        # Auto-map remaining coordinates if applicable.
-        if surveyor is not None:
-            survey_errors = _chart_survey(
-                self, origin_root, dst_root, surveyor, exceptions, mapped_courses
+        # Cleaners are passed the cache of this run, if it has one.
+        with _run_of(self.cache):
+            # Map the explicitly passed coordinates.
+            mapped_courses, error_list = _map_coordinates(
+                self, origin_root, dst_root, runs, exceptions, memo, parents
             )
-            error_list.extend(survey_errors)
+
+            # Auto-map remaining coordinates if applicable.
+            if surveyor is not None:
+                # Index of mapped courses is only built when there is a survey to skip.
+                coverage = _CoverageIndex()
+                for course in mapped_courses:
+                    coverage.add(course)
+                survey_errors = _chart_survey(
+                    self, origin_root, dst_root, surveyor, exceptions, coverage
+                )
+                error_list.extend(survey_errors)
+
+        self._run_stats.fetch_stats = (
+            _NO_FETCHES if memo is None else FetchStats(memo.hits, memo.misses)
+        )
 
         # Raise any suppressed errors.
         if error_list:
@@ -208,17 +355,916 @@ class Cartographer:
             to_raise.errors = error_list
             raise to_raise
 
+    def map_columns(
+        self,
+        origin_columns: Mapping[str, Sequence],
+        dst_columns: MutableMapping[str, Any],
+        coordinates: Iterable[Coordinate],
+        exceptions: bool = True,
+    ) -> None:
+        """
+        Map columnar data, like the :class:`Columns` returned by
+        :func:`Surveyor.to_columns`, or a ``dict`` of lists or NumPy arrays, one
+        column at a time.
+
+        :param origin_columns: mapping of column names to columns data is pulled from.
+        :param dst_columns: mutable mapping columns are written to.
+        :param coordinates: coordinates instructing how to transfer each column.
+        :param exceptions:
+            - ``True``: raise :class:`NullNameError`
+            - ``False``: suppress until end, then raise :class:`SuppressedErrors`
+
+        :raises NullNameError: when an origin column cannot be found, and the
+            coordinate has no default.
+        :raises SuppressedErrors: At end if errors occur and ``exceptions`` is set
+            to ``False``
+
+        :return: ``None`` Columns are written in-place.
+
+        >>> from gemma import Cartographer, Coordinate, PORT
+        >>>
+        >>> origin = {"[price]": [1.0, 2.5], "[qty]": [2, 4]}
+        >>> dst = dict()
+        >>>
+        >>> coords = [
+        ...     Coordinate(
+        ...         org=(PORT / "price", PORT / "qty"),
+        ...         dst=PORT / "total",
+        ...         clean_value=lambda c, coord, cache: [p * q for p, q in zip(*c)]
+        ...     )
+        ... ]
+        >>> Cartographer().map_columns(origin, dst, coords)
+        >>> dst
+        {'total': [2.0, 10.0]}
+
+        Each origin course selects the column keyed by ``str(course)``. If there is
+        no such key, the column keys are cast to courses, once per call, and the
+        column whose course equals the origin course is selected. So ``PORT / "price"``
+        finds a ``"price"`` column as well as the ``"[price]"`` column
+        :func:`Surveyor.to_columns` would name it. A missing column with a default is
+        replaced by a list of the default, one per row.
+
+        Cleaners are called once per coordinate: ``clean_value`` receives the whole
+        column, or a tuple of columns for multiple origins, and returns the column, or
+        tuple of columns, to write. With NumPy arrays, this is where the work of a
+        whole column can be done in one vectorized operation.
+
+        Each destination course writes its column to ``dst_columns[str(course)]``.
+        Destinations left as ``None`` are cleaned by :func:`Cartographer.clean_dst`,
+        as in :func:`Cartographer.map`.
+
+        Surveyor auto-mapping is not available in columnar mode.
+        """
+        runs = [_run_coordinate(x) for x in coordinates]
+
+        origin_index = _ColumnIndex(origin_columns)
+        error_list: List[Union[NullNameError, NonNavigableError]] = list()
+
+        with _run_of(self.cache):
+            for coord in runs:
+                try:
+                    _map_column_coordinate(self, origin_index, dst_columns, coord)
+                except NullNameError as error:
+                    if exceptions:
+                        raise error
+                    error_list.append(error)
+
+        if error_list:
+            to_raise = SuppressedErrors("Some errors occurred while mapping")
+            to_raise.errors = error_list
+            raise to_raise
+
+    def compile(self, coordinates: Iterable[Coordinate]) -> "MappingPlan":
+        """
+        Resolves cleaners, cleaned courses and defaults of ``coordinates`` once, for
+        mapping many records the same way.
+
+        :param coordinates: coordinates instructing how to transfer each piece of data.
+        :return: :class:`MappingPlan`.
+
+        >>> from gemma import Cartographer, Coordinate, PORT
+        >>>
+        >>> plan = Cartographer().compile([Coordinate(PORT / "a", PORT / "b")])
+        >>> list(plan.map_many([{"a": 1}, {"a": 2}], dict))
+        [{'b': 1}, {'b': 2}]
+
+        The course cleaners, :func:`Cartographer.clean_org` and
+        :func:`Cartographer.clean_dst` or their :class:`Coordinate` replacements, are
+        called here, once per course, rather than each time a record is mapped.
+        ``clean_value`` is still called for every record, unless neither the
+        coordinate nor the cartographer replaces it, in which case it is skipped.
+        """
+        steps: List[_PlanStep] = list()
+
+        for original in coordinates:
+            coord = _run_coordinate(original)
+            clean = coord.clean
+
+            cleaner, cleaner_args = _get_cleaner(
+                self.clean_org, coord, coord.clean_org, self.cache
+            )
+            _clean_courses(clean.org_list, cleaner, cleaner_args)
+
+            cleaner, cleaner_args = _get_cleaner(
+                self.clean_dst, coord, coord.clean_dst, self.cache
+            )
+            _clean_courses(clean.dst_list, cleaner, cleaner_args)
+
+            value_cleaner: Optional[Callable] = None
+            value_args: Tuple[Any, ...] = tuple()
+            if (
+                coord.clean_value is not None
+                or type(self).clean_value is not Cartographer.clean_value
+            ):
+                value_cleaner, args = _get_cleaner(
+                    self.clean_value, coord, coord.clean_value, self.cache
+                )
+                value_args = tuple(args)
+
+            steps.append(
+                _PlanStep(
+                    coordinate=original,
+                    orgs=tuple(zip(clean.org_list, clean.default_list)),
+                    dsts=tuple(clean.dst_list),
+                    value_cleaner=value_cleaner,
+                    value_args=value_args,
+                )
+            )
+
+        return MappingPlan(tuple(steps), self.cache)
+
+    def map_chunked(
+        self,
+        origins: Iterable[Any],
+        dst_factory: Callable[[], Any],
+        coordinates: Iterable[Coordinate],
+        chunk_size: int = 1000,
+        exceptions: bool = True,
+    ) -> Generator[Any, None, None]:
+        """
+        Compiles ``coordinates``, and maps ``origins`` with
+        :func:`MappingPlan.map_chunked`, calling :func:`batch_cleaner` value cleaners
+        once per coordinate per chunk.
+
+        :param origins: iterable of records to map.
+        :param dst_factory: called with no arguments to create the destination of each
+            record, like ``dict``.
+        :param coordinates: coordinates instructing how to transfer each piece of data.
+        :param chunk_size: number of records mapped together.
+        :param exceptions: As :func:`Cartographer.map`.
+
+        :return: yields each destination, once its chunk is mapped.
+        """
+        plan = self.compile(coordinates)
+        return plan.map_chunked(origins, dst_factory, chunk_size, exceptions)
+
+
+class _PlanStep(NamedTuple):
+    """A coordinate with everything resolved that does not depend on the record"""
+
+    coordinate: Coordinate
+    # cleaned origin courses and their defaults.
+    orgs: Tuple[Tuple[Course, Any], ...]
+    # cleaned destination courses.
+    dsts: Tuple[Optional[Course], ...]
+    # None when the value is passed through unchanged.
+    value_cleaner: Optional[Callable]
+    # arguments passed to value_cleaner after the value.
+    value_args: Tuple[Any, ...]
+
+    def fetch(self, origin_root: Any) -> Any:
+        """value or values of the origin courses"""
+        if len(self.orgs) == 1:
+            org, default = self.orgs[0]
+            return org.fetch(origin_root, default=default)
+        return tuple(x.fetch(origin_root, default=default) for x, default in self.orgs)
+
+    def place(self, dst_root: Any, value: Any) -> None:
+        """places a cleaned value or values at the destination courses"""
+        if len(self.dsts) <= 1:
+            value = (value,)
+
+        for this_value, this_dst in zip(value, self.dsts):
+            if this_dst is not None:
+                this_dst.place(dst_root, this_value)
+
+
+class MappingPlan:
+    def __init__(self, steps: Tuple[_PlanStep, ...], cache: Any = None):
+        """
+        Coordinates resolved by :func:`Cartographer.compile`, ready to be applied to
+        any number of records.
+
+        :param steps: resolved coordinates.
+        :param cache: ``Cartographer.cache`` of the compiling cartographer, which the
+            plan's cleaners are passed.
+
+        Plans are not changed by mapping, and are not created directly. If the cache
+        is scoped to runs, each call to :func:`MappingPlan.map`,
+        :func:`MappingPlan.map_many` and :func:`MappingPlan.map_chunked`, and each
+        chunk mapped by a worker of :func:`MappingPlan.map_parallel`, starts with no
+        entries and holds its own.
+        """
+        self._steps: Tuple[_PlanStep, ...] = steps
+        self._cache: Any = cache
+
+    def __repr__(self) -> str:
+        return f"<MappingPlan: {len(self._steps)} coordinates>"
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    @property
+    def coordinates(self) -> Tuple[Coordinate, ...]:
+        """
+        Read-only property.
+
+        :return: coordinates the plan was compiled from.
+        """
+        return tuple(x.coordinate for x in self._steps)
+
+    def map(self, origin_root: Any, dst_root: Any, exceptions: bool = True) -> None:
+        """
+        Maps one record, as :func:`Cartographer.map` with the compiled coordinates.
+
+        :param origin_root: root source data is pulled from
+        :param dst_root: Mutable root destination data is applied to
+        :param exceptions: As :func:`Cartographer.map`.
+
+        :raises NullNameError: when Course cannot be found
+        :raises SuppressedErrors: At end if errors occur and ``exceptions`` is set
+            to ``False``
+
+        :return: ``None`` Data is applied in-place.
+        """
+        with _run_of(self._cache):
+            error_list = self._map(origin_root, dst_root, exceptions)
+        if error_list:
+            to_raise = SuppressedErrors("Some errors occurred while mapping")
+            to_raise.errors = error_list
+            raise to_raise
+
+    def map_many(
+        self,
+        origins: Iterable[Any],
+        dst_factory: Callable[[], Any],
+        exceptions: bool = True,
+    ) -> Generator[Any, None, None]:
+        """
+        Maps each record of ``origins`` to a new destination.
+
+        :param origins: iterable of records to map.
+        :param dst_factory: called with no arguments to create the destination of each
+            record, like ``dict``.
+        :param exceptions: As :func:`Cartographer.map`.
+
+        :return: yields each destination, once its record is mapped.
+
+        :raises NullNameError: when Course cannot be found
+        :raises SuppressedErrors: After the last destination is yielded, if errors
+            occur and ``exceptions`` is set to ``False``. Destinations are yielded
+            as complete as possible.
+        """
+        run = _run_of(self._cache)
+        error_list: List[Union[NullNameError, NonNavigableError]] = list()
+
+        for origin_root in origins:
+            dst_root = dst_factory()
+            # the run is left while destinations are yielded, so runs of other plans,
+            #   or of this one, can be interleaved with it.
+            with run:
+                error_list.extend(self._map(origin_root, dst_root, exceptions))
+            yield dst_root
+
+        if error_list:
+            to_raise = SuppressedErrors("Some errors occurred while mapping")
+            to_raise.errors = error_list
+            raise to_raise
+
+    def map_chunked(
+        self,
+        origins: Iterable[Any],
+        dst_factory: Callable[[], Any],
+        chunk_size: int = 1000,
+        exceptions: bool = True,
+    ) -> Generator[Any, None, None]:
+        """
+        As :func:`MappingPlan.map_many`, but maps records a chunk at a time, so
+        :func:`batch_cleaner` value cleaners clean each coordinate's values for the
+        whole chunk in one call.
+
+        :param origins: iterable of records to map. Records are read a chunk at a time.
+        :param dst_factory: called with no arguments to create the destination of each
+            record, like ``dict``.
+        :param chunk_size: number of records mapped together.
+        :param exceptions: As :func:`Cartographer.map`.
+
+        :return: yields each destination, once its chunk is mapped.
+
+        :raises NullNameError: when Course cannot be found
+        :raises SuppressedErrors: After the last destination is yielded, if errors
+            occur and ``exceptions`` is set to ``False``.
+        :raises ValueError: if ``chunk_size`` is less than 1, or a batch cleaner
+            returns a different number of values than it was given.
+
+        Each coordinate is mapped for every record of a chunk before the next, so
+        destinations end up as :func:`MappingPlan.map_many` leaves them, but cleaners
+        are called coordinate by coordinate rather than record by record. Records
+        whose origin cannot be fetched are left out of the batch. Other cleaners are
+        called once per value, as usual.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        run = _run_of(self._cache)
+        records = iter(origins)
+        error_list: List[Union[NullNameError, NonNavigableError]] = list()
+
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if not chunk:
+                break
+            destinations = [dst_factory() for _ in chunk]
+            with run:
+                error_list.extend(self._map_chunk(chunk, destinations, exceptions))
+            yield from destinations
+
+        if error_list:
+            to_raise = SuppressedErrors("Some errors occurred while mapping")
+            to_raise.errors = error_list
+            raise to_raise
+
+    def map_parallel(
+        self,
+        origins: Iterable[Any],
+        dst_factory: Callable[[], Any],
+        workers: Optional[int] = None,
+        chunk_size: int = 1000,
+        ordered: bool = True,
+        exceptions: bool = True,
+    ) -> Generator[Any, None, None]:
+        """
+        As :func:`MappingPlan.map_many`, but maps chunks of records in a pool of worker
+        processes.
+
+        :param origins: iterable of records to map. Records are read as they are
+            needed, so this can be a stream larger than memory.
+        :param dst_factory: called with no arguments to create the destination of each
+            record, like ``dict``.
+        :param workers: number of worker processes. Defaults to ``os.cpu_count()``.
+        :param chunk_size: number of records sent to a worker at a time.
+        :param ordered: yield destinations in the order of ``origins``. If ``False``,
+            each chunk is yielded as soon as it is mapped.
+        :param exceptions: As :func:`Cartographer.map`.
+
+        :return: yields each destination.
+
+        :raises ValueError: if ``chunk_size`` is less than 1.
+        :raises NullNameError: when Course cannot be found. Chunks already mapped by
+            other workers are discarded.
+        :raises SuppressedErrors: After the last destination is yielded, if errors
+            occur and ``exceptions`` is set to ``False``. ``SuppressedErrors.errors``
+            holds the errors of every chunk, in the order the chunks were yielded.
+
+        The plan is pickled once, and sent to each worker when it starts. Records,
+        ``dst_factory``, every cleaner of the plan, and the destinations must all be
+        picklable, so cleaners must be defined at module level rather than as
+        lambdas. Cleaners run in the workers, so changes they make to
+        ``Cartographer.cache`` are not seen by the calling process.
+
+        At most two chunks per worker are waiting to be mapped or yielded at a time.
+        Workers map each chunk as :func:`MappingPlan.map_chunked` does, so batch
+        cleaners are called once per chunk.
+
+        To keep worker processes from re-running a script, call this method from
+        inside an ``if __name__ == "__main__":`` block.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        error_list: List[Union[NullNameError, NonNavigableError]] = list()
+
+        with self._parallel_executor(workers) as executor:
+            chunks = _iter_parallel_chunks(
+                executor,
+                iter(origins),
+                dst_factory,
+                workers * 2,
+                chunk_size,
+                ordered,
+                exceptions,
+            )
+            try:
+                for destinations, errors in chunks:
+                    error_list.extend(errors)
+                    yield from destinations
+            finally:
+                # cancels waiting chunks before the executor waits on them.
+                chunks.close()
+
+        if error_list:
+            to_raise = SuppressedErrors("Some errors occurred while mapping")
+            to_raise.errors = error_list
+            raise to_raise
+
+    def _parallel_executor(self, workers: int) -> ProcessPoolExecutor:
+        """pool of ``workers`` processes, each loading a pickled copy of the plan"""
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_plan_worker,
+            initargs=(pickle.dumps(self),),
+        )
+
+    def to_source(self, name: str = "map_record") -> str:
+        """
+        Writes the plan as the source of a Python module, defining a function that maps
+        one record with straight-line subscripts and attribute access.
+
+        :param name: name of the generated function.
+        :return: module source. The function has the signature ``name(origin, dst)``.
+        :raises ValueError: if a course, default or value cleaner cannot be written as
+            source: bearing names, ``Call`` arguments and defaults must be literals,
+            factories builtin types, and value cleaners registered with
+            :func:`register_cleaner`.
+
+        >>> from gemma import Cartographer, Coordinate, PORT
+        >>>
+        >>> plan = Cartographer().compile([Coordinate(PORT / "a" / "b", PORT / "c")])
+        >>> namespace = dict()
+        >>> exec(plan.to_source(), namespace)
+        >>> destination = dict()
+        >>> namespace["map_record"]({"a": {"b": 1}}, destination)
+        >>> destination
+        {'c': 1}
+
+        The source can be written to a module and imported without gemma doing any
+        work at import time besides creating courses. Registered cleaners are looked
+        up when the module is imported.
+
+        :class:`Item` bearings, and :class:`Fallback` bearings that try :class:`Item`
+        first, become subscripts, and :class:`Attr` bearings attribute access. If an
+        inlined fetch or placement raises, the course does it over, so values, errors
+        and defaults are those of :func:`Cartographer.map` with ``exceptions=True``.
+        Inlined steps do not check for ``__gemma_fetch__`` or ``__gemma_place__``
+        hooks (see :ref:`protocol-hooks`) on objects that support subscripts or
+        attributes natively.
+
+        Cleaners are passed a :class:`Coordinate` of the plan's cleaned courses, and a
+        cache shared by the module. If the plan's cache is a :class:`CleanerCache`,
+        the module's cache is a new one with the same settings, and each call is a
+        run of it.
+        """
+        from ._codegen import _plan_source
+
+        return _plan_source(self._steps, name)
+
+    def to_function(self, name: str = "map_record") -> Callable[[Any, Any], None]:
+        """
+        Execs the source of :func:`MappingPlan.to_source`.
+
+        :param name: name of the generated function.
+        :return: function with the signature ``name(origin, dst)``.
+        :raises ValueError: As :func:`MappingPlan.to_source`.
+        """
+        from ._codegen import _plan_function
+
+        return _plan_function(self._steps, name)
+
+    def _map(
+        self, origin_root: Any, dst_root: Any, exceptions: bool
+    ) -> List[Union[NullNameError, NonNavigableError]]:
+        error_list: List[Union[NullNameError, NonNavigableError]] = list()
+
+        # steps are inlined here rather than calling _PlanStep.fetch and
+        #   _PlanStep.place, as this runs for every step of every record.
+        for step in self._steps:
+            try:
+                if len(step.orgs) == 1:
+                    org, default = step.orgs[0]
+                    value = org.fetch(origin_root, default=default)
+                else:
+                    value = tuple(
+                        org.fetch(origin_root, default=default)
+                        for org, default in step.orgs
+                    )
+
+                if step.value_cleaner is not None:
+                    value = step.value_cleaner(value, *step.value_args)
+
+                if len(step.dsts) <= 1:
+                    value = (value,)
+
+                for this_value, this_dst in zip(value, step.dsts):
+                    if this_dst is not None:
+                        this_dst.place(dst_root, this_value)
+            except NullNameError as error:
+                if exceptions:
+                    raise error
+                error_list.append(error)
+
+        return error_list
+
+    def _map_chunk(
+        self, origins: List[Any], destinations: List[Any], exceptions: bool
+    ) -> List[Union[NullNameError, NonNavigableError]]:
+        """maps each coordinate for every record of a chunk before the next"""
+        error_list: List[Union[NullNameError, NonNavigableError]] = list()
+
+        def suppress(error: NullNameError) -> None:
+            if exceptions:
+                raise error
+            error_list.append(error)
+
+        for step in self._steps:
+            rows, values = self._fetch_chunk(step, origins, suppress)
+            if values:
+                values = self._clean_chunk(step, values)
+            self._place_chunk(step, destinations, rows, values, suppress)
+
+        return error_list
+
+    @staticmethod
+    def _fetch_chunk(
+        step: _PlanStep, origins: List[Any], suppress: Callable[[NullNameError], None]
+    ) -> Tuple[List[int], List[Any]]:
+        """rows of the chunk whose values were fetched, and their values"""
+        rows: List[int] = list()
+        values: List[Any] = list()
+
+        # the common single origin is fetched without _PlanStep.fetch.
+        if len(step.orgs) == 1:
+            org, default = step.orgs[0]
+            fetch: Callable[[Any], Any] = functools.partial(org.fetch, default=default)
+        else:
+            fetch = step.fetch
+
+        for row, origin_root in enumerate(origins):
+            try:
+                values.append(fetch(origin_root))
+            except NullNameError as error:
+                suppress(error)
+            else:
+                rows.append(row)
+
+        return rows, values
+
+    @staticmethod
+    def _clean_chunk(step: _PlanStep, values: List[Any]) -> List[Any]:
+        """values cleaned by the step's value cleaner, as one batch if it takes one"""
+        cleaner = step.value_cleaner
+        if cleaner is None:
+            return values
+
+        batch = _batch_of(cleaner)
+        if batch is not None:
+            return batch.batch(values, *step.value_args)
+        args = step.value_args
+        return [cleaner(x, *args) for x in values]
+
+    @staticmethod
+    def _place_chunk(
+        step: _PlanStep,
+        destinations: List[Any],
+        rows: List[int],
+        values: List[Any],
+        suppress: Callable[[NullNameError], None],
+    ) -> None:
+        """places each value on the destination of its row"""
+        if len(step.dsts) == 1:
+            dst = step.dsts[0]
+            if dst is None:
+                return
+            place: Callable[[Any, Any], None] = dst.place
+        else:
+            place = step.place
+
+        for row, value in zip(rows, values):
+            try:
+                place(destinations[row], value)
+            except NullNameError as error:
+                suppress(error)
+
+
+# plan of a worker process started by MappingPlan.map_parallel
+_WORKER_PLAN: Optional[MappingPlan] = None
+
+
+def _init_plan_worker(pickled_plan: bytes) -> None:
+    """loads the plan a worker process maps with, once per process"""
+    global _WORKER_PLAN
+    _WORKER_PLAN = pickle.loads(pickled_plan)
+
+
+def _map_plan_chunk(
+    chunk: List[Any], dst_factory: Callable[[], Any], exceptions: bool
+) -> Tuple[List[Any], List[Union[NullNameError, NonNavigableError]]]:
+    """maps a chunk of records in a worker process"""
+    if _WORKER_PLAN is None:
+        raise RuntimeError("worker process has no mapping plan")
+
+    destinations = [dst_factory() for _ in chunk]
+    with _run_of(_WORKER_PLAN._cache):
+        error_list = _WORKER_PLAN._map_chunk(chunk, destinations, exceptions)
+    return destinations, error_list
+
+
+def _iter_parallel_chunks(
+    executor: ProcessPoolExecutor,
+    records: Iterator[Any],
+    dst_factory: Callable[[], Any],
+    limit: int,
+    chunk_size: int,
+    ordered: bool,
+    exceptions: bool,
+) -> Generator[
+    Tuple[List[Any], List[Union[NullNameError, NonNavigableError]]], None, None
+]:
+    """
+    Sends chunks of ``records`` to ``executor``, keeping at most ``limit`` waiting,
+    and yields the destinations and errors of each chunk once it is mapped.
+    """
+    pending: Deque[Future] = collections.deque()
+
+    def submit() -> bool:
+        chunk = list(itertools.islice(records, chunk_size))
+        if not chunk:
+            return False
+        pending.append(executor.submit(_map_plan_chunk, chunk, dst_factory, exceptions))
+        return True
+
+    try:
+        more = True
+        while more and len(pending) < limit:
+            more = submit()
+
+        while pending:
+            if ordered:
+                done = pending.popleft()
+            else:
+                wait(pending, return_when=FIRST_COMPLETED)
+                done = next(x for x in pending if x.done())
+                pending.remove(done)
+
+            result = done.result()
+            if more:
+                more = submit()
+
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
 
 # ##### HELPER FUNCTIONS #####
 # These functions help with the mapping operations, in order to Cartographer from
 #   getting cluttered
+class _CoverageIndex:
+    """
+    Prefix trie of mapped courses, answering whether a course is a parent or child of
+    anything mapped, in one step per bearing.
+    """
+
+    __slots__ = ("_root", "_everything")
+
+    def __init__(self) -> None:
+        self._root: _TrieNode = _TrieNode(None)
+        # an empty course was mapped, which covers every course.
+        self._everything: bool = False
+
+    def add(self, course: Course) -> None:
+        if len(course) == 0:
+            self._everything = True
+            return
+
+        node = self._root
+        for this_bearing in course:
+            node = node.add_child(this_bearing)
+        node.has_value = True
+
+    def covers(self, course: Course) -> bool:
+        """
+        Whether ``course`` equals, is a parent of, or is a child of a mapped course.
+        Bearings match as they do for course equality.
+        """
+        if self._everything:
+            return True
+
+        node = self._root
+        for this_bearing in course:
+            child = node.child(this_bearing)
+            if child is None:
+                return False
+            if child.has_value:
+                # a mapped course is a parent of, or equal to, course.
+                return True
+            node = child
+
+        # every bearing was found, so course leads to a mapped course.
+        return node is not self._root
+
+
+class _PrefixMemo:
+    """
+    Nodes of one origin, by the prefix of bearings that reached them, kept for one
+    mapping run. Stored as a trie of [node, children] entries keyed by
+    :func:`_memo_key`.
+    """
+
+    __slots__ = ("_root", "_keys", "hits", "misses")
+
+    def __init__(self, origin_root: Any):
+        self._root: List[Any] = [origin_root, dict()]
+        # id of course to (course, memo keys of its bearings). The course is held so
+        # its id is not reused during the run.
+        self._keys: Dict[int, Tuple[Course, Tuple[Hashable, ...]]] = dict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def fetch(self, course: Course, default: Any) -> Any:
+        """As ``course.fetch(origin_root, default=default)``"""
+        entry = self._root
+        bearings = course._bearings
+
+        for i, key in enumerate(self._course_keys(course)):
+            this_bearing = bearings[i]
+            if key is None:
+                # the rest of the course is fetched without the memo.
+                remaining = type(course)._from_bearings(bearings[i:])
+                return remaining.fetch(entry[0], default=default)
+
+            children: Dict[Hashable, List[Any]] = entry[1]
+            child = children.get(key)
+            if child is not None:
+                self.hits += 1
+                entry = child
+                continue
+
+            try:
+                node = this_bearing.fetch(entry[0])
+            except NullNameError as error:
+                if default is not NO_DEFAULT:
+                    return default
+                raise error
+
+            self.misses += 1
+            child = [node, dict()]
+            children[key] = child
+            entry = child
+
+        return entry[0]
+
+    def _course_keys(self, course: Course) -> Tuple[Hashable, ...]:
+        known = self._keys.get(id(course))
+        if known is not None:
+            return known[1]
+
+        keys = tuple(_memo_key(x) for x in course._bearings)
+        self._keys[id(course)] = (course, keys)
+        return keys
+
+
+class _ParentMemo:
+    """
+    Parent nodes of one destination, by the prefix of bearings that reached them, kept
+    for one mapping run. Stored as a trie of [node, children] entries keyed by
+    :func:`_memo_key` and bearing factory.
+
+    Entries are also listed by node, since bearings with different keys can reach the
+    same node. Placing on a node with a bearing drops the children of every entry
+    holding it that the bearing could have replaced: those with the same name as
+    text, or all of them for index names and bearings that are not memoized.
+    """
+
+    __slots__ = ("_root", "_holding")
+
+    def __init__(self, dst_root: Any):
+        self._root: List[Any] = [dst_root, dict()]
+        # id of node to entries holding it. Entries hold their node, so ids are not
+        # reused during the run.
+        self._holding: Dict[int, List[List[Any]]] = {id(dst_root): [self._root]}
+
+    def place(self, course: Course, value: Any) -> None:
+        """As ``course.place(dst_root, value)``"""
+        bearings = course._bearings
+        if not bearings:
+            course.place(self._root[0], value)
+            self._reset()
+            return
+
+        entry = self._root
+        for i in range(len(bearings) - 1):
+            this_bearing = bearings[i]
+            key = _memo_key(this_bearing)
+            if key is None:
+                # the rest of the course is placed without the memo, and may replace
+                # any node below this one.
+                remaining = type(course)._from_bearings(bearings[i:])
+                remaining.place(entry[0], value)
+                self._reset()
+                return
+
+            key = (key, this_bearing.factory_type)
+            child = entry[1].get(key)
+            if child is None:
+                child = self._resolve(entry, this_bearing, key)
+            entry = child
+
+        target = entry[0]
+        bearings[-1].place(target, value)
+        self._changed(target, bearings[-1])
+
+    def _resolve(
+        self, entry: List[Any], this_bearing: BearingAbstract, key: Hashable
+    ) -> List[Any]:
+        """fetches or creates the child of entry's node, as Course.place does"""
+        target = entry[0]
+        factory = this_bearing.factory_type
+        try:
+            node = this_bearing.fetch(target)
+        except NullNameError as error:
+            if factory is None:
+                raise error
+            node = None
+
+        if factory is not None and not isinstance(node, factory):
+            node = this_bearing.init_factory()
+            kwargs: dict = {"place_factory": True}
+            this_bearing.place(target, node, **kwargs)
+            self._changed(target, this_bearing)
+
+        child = [node, dict()]
+        entry[1][key] = child
+        self._holding.setdefault(id(node), list()).append(child)
+        return child
+
+    def _changed(self, node: Any, this_bearing: BearingAbstract) -> None:
+        """drops kept children of ``node`` that placing ``this_bearing`` replaced"""
+        entries = self._holding.get(id(node), ())
+        name = this_bearing.name
+        # negative and positive indexes can reach the same child.
+        if not isinstance(name, str) or _memo_key(this_bearing) is None:
+            for entry in entries:
+                entry[1].clear()
+            return
+
+        # Item(0), Fallback("0") and Attr can all reach the same child.
+        for entry in entries:
+            children = entry[1]
+            replaced = [x for x in children if str(x[0][1]) == name]
+            for key in replaced:
+                del children[key]
+
+    def _reset(self) -> None:
+        self._root[1].clear()
+        self._holding = {id(self._root[0]): [self._root]}
+
+
+def _memo_key(this_bearing: BearingAbstract) -> Optional[Hashable]:
+    """key of a bearing in a _PrefixMemo, or None if it is not memoized"""
+    kind = type(this_bearing)
+    if kind is Item or kind is Attr:
+        extra: Any = None
+    elif kind is Fallback and isinstance(this_bearing, Fallback):
+        # fallbacks with other classes can reach other values. Adaptive fallbacks
+        # are not kept, since each one can try its classes in another order.
+        extra = tuple(this_bearing.BEARING_CLASSES)
+    else:
+        return None
+
+    name = this_bearing.name
+    try:
+        hash(name)
+    except TypeError:
+        return None
+    return kind, name, extra
+
+
+def _run_coordinate(coord: Coordinate) -> Coordinate:
+    """
+    Copies ``coord`` with fresh ``CleanData``, so mapping never changes the coordinates
+    it was given.
+    """
+    run = copy.copy(coord)
+    object.__setattr__(run, "clean", CleanData(coord))
+    return run
+
+
 def _get_cleaner(
-    self_func: Callable, coord: Coordinate, coord_func: Optional[Callable], cache: dict
+    self_func: Callable,
+    coord: Coordinate,
+    coord_func: Optional[Union[Callable, str]],
+    cache: MutableMapping,
 ) -> Tuple[Callable, list]:
     """Gets the cleaner for a course or value, and sets up the args"""
     # Coordinate cleaners take precedence
     if coord_func is not None:
-        cleaner: Callable = coord_func
+        # cleaners given by name are looked up in the registry when called.
+        cleaner: Callable = (
+            _NamedCleaner(coord_func) if isinstance(coord_func, str) else coord_func
+        )
         cleaner_args: list = [coord, cache]
     else:
         # Then Cartographer cleaners, they act as the default
@@ -241,7 +1287,12 @@ def _clean_courses(
         courses[i] = cleaned
 
 
-def _fetch_org_value(cart: Cartographer, origin_root: Any, coord: Coordinate) -> Any:
+def _fetch_org_value(
+    cart: Cartographer,
+    origin_root: Any,
+    coord: Coordinate,
+    memo: Optional["_PrefixMemo"] = None,
+) -> Any:
     """Gets value or values from coordinate.org"""
     cleaner, cleaner_args = _get_cleaner(
         cart.clean_org, coord, coord.clean_org, cart.cache
@@ -249,7 +1300,10 @@ def _fetch_org_value(cart: Cartographer, origin_root: Any, coord: Coordinate) ->
     _clean_courses(coord.clean.org_list, cleaner, cleaner_args)
 
     origin_default = zip(coord.clean.org_list, coord.clean.default_list)
-    value = tuple(c.fetch(origin_root, default=d) for c, d in origin_default)
+    if memo is None:
+        value = tuple(c.fetch(origin_root, default=d) for c, d in origin_default)
+    else:
+        value = tuple(memo.fetch(c, d) for c, d in origin_default)
 
     if len(coord.clean.org_list) <= 1:
         # If there's only one course, we DON'T return values as a tuple.
@@ -259,7 +1313,10 @@ def _fetch_org_value(cart: Cartographer, origin_root: Any, coord: Coordinate) ->
 
 
 def _place_dst_value(
-    cart: Cartographer, destination_root: Any, coord: Coordinate
+    cart: Cartographer,
+    destination_root: Any,
+    coord: Coordinate,
+    parents: Optional["_ParentMemo"] = None,
 ) -> None:
     """places value at destination course(s)"""
     cleaner, cleaner_args = _get_cleaner(
@@ -279,11 +1336,19 @@ def _place_dst_value(
         if this_dst is None:
             continue
 
-        this_dst.place(destination_root, value)
+        if parents is None:
+            this_dst.place(destination_root, value)
+        else:
+            parents.place(this_dst, value)
 
 
 def _map_coordinate(
-    cart: Cartographer, origin_root: Any, destination_root: Any, coord: Coordinate
+    cart: Cartographer,
+    origin_root: Any,
+    destination_root: Any,
+    coord: Coordinate,
+    memo: Optional["_PrefixMemo"] = None,
+    parents: Optional["_ParentMemo"] = None,
 ) -> None:
     """
     Process coordinate: apply source data to destination data
@@ -291,6 +1356,8 @@ def _map_coordinate(
     :param origin_root: root source object data is pulled from
     :param destination_root: root destination object data is applied to
     :param coord: coordinate data instructing how to transfer one piece of data
+    :param memo: prefix memo of the run, if memoizing
+    :param parents: destination parent memo of the run, if memoizing
 
     :raises NullNameError: when Course cannot be found
     :raises SuppressedMapErrors: At end if errors occur and ``exceptions`` is set
@@ -299,7 +1366,7 @@ def _map_coordinate(
     """
     # fetch origin value(s)
     if coord.clean.value is None:
-        coord.clean.value = _fetch_org_value(cart, origin_root, coord)
+        coord.clean.value = _fetch_org_value(cart, origin_root, coord, memo)
 
     # clean value(s)
     cleaner, cleaner_args = _get_cleaner(
@@ -310,7 +1377,7 @@ def _map_coordinate(
     coord.clean.value = cleaner(*cleaner_args)
 
     # place value(s) at destinations(s)
-    _place_dst_value(cart, destination_root, coord)
+    _place_dst_value(cart, destination_root, coord, parents)
 
 
 def _map_coordinates(
@@ -319,14 +1386,16 @@ def _map_coordinates(
     dst_root: Any,
     coordinates: Iterable[Coordinate],
     exceptions: bool,
+    memo: Optional["_PrefixMemo"],
+    parents: Optional["_ParentMemo"],
 ) -> Tuple[List[Course], List[Union[NullNameError, NonNavigableError]]]:
-    """Maps the explicitly passed coordinates."""
+    """Maps the explicitly passed coordinates, returning the origin courses mapped."""
     mapped: List[Course] = list()
     error_list: List[Union[NullNameError, NonNavigableError]] = list()
 
     for coordinate in coordinates:
         try:
-            _map_coordinate(cart, origin_root, dst_root, coordinate)
+            _map_coordinate(cart, origin_root, dst_root, coordinate, memo, parents)
         except NullNameError as error:
             if exceptions:
                 raise error
@@ -342,8 +1411,8 @@ def _map_survey_chart(
     origin_root: Any,
     dst_root: Any,
     exceptions: bool,
-    mapped_courses: List[Course],
-    course_chart: List[Tuple[Course, Any]],
+    mapped_courses: "_CoverageIndex",
+    course_chart: Sequence[Tuple[Course, Any]],
 ) -> List[Union[NullNameError, NonNavigableError]]:
     """
     Survey origin_root and map data to dst_root if courses have not been mapped already.
@@ -351,13 +1420,10 @@ def _map_survey_chart(
     error_list: List[Union[NullNameError, NonNavigableError]] = list()
 
     for course, value in course_chart:
-        if any(course in x for x in mapped_courses):
-            continue
-        if any(x in course for x in mapped_courses):
+        if mapped_courses.covers(course):
             continue
 
-        coordinate = Coordinate(org=course)
-        object.__setattr__(coordinate, "clean", CleanData(coordinate))
+        coordinate = _run_coordinate(Coordinate(org=course))
         coordinate.clean.value = value
 
         try:
@@ -367,7 +1433,7 @@ def _map_survey_chart(
                 raise error
             error_list.append(error)
 
-        mapped_courses.append(course)
+        mapped_courses.add(course)
 
     return error_list
 
@@ -378,11 +1444,12 @@ def _chart_survey(
     dst_root: Any,
     surveyor: Surveyor,
     exceptions: bool,
-    mapped_courses: List[Course],
+    mapped_courses: "_CoverageIndex",
 ) -> List[Union[NullNameError, NonNavigableError]]:
     """Makes a chart of origin_root's courses"""
     error_list: List[Union[NullNameError, NonNavigableError]] = list()
 
+    course_chart: Iterable[Tuple[Course, Any]]
     try:
         course_chart = surveyor.chart(origin_root, exceptions=exceptions)
     except SuppressedErrors as error:
@@ -392,7 +1459,7 @@ def _chart_survey(
 
     # reverse sort by length so that deeper elements are attempted first, then
     #   parents are skipped if mapping is successful
-    course_chart.sort(key=lambda x: len(x), reverse=True)
+    course_chart = sorted(course_chart, key=lambda x: len(x), reverse=True)
 
     survey_errors = _map_survey_chart(
         chart, origin_root, dst_root, exceptions, mapped_courses, course_chart
@@ -400,3 +1467,86 @@ def _chart_survey(
     error_list.extend(survey_errors)
 
     return error_list
+
+
+class _ColumnIndex:
+    """selects the columns of a columnar origin by course"""
+
+    __slots__ = ("origin_columns", "rows", "_chart")
+
+    def __init__(self, origin_columns: Mapping[str, Sequence]):
+        self.origin_columns: Mapping[str, Sequence] = origin_columns
+        self.rows: int = _column_rows(origin_columns)
+        # column keys cast to courses, built on the first key that is not an exact
+        #   match.
+        self._chart: Optional[IndexedChart] = None
+
+    def select(self, course: Course, default: Any) -> Any:
+        """column selected by ``course``, or a column of ``default``"""
+        try:
+            return self.origin_columns[str(course)]
+        except KeyError:
+            pass
+
+        if self._chart is None:
+            self._chart = IndexedChart(
+                ((type(course)(x), x) for x in self.origin_columns),
+                course_type=type(course),
+            )
+
+        try:
+            key = self._chart.lookup(course)
+        except KeyError:
+            if default is NO_DEFAULT:
+                raise NullNameError(f"no column for course {repr(str(course))}")
+            return [default] * self.rows
+
+        return self.origin_columns[key]
+
+
+def _column_rows(origin_columns: Mapping[str, Sequence]) -> int:
+    """number of rows in a columnar origin, for filling defaults"""
+    rows = getattr(origin_columns, "rows", None)
+    if isinstance(rows, int):
+        return rows
+
+    for column in origin_columns.values():
+        return len(column)
+    return 0
+
+
+def _map_column_coordinate(
+    cart: Cartographer,
+    origin_index: _ColumnIndex,
+    dst_columns: MutableMapping[str, Any],
+    coord: Coordinate,
+) -> None:
+    """As _map_coordinate, with whole columns as values"""
+    cleaner, cleaner_args = _get_cleaner(
+        cart.clean_org, coord, coord.clean_org, cart.cache
+    )
+    _clean_courses(coord.clean.org_list, cleaner, cleaner_args)
+
+    origin_default = zip(coord.clean.org_list, coord.clean.default_list)
+    value = tuple(origin_index.select(c, d) for c, d in origin_default)
+    coord.clean.value = value[0] if len(value) <= 1 else value
+
+    cleaner, cleaner_args = _get_cleaner(
+        cart.clean_value, coord, coord.clean_value, cart.cache
+    )
+    cleaner_args.insert(0, coord.clean.value)
+    coord.clean.value = cleaner(*cleaner_args)
+
+    cleaner, cleaner_args = _get_cleaner(
+        cart.clean_dst, coord, coord.clean_dst, cart.cache
+    )
+    _clean_courses(coord.clean.dst_list, cleaner, cleaner_args)
+
+    values = coord.clean.value
+    if len(coord.clean.dst_list) <= 1:
+        values = (values,)
+
+    for column, this_dst in zip(values, coord.clean.dst_list):
+        if this_dst is None:
+            continue
+        dst_columns[str(this_dst)] = column
@@ -0,0 +1,593 @@
+from array import array
+from collections import deque
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+    overload,
+)
+
+from ._bearings import BearingAbstract, Call, Fallback
+from ._course import Course, CourseInput
+
+
+ChartPair = Tuple[Course, Any]
+
+
+def _intern_key(bearing_obj: BearingAbstract) -> Hashable:
+    """
+    Key that equal bearings share, so each is only stored once in a chart.
+
+    Bearings with unhashable names, or :class:`Call` bearings with unhashable
+    arguments, are keyed by identity, and are never shared.
+    """
+    if isinstance(bearing_obj, Call):
+        key: Hashable = (
+            Call,
+            bearing_obj.name,
+            bearing_obj._func_args,
+            tuple(bearing_obj._func_kwargs.items()),
+        )
+    else:
+        key = (type(bearing_obj), bearing_obj.name)
+
+    try:
+        hash(key)
+    except TypeError:
+        return "id", id(bearing_obj)
+    return key
+
+
+class Chart(Sequence[ChartPair]):
+    def __init__(self, course_type: Type[Course] = Course):
+        """
+        Compact storage for the (:class:`Course`, value) pairs of a chart.
+
+        :param course_type: course class used to rebuild courses.
+
+        A chart returned by :func:`Surveyor.chart` holds a full tuple of bearing
+        objects for every course. :class:`Chart` stores each node as a parent position
+        and a bearing id in two ``array.array`` objects, and a reference to its value
+        in a list. Each distinct bearing is stored once. Courses are rebuilt only when
+        a pair is requested.
+
+        Charts are usually created by :func:`Surveyor.chart_compact`:
+
+        >>> from gemma import Surveyor
+        >>>
+        >>> chart = Surveyor().chart_compact({"a": {"b": 1}, "c": [2, 3]})
+        >>> len(chart)
+        5
+        >>> for course, value in chart:
+        ...     print(course, value)
+        ...
+        [a] {'b': 1}
+        [a]/[b] 1
+        [c] [2, 3]
+        [c]/[0] 2
+        [c]/[1] 3
+
+        Charts are sequences, and support indexing and slicing. Slices are returned as
+        a ``list`` of pairs.
+
+        >>> chart[1]
+        (<Course: <Item: 'a'> / <Item: 'b'>>, 1)
+        >>> [str(course) for course, value in chart[-2:]]
+        ['[c]/[0]', '[c]/[1]']
+
+        Values can be looked up by course:
+
+        >>> from gemma import PORT
+        >>>
+        >>> chart.lookup(PORT / "c" / 1)
+        3
+
+        The first lookup builds an index of the chart's nodes, after which lookups take
+        one dict access per bearing.
+        """
+        self._course_type: Type[Course] = course_type
+
+        # node data. Nodes are stored parents-first, so a node's parent always has a
+        #   lower position. Nodes at the root have a parent of -1.
+        self._parents: array = array("q")
+        self._bearing_ids: array = array("I")
+        self._values: List[Any] = list()
+
+        # interned bearings
+        self._bearings: List[BearingAbstract] = list()
+        self._bearing_index: Dict[Hashable, int] = dict()
+
+        # (parent position, bearing id) -> position. Built on first lookup.
+        self._children: Optional[Dict[Tuple[int, int], int]] = None
+
+    def __repr__(self) -> str:
+        return f"<Chart: {len(self)} nodes>"
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @overload
+    def __getitem__(self, item: int) -> ChartPair:
+        pass
+
+    @overload
+    def __getitem__(self, item: slice) -> List[ChartPair]:  # noqa: F811
+        pass
+
+    def __getitem__(  # noqa: F811
+        self, item: Union[int, slice]
+    ) -> Union[ChartPair, List[ChartPair]]:
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError("chart index out of range")
+
+        return self.course(item), self._values[item]
+
+    def __iter__(self) -> Generator[ChartPair, None, None]:
+        # positions and bearing tuples of the current node's ancestors. Since parents
+        #   come first, each course is built from its parent's tuple.
+        stack: List[Tuple[int, Tuple[BearingAbstract, ...]]] = list()
+        from_bearings = self._course_type._from_bearings
+
+        for position, parent in enumerate(self._parents):
+            while stack and stack[-1][0] != parent:
+                stack.pop()
+
+            if stack:
+                parent_bearings = stack[-1][1]
+            elif parent == -1:
+                parent_bearings = tuple()
+            else:
+                # nodes added through Chart.add() may not be in depth-first order.
+                parent_bearings = self.course(parent)._bearings
+            bearings = parent_bearings + (self._bearings[self._bearing_ids[position]],)
+            stack.append((position, bearings))
+
+            yield from_bearings(bearings), self._values[position]
+
+    def __contains__(self, item: Any) -> bool:
+        try:
+            self.index(item)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def add(self, parent: int, bearing_obj: BearingAbstract, value: Any) -> int:
+        """
+        Adds a node below the node at ``parent``.
+
+        :param parent: position of parent node, or ``-1`` for the root.
+        :param bearing_obj: bearing from parent to the new node.
+        :param value: value of the new node.
+        :return: position of the new node.
+        :raises IndexError: if ``parent`` is not a position in the chart.
+        """
+        if not -1 <= parent < len(self):
+            raise IndexError("parent position out of range")
+
+        key = _intern_key(bearing_obj)
+        bearing_id = self._bearing_index.get(key)
+        if bearing_id is None:
+            bearing_id = len(self._bearings)
+            self._bearings.append(bearing_obj)
+            self._bearing_index[key] = bearing_id
+
+        position = len(self._values)
+        self._parents.append(parent)
+        self._bearing_ids.append(bearing_id)
+        self._values.append(value)
+
+        if self._children is not None:
+            self._children.setdefault((parent, bearing_id), position)
+
+        return position
+
+    def append(self, course: CourseInput, value: Any) -> int:
+        """
+        Adds a node at ``course``, whose parent course must already be in the chart.
+
+        :param course: course of the new node.
+        :param value: value of the new node.
+        :return: position of the new node.
+        :raises KeyError: if the parent of ``course`` is not in the chart.
+        :raises ValueError: if ``course`` is empty.
+        """
+        course = self._cast_course(course)
+        if len(course) == 0:
+            raise ValueError("cannot add an empty course to a chart")
+
+        parent = self.index(course.parent) if len(course) > 1 else -1
+        return self.add(parent, course.end_point, value)
+
+    def course(self, position: int) -> Course:
+        """
+        Rebuilds the course of the node at ``position``.
+
+        :param position: node position.
+        :return: course of ``course_type``.
+        """
+        bearings: List[BearingAbstract] = list()
+        while position != -1:
+            bearings.append(self._bearings[self._bearing_ids[position]])
+            position = self._parents[position]
+
+        bearings.reverse()
+        return self._course_type._from_bearings(tuple(bearings))
+
+    def value(self, position: int) -> Any:
+        """
+        :param position: node position.
+        :return: value of the node at ``position``.
+        """
+        return self._values[position]
+
+    def index(self, course: CourseInput) -> int:  # type: ignore
+        """
+        Position of the node at ``course``.
+
+        :param course: course to find.
+        :return: node position.
+        :raises KeyError: if ``course`` is not in the chart.
+
+        Bearings are matched by type and name, except :class:`Fallback` bearings, which
+        match any of the types in their ``BEARING_CLASSES``, as they would with
+        :class:`Course` equality.
+        """
+        course = self._cast_course(course)
+        if len(course) == 0:
+            raise KeyError(str(course))
+
+        children = self._build_children()
+        position = -1
+        for this_bearing in course:
+            position = self._child(children, position, this_bearing, course)
+
+        return position
+
+    def lookup(self, course: CourseInput) -> Any:
+        """
+        Value of the node at ``course``.
+
+        :param course: course to find.
+        :return: value.
+        :raises KeyError: if ``course`` is not in the chart.
+        """
+        return self._values[self.index(course)]
+
+    def _child(
+        self,
+        children: Dict[Tuple[int, int], int],
+        parent: int,
+        this_bearing: BearingAbstract,
+        course: Course,
+    ) -> int:
+        """position of the child of ``parent`` reached by ``this_bearing``"""
+        candidates = [this_bearing]
+        if isinstance(this_bearing, Fallback):
+            for bearing_type in this_bearing.BEARING_CLASSES:
+                try:
+                    candidates.append(bearing_type(this_bearing))
+                except TypeError:
+                    continue
+
+        for candidate in candidates:
+            bearing_id = self._bearing_index.get(_intern_key(candidate))
+            if bearing_id is None:
+                continue
+            position = children.get((parent, bearing_id))
+            if position is not None:
+                return position
+
+        raise KeyError(str(course))
+
+    def _build_children(self) -> Dict[Tuple[int, int], int]:
+        if self._children is None:
+            children: Dict[Tuple[int, int], int] = dict()
+            pairs = zip(self._parents, self._bearing_ids)
+            for position, pair in enumerate(pairs):
+                children.setdefault(pair, position)
+            self._children = children
+        return self._children
+
+    def _cast_course(self, course: CourseInput) -> Course:
+        if isinstance(course, Course):
+            return course
+        return self._course_type(course)
+
+
+class _TrieNode:
+    """node of an :class:`IndexedChart`"""
+
+    __slots__ = ("bearing", "value", "has_value", "children")
+
+    def __init__(self, bearing_obj: Optional[BearingAbstract]):
+        self.bearing: Optional[BearingAbstract] = bearing_obj
+        self.value: Any = None
+        self.has_value: bool = False
+        # name key -> nodes with that name. Names are usually unique per parent, but
+        #   bearings of different types can share a name, like Item("a") and Attr("a")
+        self.children: Dict[Hashable, List["_TrieNode"]] = dict()
+
+    def child(self, bearing_obj: BearingAbstract) -> Optional["_TrieNode"]:
+        """child reached by a bearing equal to ``bearing_obj``"""
+        for node in self.children.get(_name_key(bearing_obj), ()):
+            if node.bearing == bearing_obj:
+                return node
+        return None
+
+    def add_child(self, bearing_obj: BearingAbstract) -> "_TrieNode":
+        """child reached by ``bearing_obj``, created if it does not exist"""
+        node = self.child(bearing_obj)
+        if node is None:
+            node = _TrieNode(bearing_obj)
+            self.children.setdefault(_name_key(bearing_obj), list()).append(node)
+        return node
+
+    def iter_children(self) -> Generator["_TrieNode", None, None]:
+        for nodes in self.children.values():
+            yield from nodes
+
+
+def _name_key(bearing_obj: BearingAbstract) -> Hashable:
+    name = bearing_obj.name
+    try:
+        hash(name)
+    except TypeError:
+        return "unhashable", repr(name)
+    return name
+
+
+class IndexedChart:
+    def __init__(
+        self,
+        pairs: Optional[Iterable[ChartPair]] = None,
+        course_type: Type[Course] = Course,
+    ):
+        """
+        Chart stored as a trie of bearings, for fast lookups by course and by prefix.
+
+        :param pairs: (:class:`Course`, value) pairs to add, like the pairs yielded by
+            :func:`Surveyor.chart_iter`. Consumed as they are produced.
+        :param course_type: course class used to rebuild courses.
+
+        Each bearing of a course is one level of the trie, so looking up a course,
+        or every pair below it, takes one step per bearing, instead of a scan of the
+        whole chart. Bearings match as they do for :class:`Course` equality, so a
+        :class:`Fallback` finds the :class:`Item` or :class:`Attr` a surveyor charted.
+
+        >>> from gemma import IndexedChart, Surveyor, PORT
+        >>>
+        >>> data = {"a": {"b": 1, "c": 2}, "d": 3}
+        >>> chart = Surveyor().chart_indexed(data)
+        >>> chart.lookup(PORT / "a" / "c")
+        2
+        >>> for course, value in chart.iter_prefix(PORT / "a"):
+        ...     print(course, value)
+        ...
+        [a] {'b': 1, 'c': 2}
+        [a]/[b] 1
+        [a]/[c] 2
+
+        Pairs iterate depth first, in the order their courses were first added.
+        """
+        self._course_type: Type[Course] = course_type
+        self._root: _TrieNode = _TrieNode(None)
+        self._len: int = 0
+
+        if pairs is not None:
+            self.extend(pairs)
+
+    def __repr__(self) -> str:
+        return f"<IndexedChart: {len(self)} nodes>"
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Generator[ChartPair, None, None]:
+        yield from self._iter_node(self._root, tuple())
+
+    def __contains__(self, item: Any) -> bool:
+        try:
+            node = self._find(item)
+        except (KeyError, TypeError):
+            return False
+        return node.has_value
+
+    def add(self, course: CourseInput, value: Any) -> None:
+        """
+        Sets the value at ``course``, replacing any existing value.
+
+        :param course: course of the value. Parents do not need to be in the chart.
+        :param value: value to store.
+        :raises ValueError: if ``course`` is empty.
+        """
+        course = self._cast_course(course)
+        if len(course) == 0:
+            raise ValueError("cannot add an empty course to a chart")
+
+        node = self._root
+        for this_bearing in course:
+            node = node.add_child(this_bearing)
+        self._set(node, value)
+
+    def extend(self, pairs: Iterable[ChartPair]) -> None:
+        """
+        Adds each (course, value) pair, as :func:`IndexedChart.add`.
+
+        :param pairs: pairs to add.
+        """
+        for course, value in pairs:
+            self.add(course, value)
+
+    def lookup(self, course: CourseInput) -> Any:
+        """
+        Value at ``course``.
+
+        :param course: course to find.
+        :return: value.
+        :raises KeyError: if ``course`` has no value in the chart.
+        """
+        node = self._find(course)
+        if not node.has_value:
+            raise KeyError(str(course))
+        return node.value
+
+    def iter_prefix(self, course: CourseInput) -> Generator[ChartPair, None, None]:
+        """
+        Yields every pair at or below ``course``.
+
+        :param course: prefix course.
+        :return: (:class:`Course`, value) pairs, depth first. Nothing if ``course`` is
+            not in the chart.
+        """
+        course = self._cast_course(course)
+        try:
+            node = self._find(course)
+        except KeyError:
+            return
+
+        # rebuild the prefix from stored bearings, so yielded courses hold the
+        #   charted bearing types rather than the ones passed in.
+        bearings = self._stored_bearings(course)
+        if node.has_value:
+            yield self._course_type._from_bearings(bearings), node.value
+        yield from self._iter_node(node, bearings)
+
+    def delete(self, course: CourseInput) -> int:
+        """
+        Removes the value at ``course``, and every value below it.
+
+        :param course: course of subtree to remove.
+        :return: number of values removed.
+        :raises KeyError: if ``course`` is not in the chart.
+        """
+        course = self._cast_course(course)
+        if len(course) == 0:
+            raise KeyError(str(course))
+
+        parent = self._find(course.parent)
+        node = parent.child(course.end_point)
+        if node is None:
+            raise KeyError(str(course))
+
+        siblings = parent.children[_name_key(node.bearing)]  # type: ignore
+        siblings.remove(node)
+        if not siblings:
+            del parent.children[_name_key(node.bearing)]  # type: ignore
+
+        removed = self._count(node)
+        self._len -= removed
+        return removed
+
+    def merge(self, other: Union["IndexedChart", Iterable[ChartPair]]) -> None:
+        """
+        Adds every pair of ``other`` to this chart. Values in ``other`` replace values
+        at the same course.
+
+        :param other: :class:`IndexedChart`, or any iterable of pairs.
+
+        Merging another :class:`IndexedChart` walks both tries together, rather than
+        looking up each course from the root.
+        """
+        if isinstance(other, IndexedChart):
+            self._merge_node(self._root, other._root)
+        else:
+            self.extend(other)
+
+    def _add_events(self, events: Iterable[Any]) -> None:
+        """
+        Adds the values of :class:`SurveyEvent` records from
+        :func:`Surveyor.survey_events`, without creating courses.
+        """
+        stack = [self._root]
+        for event in events:
+            if event.event == "leave":
+                stack.pop()
+                continue
+
+            node = stack[-1].add_child(event.bearing)
+            self._set(node, event.value)
+            if event.event == "enter":
+                stack.append(node)
+
+    def _set(self, node: _TrieNode, value: Any) -> None:
+        if not node.has_value:
+            node.has_value = True
+            self._len += 1
+        node.value = value
+
+    def _find(self, course: CourseInput) -> _TrieNode:
+        course = self._cast_course(course)
+        node = self._root
+        for this_bearing in course:
+            child = node.child(this_bearing)
+            if child is None:
+                raise KeyError(str(course))
+            node = child
+        return node
+
+    def _stored_bearings(self, course: Course) -> Tuple[BearingAbstract, ...]:
+        bearings: List[BearingAbstract] = list()
+        node = self._root
+        for this_bearing in course:
+            node = node.child(this_bearing)  # type: ignore
+            bearings.append(node.bearing)  # type: ignore
+        return tuple(bearings)
+
+    def _iter_node(
+        self, node: _TrieNode, bearings: Tuple[BearingAbstract, ...]
+    ) -> Generator[ChartPair, None, None]:
+        """yields the pairs below ``node``, without recursive generators"""
+        from_bearings = self._course_type._from_bearings
+        stack = [(node.iter_children(), bearings)]
+
+        while stack:
+            children, parent_bearings = stack[-1]
+            for child in children:
+                # only the root node has no bearing, and it is never a child.
+                child_bearing = cast(BearingAbstract, child.bearing)
+                child_bearings = parent_bearings + (child_bearing,)
+                if child.has_value:
+                    yield from_bearings(child_bearings), child.value
+                stack.append((child.iter_children(), child_bearings))
+                break
+            else:
+                stack.pop()
+
+    def _count(self, node: _TrieNode) -> int:
+        count = 0
+        stack = [node]
+        while stack:
+            this_node = stack.pop()
+            count += this_node.has_value
+            stack.extend(this_node.iter_children())
+        return count
+
+    def _merge_node(self, node: _TrieNode, other: _TrieNode) -> None:
+        # breadth first, so new children are added in the order of ``other``
+        queue = deque([(node, other)])
+        while queue:
+            this_node, other_node = queue.popleft()
+            if other_node.has_value:
+                self._set(this_node, other_node.value)
+            for other_child in other_node.iter_children():
+                child = this_node.add_child(other_child.bearing)  # type: ignore
+                queue.append((child, other_child))
+
+    def _cast_course(self, course: CourseInput) -> Course:
+        if isinstance(course, Course):
+            return course
+        return self._course_type(course)
@@ -0,0 +1,317 @@
+import functools
+import threading
+import types
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+
+_CleanerType = TypeVar("_CleanerType", bound=Callable)
+
+# registered cleaners by name, guarded by _CLEANERS_LOCK for registration.
+_CLEANERS: Dict[str, Callable] = dict()
+_CLEANERS_LOCK = threading.Lock()
+
+
+@overload
+def register_cleaner(name: _CleanerType) -> _CleanerType:
+    pass
+
+
+@overload
+def register_cleaner(  # noqa: F811
+    name: Optional[str] = None, replace: bool = False
+) -> Callable[[_CleanerType], _CleanerType]:
+    pass
+
+
+def register_cleaner(  # noqa: F811
+    name: Union[str, Callable, None] = None, replace: bool = False
+) -> Any:
+    """
+    Decorator that registers a cleaning function under a name, so :class:`Coordinate`
+    objects can refer to it by that name.
+
+    :param name: name to register the function as. Defaults to the function's
+        ``__qualname__``, prefixed by its module.
+    :param replace: replace a function already registered under ``name``.
+    :return: decorator, which returns the function unchanged.
+    :raises ValueError: if ``name`` is taken by another function, and ``replace`` is
+        not set.
+
+    >>> from gemma import register_cleaner, Coordinate, Cartographer, PORT
+    >>>
+    >>> @register_cleaner("example.double")
+    ... def double(value, coordinate, cache):
+    ...     return value * 2
+    ...
+    >>> destination = dict()
+    >>> coord = Coordinate(PORT / "a", clean_value="example.double")
+    >>> Cartographer().map({"a": 2}, destination, [coord])
+    >>> destination
+    {'a': 4}
+
+    Can also be used without arguments, as ``@register_cleaner``.
+
+    Coordinates that name their cleaners hold only strings, so they can be pickled,
+    sent to worker processes, and saved with :func:`dump_coordinates`. Names are
+    looked up when a coordinate is mapped or compiled, so the module registering a
+    cleaner only needs to be imported by then. Compiled plans keep the name too, and
+    look it up again in each process they are unpickled in.
+    """
+    if callable(name):
+        return register_cleaner()(name)
+
+    def decorator(func: _CleanerType) -> _CleanerType:
+        key = name
+        if key is None:
+            key = f"{func.__module__}.{func.__qualname__}"
+
+        with _CLEANERS_LOCK:
+            existing = _CLEANERS.get(key)
+            if existing is not None and existing is not func and not replace:
+                raise ValueError(f"a cleaner is already registered as {repr(key)}")
+            _CLEANERS[key] = func
+
+        return func
+
+    return decorator
+
+
+def registered_cleaner(name: str) -> Callable:
+    """
+    :param name: name a cleaner was registered as by :func:`register_cleaner`.
+    :return: cleaning function.
+    :raises KeyError: if no cleaner is registered as ``name``.
+    """
+    try:
+        return _CLEANERS[name]
+    except KeyError:
+        raise KeyError(f"no cleaner is registered as {repr(name)}")
+
+
+def _cleaner_name(func: Callable) -> Optional[str]:
+    """name ``func`` is registered as, or None"""
+    for name, registered in _CLEANERS.items():
+        if registered is func:
+            return name
+    return None
+
+
+class _NamedCleaner:
+    """
+    Calls a registered cleaner, looked up by name on first use. Pickles as its name,
+    so plans holding one can be sent to processes that register the cleaner
+    themselves.
+    """
+
+    __slots__ = ("name", "_func")
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self._func: Optional[Callable] = None
+
+    def __repr__(self) -> str:
+        return f"<cleaner: {repr(self.name)}>"
+
+    def __reduce__(self) -> Tuple[Any, Tuple[str]]:
+        return _NamedCleaner, (self.name,)
+
+    def __call__(self, *args: Any) -> Any:
+        return self.resolve()(*args)
+
+    def resolve(self) -> Callable:
+        """the registered cleaner, looked up on first use"""
+        func = self._func
+        if func is None:
+            func = registered_cleaner(self.name)
+            self._func = func
+        return func
+
+
+BATCH_OUTPUTS = ("list", "numpy")
+
+
+@overload
+def batch_cleaner(output: Callable) -> "_BatchCleaner":
+    pass
+
+
+@overload
+def batch_cleaner(  # noqa: F811
+    output: str = "list",
+) -> Callable[[Callable], "_BatchCleaner"]:
+    pass
+
+
+def batch_cleaner(output: Union[str, Callable] = "list") -> Any:  # noqa: F811
+    """
+    Decorator marking a value cleaner that cleans many values at once.
+
+    :param output: type of the batch passed to the cleaner, ``"list"`` or
+        ``"numpy"`` for a ``numpy`` array.
+    :return: decorator, which returns the cleaner wrapped as a batch cleaner.
+    :raises ValueError: if ``output`` is unknown.
+    :raises ImportError: if ``output`` is ``"numpy"`` and numpy is not installed.
+
+    A batch cleaner takes the values of one coordinate for a chunk of records, and
+    returns the cleaned values, in the same order:
+
+    >>> from gemma import batch_cleaner, Cartographer, Coordinate, PORT
+    >>>
+    >>> @batch_cleaner
+    ... def to_meters(values, coordinate, cache):
+    ...     return [x * 0.3048 for x in values]
+    ...
+    >>> coords = [Coordinate(PORT / "feet", PORT / "meters", clean_value=to_meters)]
+    >>> list(Cartographer().map_chunked([{"feet": 10}, {"feet": 20}], dict, coords))
+    [{'meters': 3.048}, {'meters': 6.096}]
+
+    :func:`Cartographer.map_chunked` and :func:`MappingPlan.map_chunked` call it once
+    per chunk. Everywhere else, like :func:`Cartographer.map`, it is called with a
+    batch of one value, so the same coordinates work in every mode.
+
+    With ``"numpy"`` output, the batch is ``numpy.asarray(values)``. Returned arrays
+    are turned back into Python values with ``tolist()`` before they are placed.
+
+    Batch cleaners can be registered with :func:`register_cleaner`, and methods like
+    :func:`Cartographer.clean_value` can be decorated too.
+    """
+    if callable(output):
+        return batch_cleaner()(output)
+
+    if output not in BATCH_OUTPUTS:
+        raise ValueError(f"output must be one of {BATCH_OUTPUTS}, not {repr(output)}")
+    if output == "numpy" and numpy is None:
+        raise ImportError("numpy must be installed for numpy output")
+
+    def decorator(func: Callable) -> _BatchCleaner:
+        return _BatchCleaner(func, output)
+
+    return decorator
+
+
+class _BatchCleaner:
+    """
+    A cleaner of many values at once, made by :func:`batch_cleaner`. Calling it cleans
+    a single value as a batch of one.
+    """
+
+    # copied from the cleaned function by functools.update_wrapper.
+    __name__: str
+    __qualname__: str
+
+    def __init__(self, func: Callable, output: str, instance: Any = None):
+        self.func: Callable = func
+        self.output: str = output
+        # object a method was bound to, None for plain functions.
+        self.instance: Any = instance
+        functools.update_wrapper(self, func)
+
+    def __repr__(self) -> str:
+        return f"<batch cleaner: {repr(self.func)}>"
+
+    def __reduce__(self) -> Any:
+        # pickled by reference, as the function or bound method it replaces would be.
+        if self.instance is not None:
+            return getattr, (self.instance, self.__name__)
+        return self.__qualname__
+
+    def __get__(self, instance: Any, owner: Any = None) -> "_BatchCleaner":
+        if instance is None:
+            return self
+        method = types.MethodType(self.func, instance)
+        return _BatchCleaner(method, self.output, instance)
+
+    def __call__(self, value: Any, *args: Any) -> Any:
+        return self.batch([value], *args)[0]
+
+    def batch(self, values: List[Any], *args: Any) -> List[Any]:
+        """cleans ``values``, returning a list of the same length"""
+        batch: Any = values
+        if self.output == "numpy":
+            batch = numpy.asarray(values)
+
+        cleaned = self.func(batch, *args)
+        if hasattr(cleaned, "tolist"):
+            cleaned = cleaned.tolist()
+        elif not isinstance(cleaned, list):
+            cleaned = list(cleaned)
+
+        if len(cleaned) != len(values):
+            raise ValueError(
+                f"batch cleaner {repr(self.func)} returned {len(cleaned)} values for "
+                f"{len(values)}"
+            )
+        return cleaned
+
+
+def memoize_cleaner(func: _CleanerType) -> _CleanerType:
+    """
+    Decorator that memoizes a pure value cleaner on its value, in the cache it is
+    passed.
+
+    :param func: value cleaner, called as ``func(value, coordinate, cache)``, whose
+        result depends on ``value`` alone.
+    :return: cleaner that returns the result held in ``cache`` for ``value``, calling
+        ``func`` only when there is none.
+
+    >>> from gemma import memoize_cleaner, Cartographer, Coordinate, PORT
+    >>>
+    >>> @memoize_cleaner
+    ... def country_name(value, coordinate, cache):
+    ...     print("looking up", value)
+    ...     return {"fr": "France", "de": "Germany"}[value]
+    ...
+    >>> coords = [Coordinate(PORT / "country", clean_value=country_name)]
+    >>> records = [{"country": "fr"}, {"country": "fr"}, {"country": "de"}]
+    >>> list(Cartographer().compile(coords).map_many(records, dict))
+    looking up fr
+    looking up de
+    [{'country': 'France'}, {'country': 'France'}, {'country': 'Germany'}]
+
+    Results are held in ``Cartographer.cache``, so a :class:`CleanerCache` with a
+    ``max_size`` or ``ttl`` bounds them, and its ``stats`` count the hits and misses.
+    Entries are keyed by the cleaner and value, so they are shared by every
+    coordinate using the cleaner. Values that cannot be hashed are cleaned every
+    time.
+    """
+
+    @functools.wraps(func)
+    def memoized(value: Any, coordinate: Any, cache: Any) -> Any:
+        key = (memoized, type(value), value)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable values are not memoized.
+            return func(value, coordinate, cache)
+
+        result = func(value, coordinate, cache)
+        cache[key] = result
+        return result
+
+    return memoized  # type: ignore
+
+
+def _batch_of(cleaner: Callable) -> Optional[_BatchCleaner]:
+    """the batch cleaner ``cleaner`` is, or refers to by name, or None"""
+    if isinstance(cleaner, _NamedCleaner):
+        cleaner = cleaner.resolve()
+    if isinstance(cleaner, _BatchCleaner):
+        return cleaner
+    return None
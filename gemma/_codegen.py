@@ -0,0 +1,441 @@
+import ast
+import builtins
+import keyword
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import gemma
+from ._bearings import BearingAbstract, Call, Fallback, Item
+from ._cache import CleanerCache
+from ._cleaners import _NamedCleaner, _cleaner_name
+from ._course import Course
+from ._flags import NO_DEFAULT
+from ._template import _inline_kind
+
+
+def _plan_source(steps: Tuple[Any, ...], name: str) -> str:
+    """writes the source of a module defining function ``name`` for plan ``steps``"""
+    if not name.isidentifier() or keyword.iskeyword(name):
+        raise ValueError(f"{repr(name)} is not a valid function name")
+
+    writer = _SourceWriter()
+    for i, step in enumerate(steps):
+        writer.write_step(i, step)
+
+    return writer.source(name, len(steps))
+
+
+def _plan_function(steps: Tuple[Any, ...], name: str) -> Callable[[Any, Any], None]:
+    """execs the source written by ``_plan_source``, returning the function"""
+    source = _plan_source(steps, name)
+    namespace: Dict[str, Any] = {"__name__": f"<gemma plan {name}>"}
+    exec(compile(source, f"<gemma plan {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+class _SourceWriter:
+    """
+    Gathers the imports, module constants and function body lines of a generated
+    mapping function.
+    """
+
+    def __init__(self) -> None:
+        # module to names imported from it.
+        self.imports: Dict[str, Set[str]] = dict()
+        # constant name to source of its value.
+        self.constants: List[Tuple[str, str]] = list()
+        self.lines: List[str] = list()
+        # sources of functions the generated function calls.
+        self.helpers: Set[str] = set()
+        # id of course to the name of its constant.
+        self.courses: Dict[int, str] = dict()
+        # the cache is scoped to runs, and each call is a run of it.
+        self.run_cache: bool = False
+
+    def source(self, name: str, count: int) -> str:
+        header = [
+            '"""',
+            f"Generated by MappingPlan.to_source() from {count} coordinates.",
+            '"""',
+        ]
+
+        imports = [
+            f"from {module} import {', '.join(sorted(names))}"
+            for module, names in sorted(self.imports.items())
+        ]
+        constants = [f"{x} = {value}" for x, value in self.constants]
+
+        function = [
+            f"def {name}(origin, dst):",
+            '    """maps ``origin`` onto ``dst``, as the plan it was generated from"""',
+        ]
+        if self.run_cache:
+            function.append("    with _CACHE.run():")
+            function.extend(f"    {x}" for x in self.lines)
+        else:
+            function.extend(self.lines or ["    pass"])
+
+        parts = [header, imports, constants]
+        top = "\n\n".join("\n".join(x) for x in parts if x)
+        functions = sorted(self.helpers) + ["\n".join(function)]
+        return top + "".join(f"\n\n\n{x}" for x in functions) + "\n"
+
+    def import_name(self, obj: Any) -> str:
+        """imports a class or function, preferring the ``gemma`` namespace"""
+        obj_name = getattr(obj, "__name__", None)
+        if obj_name is not None and getattr(gemma, obj_name, None) is obj:
+            module = "gemma"
+        else:
+            module = getattr(obj, "__module__", "")
+            qualname = getattr(obj, "__qualname__", "")
+            if not module or qualname != obj_name or module == "__main__":
+                raise ValueError(f"{repr(obj)} cannot be imported by generated code")
+
+        self.imports.setdefault(module, set()).add(obj_name)
+        return obj_name
+
+    def constant(self, prefix: str, value_source: str) -> str:
+        """adds a module constant, returning its name"""
+        constant_name = f"_{prefix}_{len(self.constants)}"
+        self.constants.append((constant_name, value_source))
+        return constant_name
+
+    def literal(self, value: Any, what: str) -> str:
+        """source of a value that can be written as a literal"""
+        text = repr(value)
+        try:
+            same = _same_literal(ast.literal_eval(text), value)
+        except (ValueError, SyntaxError):
+            same = False
+        if not same:
+            raise ValueError(f"{what} {text} cannot be written as a literal")
+        return text
+
+    def bearing(self, this_bearing: BearingAbstract) -> str:
+        """source of an expression creating ``this_bearing``"""
+        kind = type(this_bearing)
+        args = [self.literal(this_bearing.name, f"name of {repr(this_bearing)}")]
+
+        if isinstance(this_bearing, Call):
+            if this_bearing._func_args:
+                args.append(self.literal(this_bearing._func_args, "call arguments"))
+            if this_bearing._func_kwargs:
+                kwargs = this_bearing._func_kwargs
+                args.append(f"func_kwargs={self.literal(kwargs, 'call arguments')}")
+
+        factory = this_bearing.factory_type
+        if factory is not None:
+            if getattr(builtins, factory.__name__, None) is not factory:
+                raise ValueError(
+                    f"factory {repr(factory)} of {repr(this_bearing)} is not a "
+                    f"builtin type"
+                )
+            args.append(f"factory={factory.__name__}")
+
+        if isinstance(this_bearing, Fallback):
+            fallback_type = type(this_bearing)
+            if this_bearing.BEARING_CLASSES != fallback_type.BEARING_CLASSES:
+                raise ValueError(
+                    f"{repr(this_bearing)} tries classes other than the default "
+                    f"{fallback_type.__name__}.BEARING_CLASSES"
+                )
+
+        return f"{self.import_name(kind)}({', '.join(args)})"
+
+    def course(self, course: Course) -> str:
+        """adds a course constant, returning its name"""
+        # the plan holds its courses, so ids are not reused while writing.
+        known = self.courses.get(id(course))
+        if known is not None:
+            return known
+
+        bearings = ", ".join(self.bearing(x) for x in course)
+        course_type = self.import_name(type(course))
+        constant_name = self.constant("COURSE", f"{course_type}({bearings})")
+        self.courses[id(course)] = constant_name
+        return constant_name
+
+    def write_step(self, i: int, step: Any) -> None:
+        orgs = " & ".join(str(x) for x, _ in step.orgs)
+        dsts = " & ".join(str(x) for x in step.dsts if x is not None)
+        self.lines.append(f"    # {i}: {orgs} -> {dsts}")
+
+        fetched: List[str] = list()
+        for j, (course, default) in enumerate(step.orgs):
+            value_name = "_value" if len(step.orgs) == 1 else f"_value_{j}"
+            self.write_fetch(value_name, course, default)
+            fetched.append(value_name)
+
+        if len(fetched) > 1:
+            self.lines.append(f"    _value = ({', '.join(fetched)})")
+
+        if step.value_cleaner is not None:
+            cleaner = self.cleaner(step)
+            args = "".join(f", {x}" for x in cleaner[1:])
+            self.lines.append(f"    _value = {cleaner[0]}(_value{args})")
+
+        if len(step.dsts) <= 1:
+            if step.dsts and step.dsts[0] is not None:
+                self.write_place("_value", step.dsts[0])
+            return
+
+        # values are zipped to destinations, as Cartographer.map does.
+        dsts = ", ".join("None" if x is None else self.course(x) for x in step.dsts)
+        self.lines.append(f"    for _item, _course in zip(_value, ({dsts},)):")
+        self.lines.append("        if _course is not None:")
+        self.lines.append("            _course.place(dst, _item)")
+
+    def write_fetch(self, value_name: str, course: Course, default: Any) -> None:
+        expression: Optional[str] = "origin"
+        for this_bearing in course:
+            if expression is None:
+                break
+            expression = self.inline_fetch(expression, this_bearing)
+
+        if expression == "origin":
+            self.lines.append(f"    {value_name} = origin")
+            return
+
+        # the course's own fetch gives the value, error or default of anything the
+        #   inlined expression cannot.
+        fetch_args = "origin"
+        default_name = None
+        if default is not NO_DEFAULT:
+            default_name = self.constant("DEFAULT", self.literal(default, "default"))
+            fetch_args += f", default={default_name}"
+        course_name = self.course(course)
+        fetch = f"{course_name}.fetch({fetch_args})"
+
+        if expression is None:
+            self.lines.append(f"    {value_name} = {fetch}")
+            return
+
+        if default_name is not None and all(_dict_safe(x) for x in course):
+            # missing keys of plain dicts are the common miss, and cheap to find.
+            self.helpers.add(_FETCH_DEFAULT)
+            names = self.literal(tuple(x.name for x in course), "names")
+            fetch = (
+                f"_fetch_default(origin, {self.constant('NAMES', names)}, "
+                f"{default_name}, {course_name})"
+            )
+
+        self.lines.append("    try:")
+        self.lines.append(f"        {value_name} = {expression}")
+        self.lines.append("    except Exception:")
+        self.lines.append(f"        {value_name} = {fetch}")
+
+    def inline_fetch(
+        self, expression: str, this_bearing: BearingAbstract
+    ) -> Optional[str]:
+        """
+        ``expression`` followed by a subscript or attribute access fetching
+        ``this_bearing``, or None if it cannot be written as one.
+        """
+        kind = _inline_kind(this_bearing)
+        if kind is None:
+            return None
+
+        try:
+            name = self.literal(this_bearing.name, "name")
+        except ValueError:
+            return None
+
+        if kind == "item":
+            return f"{expression}[{name}]"
+
+        attr_name = this_bearing.name
+        if attr_name.isidentifier() and not keyword.iskeyword(attr_name):
+            return f"{expression}.{attr_name}"
+        return f"getattr({expression}, {name})"
+
+    def write_place(self, value_name: str, course: Course) -> None:
+        place = f"{self.course(course)}.place(dst, {value_name})"
+        body = self.inline_place(value_name, course)
+        if body is None:
+            self.lines.append(f"    {place}")
+            return
+
+        # nodes created by factories before a failure are reused by the course's own
+        #   place, which ends as it would have from the start.
+        self.lines.append("    try:")
+        self.lines.extend(f"        {x}" for x in body)
+        self.lines.append("    except Exception:")
+        self.lines.append(f"        {place}")
+
+    def inline_place(self, value_name: str, course: Course) -> Optional[List[str]]:
+        """lines placing ``value_name`` at ``course`` on ``dst``, if they can be
+        written as subscripts and attribute access"""
+        if len(course) == 0:
+            return None
+
+        lines: List[str] = list()
+        parent = "dst"
+
+        for this_bearing in course[:-1]:
+            if this_bearing.factory_type is None:
+                node = self.inline_fetch(parent, this_bearing)
+            else:
+                node = self.inline_created(parent, this_bearing, lines)
+            if node is None:
+                return None
+            parent = node
+
+        end_line = self.inline_end_point(parent, course[-1], value_name)
+        if end_line is None:
+            return None
+        lines.append(end_line)
+        return lines
+
+    def inline_created(
+        self, parent: str, this_bearing: BearingAbstract, lines: List[str]
+    ) -> Optional[str]:
+        """
+        Adds lines to ``lines`` fetching ``this_bearing`` from ``parent``, creating it
+        from its factory if missing. Returns the name of the fetched node, or None if
+        it cannot be written as subscripts.
+        """
+        # only items can be placed by subscript when created from a factory.
+        if type(this_bearing) is not Item:
+            return None
+        try:
+            name = self.literal(this_bearing.name, "name")
+            factory_name = self.literal_factory(this_bearing.factory_type)
+        except ValueError:
+            return None
+
+        lines.append(f"_parent = {parent}")
+        lines.append("try:")
+        lines.append(f"    _node = _parent[{name}]")
+        lines.append("except (KeyError, IndexError):")
+        lines.append("    _node = None")
+        lines.append(f"if not isinstance(_node, {factory_name}):")
+        lines.append(f"    _node = {factory_name}()")
+        lines.append(f"    _parent[{name}] = _node")
+        return "_node"
+
+    def inline_end_point(
+        self, parent: str, end_point: BearingAbstract, value_name: str
+    ) -> Optional[str]:
+        """line placing ``value_name`` at ``end_point`` of ``parent``"""
+        if _inline_kind(end_point) != "item":
+            end_bearing = self.constant("BEARING", self.bearing(end_point))
+            return f"{end_bearing}.place({parent}, {value_name})"
+
+        try:
+            name = self.literal(end_point.name, "name")
+        except ValueError:
+            return None
+        return f"{parent}[{name}] = {value_name}"
+
+    def literal_factory(self, factory: Any) -> str:
+        factory_name: str = factory.__name__
+        if getattr(builtins, factory_name, None) is not factory:
+            raise ValueError(f"factory {repr(factory)} is not a builtin type")
+        return factory_name
+
+    def cleaner(self, step: Any) -> List[str]:
+        """names of a step's value cleaner constant, and of the arguments after value"""
+        cleaner = step.value_cleaner
+        if isinstance(cleaner, _NamedCleaner):
+            cleaner_name: Optional[str] = cleaner.name
+        else:
+            cleaner_name = _cleaner_name(cleaner)
+        if cleaner_name is None:
+            raise ValueError(
+                f"value cleaner {repr(cleaner)} must be registered with "
+                f"register_cleaner() to be written as source"
+            )
+
+        name_source = self.literal(cleaner_name, "cleaner name")
+        registered = self.import_name(gemma.registered_cleaner)
+        cleaner_constant = self.constant("CLEANER", f"{registered}({name_source})")
+
+        coordinate = self.coordinate(step, name_source)
+        if len(step.value_args) == 1:
+            return [cleaner_constant, coordinate]
+
+        # shared by the cleaners of the module, as Cartographer.cache is.
+        if all(x != "_CACHE" for x, _ in self.constants):
+            self.constants.insert(0, ("_CACHE", self.cache(step.value_args[-1])))
+        return [cleaner_constant, coordinate, "_CACHE"]
+
+    def cache(self, cache: Any) -> str:
+        """source of a new cache with the settings of ``cache``"""
+        if not isinstance(cache, CleanerCache):
+            return "dict()"
+
+        cache_type = self.import_name(CleanerCache)
+        settings = f"max_size={cache.max_size!r}, ttl={cache.ttl!r}"
+        if cache.scope == "map":
+            self.run_cache = True
+            settings += f", scope={cache.scope!r}"
+        return f"{cache_type}({settings})"
+
+    def coordinate(self, step: Any, cleaner_name: str) -> str:
+        """
+        adds a constant of a coordinate with the step's cleaned courses, passed to
+        cleaners
+        """
+        orgs = [self.course(x) for x, _ in step.orgs]
+        dsts = ["None" if x is None else self.course(x) for x in step.dsts]
+        defaults = [x for _, x in step.orgs]
+
+        org = orgs[0] if len(orgs) == 1 else f"({', '.join(orgs)},)"
+        dst = dsts[0] if len(dsts) == 1 else f"({', '.join(dsts)},)"
+
+        args = [org, dst, f"clean_value={cleaner_name}"]
+        if any(x is not NO_DEFAULT for x in defaults):
+            values: List[str] = list()
+            for default in defaults:
+                if default is NO_DEFAULT:
+                    self.imports.setdefault("gemma", set()).add("NO_DEFAULT")
+                    values.append("NO_DEFAULT")
+                else:
+                    values.append(self.literal(default, "default"))
+            if len(values) == 1:
+                args.append(f"default={values[0]}")
+            else:
+                args.append(f"default=({', '.join(values)},)")
+
+        coordinate_type = self.import_name(gemma.Coordinate)
+        return self.constant("COORDINATE", f"{coordinate_type}({', '.join(args)})")
+
+
+_FETCH_DEFAULT = '''def _fetch_default(origin, names, default, course):
+    """default if a plain dict along the course lacks a key, else the course's fetch"""
+    node = origin
+    for name in names:
+        if type(node) is not dict:
+            break
+        if name not in node:
+            return default
+        node = node[name]
+    return course.fetch(origin, default=default)'''
+
+
+def _dict_safe(this_bearing: BearingAbstract) -> bool:
+    """
+    whether a plain dict without the bearing's name as a key cannot have the bearing
+    fetched from it either.
+    """
+    if _inline_kind(this_bearing) != "item":
+        return False
+    if type(this_bearing) is Item:
+        return True
+    # fallbacks try methods and attributes after keys.
+    name = this_bearing.name
+    return not (isinstance(name, str) and hasattr(dict, name))
+
+
+def _same_literal(loaded: Any, value: Any) -> bool:
+    """whether a value read back from its repr is the same, type for type"""
+    if type(loaded) is not type(value):
+        return False
+    if isinstance(value, (tuple, list)):
+        return len(loaded) == len(value) and all(
+            _same_literal(x, y) for x, y in zip(loaded, value)
+        )
+    if isinstance(value, dict):
+        return list(loaded) == list(value) and all(
+            _same_literal(loaded[k], value[k]) for k in value
+        )
+    return bool(loaded == value)
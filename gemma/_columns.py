@@ -0,0 +1,138 @@
+from array import array
+from typing import Any, Dict, Iterator, List, Mapping, Sequence
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+
+COLUMN_OUTPUTS = ("list", "array", "numpy")
+
+
+class Columns(Mapping[str, Sequence]):
+    def __init__(
+        self, columns: Dict[str, Sequence], masks: Dict[str, Sequence], rows: int
+    ):
+        """
+        Records pivoted to one column per course, returned by
+        :func:`Surveyor.to_columns`.
+
+        :param columns: ``str(course)`` to column of values, one per record.
+        :param masks: ``str(course)`` to column of ``bool``, ``True`` where the record
+            had no value at the course, or the value was ``None``.
+        :param rows: number of records.
+
+        :class:`Columns` is a read-only mapping of course strings to columns. Masks are
+        available through :func:`Columns.mask`.
+        """
+        self._columns: Dict[str, Sequence] = columns
+        self._masks: Dict[str, Sequence] = masks
+        self._rows: int = rows
+
+    def __repr__(self) -> str:
+        return f"<Columns: {len(self)} columns, {self._rows} rows>"
+
+    def __getitem__(self, key: str) -> Sequence:
+        return self._columns[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    @property
+    def rows(self) -> int:
+        """
+        Read-only property.
+
+        :return: number of records, and length of every column.
+        """
+        return self._rows
+
+    def mask(self, key: str) -> Sequence:
+        """
+        :param key: course string of column.
+        :return: missing-value mask of column.
+        """
+        return self._masks[key]
+
+
+class _ColumnBuilder:
+    """values and missing flags of one column, gathered record by record"""
+
+    __slots__ = ("values", "missing", "kinds")
+
+    def __init__(self, rows: int):
+        # records before the column was found are missing
+        self.values: List[Any] = [None] * rows
+        self.missing: bytearray = bytearray(b"\x01" * rows)
+        # types of the values, to choose a typed array at the end.
+        self.kinds: set = set()
+
+    def pad(self, rows: int) -> None:
+        """marks the column missing for records up to ``rows``"""
+        gap = rows - len(self.values)
+        if gap > 0:
+            self.values.extend([None] * gap)
+            self.missing.extend(b"\x01" * gap)
+
+    def add(self, value: Any) -> None:
+        self.values.append(value)
+        if value is None:
+            self.missing.append(1)
+        else:
+            self.missing.append(0)
+            self.kinds.add(type(value))
+
+    def build(self, output: str) -> Any:
+        """column as a list, array.array or numpy array, as ``output`` asks"""
+        if output == "list":
+            return self.values
+
+        kind = self._numeric_kind()
+        if output == "array":
+            if kind is None:
+                return self.values
+            typecode, fill = ("q", 0) if kind is int else ("d", float("nan"))
+            values = [fill if x is None else x for x in self.values]
+            try:
+                return array(typecode, values)
+            except OverflowError:
+                return self.values
+
+        # numpy
+        if kind is int:
+            values = [0 if x is None else x for x in self.values]
+            try:
+                return numpy.array(values, dtype=numpy.int64)
+            except OverflowError:
+                pass
+        elif kind is float:
+            values = [numpy.nan if x is None else x for x in self.values]
+            return numpy.array(values, dtype=numpy.float64)
+
+        column = numpy.empty(len(self.values), dtype=object)
+        column[:] = self.values
+        return column
+
+    def build_mask(self, output: str) -> Any:
+        if output == "list":
+            return [x == 1 for x in self.missing]
+        if output == "array":
+            return array("B", self.missing)
+        return numpy.frombuffer(bytes(self.missing), dtype=numpy.bool_).copy()
+
+    def _numeric_kind(self) -> Any:
+        """int or float if every value is numeric, otherwise None"""
+        if not self.kinds or not self.kinds <= {int, float}:
+            return None
+        return float if float in self.kinds else int
+
+
+def _check_output(output: str) -> None:
+    if output not in COLUMN_OUTPUTS:
+        raise ValueError(f"output must be one of {COLUMN_OUTPUTS}, not {repr(output)}")
+    if output == "numpy" and numpy is None:
+        raise ImportError("numpy must be installed for numpy output")
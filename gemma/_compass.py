@@ -112,6 +112,9 @@ class Compass:
         and :func:`Compass.call_iter`. Any method that raises ``NotImplementedError``
         is skipped silently.
 
+        If the type of ``target`` defines ``__gemma_bearings__``, its result is yielded
+        instead, and the ``_iter`` methods are not called. See :ref:`protocol-hooks`.
+
         Compasses are used to help :class:`Surveyor` objects traverse through a data
         structure. Compasses tell surveyors what bearings it should
         traverse for a given object type.
@@ -121,6 +124,14 @@ class Compass:
         if not self.is_navigable(target):
             raise NonNavigableError(f"{type(self).__name__} cannot map {repr(target)}")
 
+        # Types can supply their own pre-computed bearings, skipping discovery.
+        hook = getattr(type(target), "__gemma_bearings__", None)
+        if hook is not None:
+            bearings = hook(target)
+            if bearings is not NotImplemented:
+                yield from bearings
+                return
+
         # Iterate through the bearing methods and yield their results.
         for method in self._BEARING_ITER_METHODS:
             try:
@@ -257,3 +268,7 @@ class Compass:
             return True
         else:
             return False
+
+
+DEFAULT_COMPASSES: List[Compass] = [Compass()]
+DEFAULT_END_POINTS: Tuple[Type, ...] = (str, int, float, type)
@@ -1,4 +1,6 @@
+import functools
 import itertools
+import numbers
 from typing import (
     Tuple,
     Any,
@@ -9,16 +11,56 @@ from typing import (
     List,
     Type,
     Iterable,
+    Optional,
+    TYPE_CHECKING,
 )
 
 from ._bearings import BearingAbstract, Fallback, bearing, _BEARING_CLASSES
 from ._exceptions import NullNameError
 from ._flags import NO_DEFAULT
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ._cursor import Cursor
+
+
+def _name_sort_key(name: Any) -> Tuple[int, str, Any]:
+    """
+    Sort key of a bearing name. Real numbers share a key type, so names that are
+    equal, like ``1`` and ``1.0``, get equal keys.
+    """
+    if isinstance(name, numbers.Real):
+        return (0, "", name)
+    if isinstance(name, str):
+        return (1, "str", name)
+    return (2, type(name).__name__, _NameOrder(name))
+
+
+@functools.total_ordering
+class _NameOrder:
+    """
+    Orders names by value, or by ``repr`` where values of a type cannot be
+    compared, like ``("a", 1)`` and ``("a", "b")``, so course ordering stays total.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: Any):
+        self.name: Any = name
+
+    def __eq__(self, other: Any) -> bool:
+        return bool(self.name == other.name)
+
+    def __lt__(self, other: Any) -> bool:
+        try:
+            return bool(self.name < other.name)
+        except TypeError:
+            return repr(self.name) < repr(other.name)
+
 
 class Course:
     BEARINGS: List[Type[BearingAbstract]] = _BEARING_CLASSES + [Fallback]
     BEARINGS_EXTENSION: List[Type[BearingAbstract]] = list()
+    _sort_key_cache: Optional[Tuple[Tuple[int, str, Any], ...]] = None
 
     def __init__(self, *bearings: Union[Tuple["CourseInput", ...], "CourseInput"]):
         """
@@ -47,6 +89,18 @@ class Course:
             other = Course(other)
         return other._bearings == self._bearings
 
+    def __lt__(self, other: "CourseInput") -> bool:
+        return self._sort_key() < self._cast_other(other)._sort_key()
+
+    def __le__(self, other: "CourseInput") -> bool:
+        return self._sort_key() <= self._cast_other(other)._sort_key()
+
+    def __gt__(self, other: "CourseInput") -> bool:
+        return self._sort_key() > self._cast_other(other)._sort_key()
+
+    def __ge__(self, other: "CourseInput") -> bool:
+        return self._sort_key() >= self._cast_other(other)._sort_key()
+
     # flake8 does not understand overloads, noqa comments are to ignore re-definition
     # errors during lint
     @overload  # noqa: F811
@@ -82,6 +136,29 @@ class Course:
 
         return False
 
+    def _sort_key(self) -> Tuple[Tuple[int, str, Any], ...]:
+        """
+        Key that courses are sorted by: the names of its bearings, in order.
+
+        Courses compare bearing by bearing, so a course sorts directly before any
+        course it is the parent of. Bearings are keyed by name alone, as equality
+        compares them: ``Fallback("a")`` equals both ``Item("a")`` and ``Attr("a")``,
+        so no order of bearing types can agree with ``==``. Courses that are equal
+        therefore never sort before one another, and courses that differ only in
+        bearing types sort as ties. Computed once, then cached, since courses are
+        immutable.
+        """
+        key = self._sort_key_cache
+        if key is None:
+            key = tuple(_name_sort_key(x.name) for x in self._bearings)
+            self._sort_key_cache = key
+        return key
+
+    def _cast_other(self, other: "CourseInput") -> "Course":
+        if isinstance(other, Course):
+            return other
+        return type(self)(other)
+
     @property
     def parent(self) -> "Course":
         """
@@ -285,6 +362,102 @@ class Course:
 
         return target
 
+    def fetch_iter(self, target: Any) -> Generator[Tuple["Course", Any], None, None]:
+        """
+        Traverses ``target``, yielding every (course, value) pair the course matches.
+
+        :param target: data structure to get data from.
+        :return: yields concrete :class:`Course` and value pairs, lazily.
+
+        Bearings that match many values, like :class:`Wildcard` and
+        :class:`RecursiveWildcard`, are expanded through their ``fan_out()`` method.
+        The yielded courses replace them with the concrete bearings that were
+        followed.
+
+        Branches are pruned as soon as a bearing cannot be fetched, so only the parts
+        of ``target`` that can still match are traversed, and missing values are
+        skipped rather than raising :class:`NullNameError`.
+
+        >>> from gemma import PORT, Wildcard, RecursiveWildcard
+        >>>
+        >>> data = {
+        ...     "users": [
+        ...         {"name": "ann", "pets": [{"name": "rex"}]},
+        ...         {"name": "bob", "pets": []},
+        ...     ]
+        ... }
+        >>> names = PORT / "users" / Wildcard() / "name"
+        >>> for course, value in names.fetch_iter(data):
+        ...     print(repr(course), value)
+        ...
+        <Course: <Fallback: 'users'> / <Item: 0> / <Fallback: 'name'>> ann
+        <Course: <Fallback: 'users'> / <Item: 1> / <Fallback: 'name'>> bob
+        >>>
+        >>> for course, value in (PORT / RecursiveWildcard() / "name").fetch_iter(data):
+        ...     print(course, value)
+        ...
+        [users]/[0]/name ann
+        [users]/[0]/[pets]/[0]/name rex
+        [users]/[1]/name bob
+
+        A course with no wildcards yields a single pair, or nothing if it does not
+        exist on ``target``.
+        """
+        for path, value in self._fan_out(target, 0, tuple()):
+            yield self._from_bearings(path), value
+
+    def _fan_out(
+        self, target: Any, index: int, path: Tuple[BearingAbstract, ...]
+    ) -> Generator[Tuple[Tuple[BearingAbstract, ...], Any], None, None]:
+        """
+        Follows concrete bearings from ``index`` until the next one that fans out,
+        then recurses into each of its values.
+        """
+        bearings = self._bearings
+
+        while index < len(bearings):
+            this_bearing = bearings[index]
+            if this_bearing.FAN_OUT:
+                break
+
+            try:
+                target = this_bearing.fetch(target)
+            except (NullNameError, TypeError):
+                return
+
+            path += (this_bearing,)
+            index += 1
+        else:
+            yield path, target
+            return
+
+        # mypy does not know that FAN_OUT bearings implement fan_out()
+        for sub_path, value in this_bearing.fan_out(target):  # type: ignore
+            yield from self._fan_out(value, index + 1, path + sub_path)
+
+    def cursor(self, target: Any) -> "Cursor":
+        """
+        Resolves the course on ``target`` once, returning a :class:`Cursor` that
+        fetches and places relative to the value found.
+
+        :param target: data structure to traverse.
+        :return: :class:`Cursor` holding the value at the end of the course.
+        :raises NullNameError: if any bearing cannot be found in ``target``
+
+        >>> from gemma import PORT
+        >>>
+        >>> order = {"lines": [{"product": {"sku": "A1", "qty": 2}}]}
+        >>> line = (PORT / "lines" / 0).cursor(order)
+        >>> product = line / "product"
+        >>> product.fetch("sku"), product.fetch("qty")
+        ('A1', 2)
+        >>> product.course
+        <Course: <Fallback: 'lines'> / <Item: 0> / <Fallback: 'product'>>
+        """
+        from ._cursor import Cursor
+
+        return Cursor(target, self)
+
     def place(self, target: Any, value: Any) -> None:
         """
         Traverses ``target`` to place data at :func:`Course.end_point`.
@@ -342,6 +515,67 @@ class Course:
 
         self.end_point.place(target, value)
 
+    def replace_in(self, target: Any, value: Any) -> Any:
+        """
+        Returns a new version of ``target`` with ``value`` at the end of the course.
+        ``target`` is not changed.
+
+        :param target: data structure to update.
+        :param value: value to place.
+        :return: new root object. If the course is empty, ``value`` itself.
+        :raises NullNameError: if any bearing cannot be found in ``target``
+
+        Only the objects along the course are copied, through each bearing's
+        :func:`BearingAbstract.place_copy` method, so everything else is shared with
+        ``target``. This allows updating immutable structures: tuples and named tuples
+        are rebuilt, dataclasses, including frozen ones, are copied with
+        ``dataclasses.replace()``, and other objects, like dicts and lists, are shallow
+        copied.
+
+        >>> from gemma import PORT
+        >>> from typing import NamedTuple
+        >>>
+        >>> class Config(NamedTuple):
+        ...     name: str
+        ...     servers: tuple
+        ...
+        >>> config = Config("prod", ({"host": "a"}, {"host": "b"}))
+        >>> updated = (PORT / "servers" / 1 / "host").replace_in(config, "c")
+        >>> updated
+        Config(name='prod', servers=({'host': 'a'}, {'host': 'c'}))
+        >>> config
+        Config(name='prod', servers=({'host': 'a'}, {'host': 'b'}))
+        >>> updated.servers[0] is config.servers[0]
+        True
+
+        Bearings with a ``factory`` create missing nodes, as in :func:`Course.place`.
+        """
+        nodes = [target]
+        for this_bearing in self._bearings[:-1]:
+            try:
+                target = this_bearing.fetch(target)
+            except NullNameError as error:
+                if this_bearing.factory_type is None:
+                    raise error
+                target = this_bearing.init_factory()
+            else:
+                factory = this_bearing.factory_type
+                if factory is not None and not isinstance(target, factory):
+                    target = this_bearing.init_factory()
+            nodes.append(target)
+
+        for this_bearing, node in zip(reversed(self._bearings), reversed(nodes)):
+            value = this_bearing.place_copy(node, value)
+
+        return value
+
+    @classmethod
+    def _from_bearings(cls, bearings: Tuple[BearingAbstract, ...]) -> "Course":
+        """Creates course from a tuple of bearing objects, skipping all casting."""
+        new = object.__new__(cls)
+        new._bearings = bearings
+        return new
+
     @classmethod
     def _cast_arg(cls, new: "CourseInput") -> Generator[BearingAbstract, None, None]:
         to_cast: Iterable["CourseInput"]
@@ -0,0 +1,120 @@
+from typing import Any, Dict, Optional
+
+from ._course import Course, CourseInput
+from ._flags import NO_DEFAULT
+
+
+class Cursor:
+    def __init__(self, target: Any, course: Optional[CourseInput] = None):
+        """
+        Holds the node at the end of a course, so relative courses do not re-traverse
+        the bearings that lead to it.
+
+        :param target: root data structure.
+        :param course: course from ``target`` to the node the cursor holds. Defaults to
+            an empty course, holding ``target`` itself.
+        :raises NullNameError: if ``course`` does not exist on ``target``.
+
+        Cursors are usually created through :func:`Course.cursor`.
+
+        >>> from gemma import PORT
+        >>>
+        >>> order = {"lines": [{"product": {"sku": "A1", "qty": 2}}]}
+        >>> product = (PORT / "lines" / 0 / "product").cursor(order)
+        >>> product.fetch("sku")
+        'A1'
+        >>> product.place("qty", 3)
+        >>> order["lines"][0]["product"]["qty"]
+        3
+
+        The node is resolved once, when the cursor is created. If the structure above
+        it is later replaced, the cursor keeps pointing at the old node.
+        """
+        if course is None:
+            course = Course()
+        elif not isinstance(course, Course):
+            course = Course(course)
+
+        self._root: Any = target
+        self._course: Course = course
+        self._node: Any = course.fetch(target)
+        self._relative: Dict[Any, Course] = dict()
+
+    def __repr__(self) -> str:
+        return f"<Cursor: {repr(self._course)}>"
+
+    def __truediv__(self, other: CourseInput) -> "Cursor":
+        relative = self._cast_relative(other)
+
+        new = object.__new__(type(self))
+        new._root = self._root
+        new._course = self._course / relative
+        new._node = relative.fetch(self._node)
+        new._relative = dict()
+        return new
+
+    @property
+    def root(self) -> Any:
+        """
+        Read-only property.
+
+        :return: ``target`` the cursor was created on.
+        """
+        return self._root
+
+    @property
+    def course(self) -> Course:
+        """
+        Read-only property.
+
+        :return: course from :func:`Cursor.root` to :func:`Cursor.node`.
+        """
+        return self._course
+
+    @property
+    def node(self) -> Any:
+        """
+        Read-only property.
+
+        :return: the resolved value at the end of :func:`Cursor.course`.
+        """
+        return self._node
+
+    def fetch(self, course: CourseInput, *, default: Any = NO_DEFAULT) -> Any:
+        """
+        Fetches ``course``, relative to :func:`Cursor.node`.
+
+        :param course: relative course.
+        :param default: As :func:`Course.fetch`.
+        :return: value at end of ``course``.
+        :raises NullNameError: if ``course`` does not exist and no default is passed.
+        """
+        return self._cast_relative(course).fetch(self._node, default=default)
+
+    def place(self, course: CourseInput, value: Any) -> None:
+        """
+        Places ``value`` at ``course``, relative to :func:`Cursor.node`.
+
+        :param course: relative course. Must contain at least one bearing.
+        :param value: value to place.
+        :return: None.
+        :raises NullNameError: if the parent of ``course`` does not exist.
+        """
+        self._cast_relative(course).place(self._node, value)
+
+    def _cast_relative(self, other: CourseInput) -> Course:
+        """
+        Casts ``other`` with the course type of the cursor. Casts of hashable inputs
+        are remembered, so repeated string courses are only parsed once.
+        """
+        if isinstance(other, Course):
+            return other
+
+        try:
+            return self._relative[other]
+        except KeyError:
+            relative = type(self._course)(other)
+            self._relative[other] = relative
+            return relative
+        except TypeError:
+            return type(self._course)(other)
@@ -16,15 +16,17 @@ class SuppressedErrors(BaseException):
     Attributes:
         - **errors (** ``List[BaseException]`` **):** list of errors which occurred.
 
-        - **chart_partial (** ``List[Tuple["Course", Any]]`` **):** If raised from
-          :func:`Surveyor.chart` raising a NonNavigableError for some elements, a
-          partial chart of the successfully traversed data will be stored here.
+        - **chart_partial (** ``Iterable[Tuple["Course", Any]]`` **):** If raised
+          from :func:`Surveyor.chart` raising a NonNavigableError for some elements, a
+          partial chart of the successfully traversed data will be stored here. A
+          :class:`Chart` or :class:`IndexedChart` when raised from
+          :func:`Surveyor.chart_compact` or :func:`Surveyor.chart_indexed`.
     """
 
     def __init__(self, *args: Iterable):
         super().__init__(*args)
         self.errors: List[Union[NullNameError, NonNavigableError]] = list()
-        self.chart_partial: List[Tuple["Course", Any]] = list()
+        self.chart_partial: Iterable[Tuple["Course", Any]] = list()
 
     @property
     def types(self) -> Tuple[Union[Type[NonNavigableError], Type[NullNameError]], ...]:
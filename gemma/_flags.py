@@ -1 +1,14 @@
-NO_DEFAULT = object()
+class _NoDefault:
+    """
+    Type of ``NO_DEFAULT``. Pickles by reference, so ``is NO_DEFAULT`` checks still
+    hold when a default is sent to another process.
+    """
+
+    def __repr__(self) -> str:
+        return "NO_DEFAULT"
+
+    def __reduce__(self) -> str:
+        return "NO_DEFAULT"
+
+
+NO_DEFAULT = _NoDefault()
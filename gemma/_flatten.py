@@ -0,0 +1,198 @@
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ._bearings import BearingAbstract, Item, Fallback
+from ._course import Course
+from ._exceptions import NullNameError
+from ._surveyor import Surveyor
+
+
+FlatKey = Union[str, Course]
+
+# marks a value missing from a container while unflattening
+_MISSING = object()
+
+
+def flatten(
+    target: Any, surveyor: Optional[Surveyor] = None, exceptions: bool = True
+) -> Dict[str, Any]:
+    """
+    Converts a nested structure to a flat dict of ``str(course)``: value pairs.
+
+    :param target: data structure to flatten.
+    :param surveyor: surveyor used to traverse ``target``. Defaults to ``Surveyor()``.
+    :param exceptions: As :func:`Surveyor.chart`.
+    :return: ``dict`` with a key for every end point of ``target``.
+
+    :raises NonNavigableError: As :func:`Surveyor.chart`.
+    :raises SuppressedErrors: As :func:`Surveyor.chart`.
+
+    >>> from gemma import flatten
+    >>>
+    >>> flatten({"a": {"b": [1, 2]}, "c": None, "d": []})
+    {'[a]/[b]/[0]': 1, '[a]/[b]/[1]': 2, '[c]': None, '[d]': []}
+
+    Only end points, and containers with nothing in them, are included, since every
+    other value can be rebuilt from its contents by :func:`unflatten`. Keys are built
+    from :func:`Surveyor.survey_events`, so no courses are created.
+    """
+    if surveyor is None:
+        surveyor = Surveyor()
+
+    return dict(surveyor._flat_items(target, exceptions, keep_empty=True))
+
+
+def unflatten(
+    flat: Union[Mapping[str, Any], Iterable[Tuple[FlatKey, Any]]],
+    root: Any = None,
+    course_type: Type[Course] = Course,
+) -> Any:
+    """
+    Rebuilds a nested structure from a flat dict of course: value pairs, like the ones
+    returned by :func:`flatten`.
+
+    :param flat: ``dict`` of course strings to values, or an iterable of
+        (course, value) pairs, where courses are strings or :class:`Course` objects.
+    :param root: object to place values on. Defaults to a new ``list`` if the first
+        bearing of the first key is an index, and a new ``dict`` otherwise.
+    :param course_type: course class used to cast key strings.
+    :return: ``root``, with every value placed.
+    :raises ValueError: if a key is an empty course.
+    :raises NullNameError: if a value cannot be placed.
+
+    >>> from gemma import unflatten
+    >>>
+    >>> unflatten({'[a]/[b]/[0]': 1, '[a]/[b]/[1]': 2, '[c]': None, '[d]': []})
+    {'a': {'b': [1, 2]}, 'c': None, 'd': []}
+
+    Missing containers are created on the way: a ``list`` if the bearing that follows
+    is an :class:`Item` or :class:`Fallback` with an ``int`` name, or a name made of
+    digits, and a ``dict`` otherwise. Since keys are strings, a missing ``dict`` whose
+    keys are all digits is rebuilt as a ``list``. Lists are grown in one step to fit an
+    index, filling any gap with ``None``. Values are placed on existing objects, like
+    a dataclass passed as ``root``, through the bearings themselves.
+
+    Each distinct key segment is cast to a bearing once. Keys that share a prefix with
+    the key before them, as the keys from :func:`flatten` do, reuse the containers
+    found for that prefix.
+    """
+    cast_cache: Dict[str, BearingAbstract] = dict()
+
+    last_bearings: Tuple[BearingAbstract, ...] = tuple()
+    last_nodes: List[Any] = [root]
+
+    pairs = flat.items() if isinstance(flat, Mapping) else flat
+    for key, value in pairs:
+        bearings = _key_bearings(key, course_type, cast_cache)
+        if not bearings:
+            raise ValueError("cannot unflatten an empty course")
+
+        if root is None:
+            root = list() if _index(bearings[0]) is not None else dict()
+            last_nodes = [root]
+
+        # bearings from the cache are shared, so a common prefix can be found by
+        #   identity.
+        common = 0
+        limit = min(len(last_bearings), len(bearings)) - 1
+        while common < limit and last_bearings[common] is bearings[common]:
+            common += 1
+
+        nodes = last_nodes[: common + 1]
+        node = nodes[-1]
+        for i in range(common, len(bearings) - 1):
+            node = _child(node, bearings[i], bearings[i + 1])
+            nodes.append(node)
+
+        _place(node, bearings[-1], value)
+        last_bearings, last_nodes = bearings, nodes
+
+    return root
+
+
+def _key_bearings(
+    key: FlatKey, course_type: Type[Course], cast_cache: Dict[str, BearingAbstract]
+) -> Tuple[BearingAbstract, ...]:
+    """bearings of ``key``, casting each string segment only once"""
+    if isinstance(key, Course):
+        return key._bearings
+
+    bearings: List[BearingAbstract] = list()
+    for segment in key.split("/"):
+        if segment == "":
+            continue
+        try:
+            bearings.append(cast_cache[segment])
+        except KeyError:
+            this_bearing = course_type(segment)[0]
+            cast_cache[segment] = this_bearing
+            bearings.append(this_bearing)
+
+    return tuple(bearings)
+
+
+def _index(this_bearing: BearingAbstract) -> Optional[int]:
+    """list index ``this_bearing`` addresses, or None if it is not an index"""
+    if type(this_bearing) is not Item and not isinstance(this_bearing, Fallback):
+        return None
+
+    name = this_bearing.name
+    if isinstance(name, int):
+        return name
+    if isinstance(name, str) and name.isdigit():
+        return int(name)
+    return None
+
+
+def _fetch(node: Any, this_bearing: BearingAbstract) -> Any:
+    """value at ``this_bearing`` of ``node``, or _MISSING"""
+    if type(node) is list:
+        index = _index(this_bearing)
+        if index is not None:
+            return node[index] if index < len(node) else _MISSING
+    elif type(node) is dict and _is_key(this_bearing):
+        return node.get(this_bearing.name, _MISSING)
+
+    try:
+        return this_bearing.fetch(node)
+    except NullNameError:
+        return _MISSING
+
+
+def _place(node: Any, this_bearing: BearingAbstract, value: Any) -> None:
+    if type(node) is list:
+        index = _index(this_bearing)
+        if index is not None:
+            if index >= len(node):
+                node.extend([None] * (index + 1 - len(node)))
+            node[index] = value
+            return
+    elif type(node) is dict and _is_key(this_bearing):
+        node[this_bearing.name] = value
+        return
+
+    this_bearing.place(node, value)
+
+
+def _is_key(this_bearing: BearingAbstract) -> bool:
+    return type(this_bearing) is Item or isinstance(this_bearing, Fallback)
+
+
+def _child(
+    node: Any, this_bearing: BearingAbstract, next_bearing: BearingAbstract
+) -> Any:
+    """value at ``this_bearing`` of ``node``, created if it is missing or None"""
+    child = _fetch(node, this_bearing)
+    if child is _MISSING or child is None:
+        child = list() if _index(next_bearing) is not None else dict()
+        _place(node, this_bearing, child)
+    return child
@@ -0,0 +1,298 @@
+import builtins
+import json
+from typing import Any, Callable, Dict, Iterable, List, Type, Union
+
+from ._bearings import BearingAbstract, AdaptiveFallback, Call, Fallback, Where
+from ._cartogrpaher import Coordinate
+from ._wildcards import RecursiveWildcard, Wildcard
+from ._cleaners import _cleaner_name
+from ._course import Course
+from ._flags import NO_DEFAULT
+
+
+FORMAT_VERSION = 1
+
+# one Course, as text or a list of bearings
+_CourseData = Union[str, List[Dict[str, Any]]]
+
+_CLEANER_FIELDS = ("clean_org", "clean_dst", "clean_value")
+
+
+def dump_coordinates(coordinates: Iterable[Coordinate], **json_kwargs: Any) -> str:
+    """
+    Serializes coordinates to JSON.
+
+    :param coordinates: coordinates to serialize.
+    :param json_kwargs: passed to ``json.dumps``, like ``indent``.
+    :return: JSON text, to be read by :func:`load_coordinates`.
+    :raises ValueError: if a cleaner is a function that is not registered with
+        :func:`register_cleaner`, or a bearing has a factory that is not a builtin
+        type.
+    :raises TypeError: if a default, or an argument of a :class:`Call` bearing, cannot
+        be written as JSON.
+
+    >>> from gemma import Coordinate, PORT, dump_coordinates, load_coordinates
+    >>>
+    >>> coords = [Coordinate(PORT / "a" / 0, PORT / "b", default=None)]
+    >>> text = dump_coordinates(coords)
+    >>> load_coordinates(text)[0].org
+    <Course: <Fallback: 'a'> / <Item: 0>>
+
+    Courses are written as text when casting the text gives back the same bearings,
+    and as a list of bearing types and names otherwise, so an ``Item(0)`` does not
+    come back as ``Item("0")``. The list keeps the arguments of :class:`Call`
+    bearings, including ``Call.VALUE_ARG``, and whether :class:`Where` bearings are
+    indexed. Cleaners are written as the names they are registered as.
+    """
+    data = [_coordinate_data(x) for x in coordinates]
+    return json.dumps({"version": FORMAT_VERSION, "coordinates": data}, **json_kwargs)
+
+
+def load_coordinates(text: str, course_type: Type[Course] = Course) -> List[Coordinate]:
+    """
+    Reads coordinates written by :func:`dump_coordinates`.
+
+    :param text: JSON text.
+    :param course_type: course class to cast courses with. Bearing types are looked
+        up in its ``BEARINGS`` and ``BEARINGS_EXTENSION``, along with the types that
+        are only ever constructed explicitly, like :class:`Where`.
+    :return: list of :class:`Coordinate`, with cleaners referred to by name.
+    :raises ValueError: if the format version or a bearing type is unknown.
+    """
+    data = json.loads(text)
+    if data.get("version") != FORMAT_VERSION:
+        raise ValueError(f"unknown coordinate format version {data.get('version')}")
+
+    bearing_types = {
+        x.__name__: x
+        for x in [AdaptiveFallback, Fallback, Where, Wildcard, RecursiveWildcard]
+        + course_type.BEARINGS
+        + course_type.BEARINGS_EXTENSION
+    }
+
+    return [
+        _load_coordinate(x, course_type, bearing_types) for x in data["coordinates"]
+    ]
+
+
+def _coordinate_data(coord: Coordinate) -> Dict[str, Any]:
+    data: Dict[str, Any] = {"org": _courses_data(coord.org)}
+    if coord.dst is not None:
+        data["dst"] = _courses_data(coord.dst)
+
+    for field_name in _CLEANER_FIELDS:
+        cleaner = getattr(coord, field_name)
+        if cleaner is None:
+            continue
+        if not isinstance(cleaner, str):
+            name = _cleaner_name(cleaner)
+            if name is None:
+                raise ValueError(
+                    f"{field_name} {repr(cleaner)} must be registered with "
+                    f"register_cleaner() to be serialized"
+                )
+            cleaner = name
+        data[field_name] = cleaner
+
+    if coord.default is not NO_DEFAULT:
+        default = coord.default
+        if isinstance(coord.org, tuple):
+            # NO_DEFAULT has no JSON form, so origins without a default are flagged.
+            data["no_default"] = [x is NO_DEFAULT for x in default]
+            default = [None if x is NO_DEFAULT else x for x in default]
+        data["default"] = default
+
+    return data
+
+
+def _courses_data(courses: Union[Course, tuple]) -> Any:
+    if isinstance(courses, tuple):
+        return {"courses": [_course_data(x) for x in courses]}
+    return _course_data(courses)
+
+
+def _course_data(course: Course) -> _CourseData:
+    """course as text if it casts back to the same bearings, otherwise a list"""
+    text = str(course)
+    try:
+        cast = type(course)(text)
+    except Exception:
+        cast = None
+
+    if cast is not None and _same_bearings(course, cast):
+        return text
+
+    return [_bearing_data(x) for x in course]
+
+
+def _same_bearings(course: Course, other: Course) -> bool:
+    if len(course) != len(other):
+        return False
+
+    for this_bearing, other_bearing in zip(course, other):
+        if type(this_bearing) is not type(other_bearing):
+            return False
+        if type(this_bearing.name) is not type(other_bearing.name):
+            return False
+        if this_bearing.name != other_bearing.name:
+            return False
+        if this_bearing.factory_type is not None:
+            return False
+        if _bearing_options(this_bearing):
+            return False
+
+    return True
+
+
+def _bearing_data(bearing_obj: BearingAbstract) -> Dict[str, Any]:
+    data: Dict[str, Any] = {
+        "type": type(bearing_obj).__name__,
+        "name": bearing_obj.name,
+    }
+
+    factory = bearing_obj.factory_type
+    if factory is not None:
+        if getattr(builtins, factory.__name__, None) is not factory:
+            raise ValueError(
+                f"factory {repr(factory)} of {repr(bearing_obj)} is not a builtin type"
+            )
+        data["factory"] = factory.__name__
+
+    data.update(_bearing_options(bearing_obj))
+    return data
+
+
+def _bearing_options(bearing_obj: BearingAbstract) -> Dict[str, Any]:
+    """constructor options of a bearing that its text does not carry"""
+    data: Dict[str, Any] = dict()
+
+    if isinstance(bearing_obj, Call):
+        args = bearing_obj._func_args
+        kwargs = bearing_obj._func_kwargs
+        # VALUE_ARG has no JSON form, so the arguments it stands in for are flagged.
+        if args:
+            data["func_args"] = [None if x is Call.VALUE_ARG else x for x in args]
+            data["value_args"] = [x is Call.VALUE_ARG for x in args]
+        if kwargs:
+            data["func_kwargs"] = {
+                k: None if v is Call.VALUE_ARG else v for k, v in kwargs.items()
+            }
+            data["value_kwargs"] = [k for k, v in kwargs.items() if v is Call.VALUE_ARG]
+
+    elif isinstance(bearing_obj, Where):
+        data["indexed"] = bearing_obj._indexed
+
+    return data
+
+
+def _load_coordinate(
+    data: Dict[str, Any],
+    course_type: Type[Course],
+    bearing_types: Dict[str, Type[BearingAbstract]],
+) -> Coordinate:
+    kwargs: Dict[str, Any] = {
+        "org": _load_courses(data["org"], course_type, bearing_types)
+    }
+    if "dst" in data:
+        kwargs["dst"] = _load_courses(data["dst"], course_type, bearing_types)
+
+    for field_name in _CLEANER_FIELDS:
+        if field_name in data:
+            kwargs[field_name] = data[field_name]
+
+    if "default" in data:
+        default = data["default"]
+        if "no_default" in data:
+            default = tuple(
+                NO_DEFAULT if missing else value
+                for value, missing in zip(default, data["no_default"])
+            )
+        kwargs["default"] = default
+
+    return Coordinate(**kwargs)
+
+
+def _load_courses(
+    data: Any,
+    course_type: Type[Course],
+    bearing_types: Dict[str, Type[BearingAbstract]],
+) -> Union[Course, tuple]:
+    if isinstance(data, dict):
+        return tuple(
+            _load_course(x, course_type, bearing_types) for x in data["courses"]
+        )
+    return _load_course(data, course_type, bearing_types)
+
+
+def _load_course(
+    data: _CourseData,
+    course_type: Type[Course],
+    bearing_types: Dict[str, Type[BearingAbstract]],
+) -> Course:
+    if isinstance(data, str):
+        return course_type(data)
+
+    bearings: List[BearingAbstract] = list()
+    for bearing_data in data:
+        try:
+            bearing_type = bearing_types[bearing_data["type"]]
+        except KeyError:
+            raise ValueError(f"unknown bearing type {repr(bearing_data['type'])}")
+
+        name = bearing_data["name"]
+        # JSON has no tuples, and lists cannot be bearing names.
+        if isinstance(name, list):
+            name = tuple(name)
+
+        kwargs = {
+            key: load(bearing_data)
+            for key, load in _OPTION_LOADERS.items()
+            if key in bearing_data
+        }
+        new_bearing = bearing_type(name, **kwargs)
+
+        if isinstance(new_bearing, Fallback):
+            # cast fallbacks try the bearing classes of the course type.
+            new_bearing.BEARING_CLASSES = _fallback_classes(course_type)
+        bearings.append(new_bearing)
+
+    return course_type._from_bearings(tuple(bearings))
+
+
+def _load_factory(bearing_data: Dict[str, Any]) -> Any:
+    return getattr(builtins, bearing_data["factory"])
+
+
+def _load_func_args(bearing_data: Dict[str, Any]) -> List[Any]:
+    return [
+        Call.VALUE_ARG if is_value else x
+        for x, is_value in zip(bearing_data["func_args"], bearing_data["value_args"])
+    ]
+
+
+def _load_func_kwargs(bearing_data: Dict[str, Any]) -> Dict[str, Any]:
+    func_kwargs = bearing_data["func_kwargs"]
+    for key in bearing_data["value_kwargs"]:
+        func_kwargs[key] = Call.VALUE_ARG
+    return func_kwargs
+
+
+def _load_indexed(bearing_data: Dict[str, Any]) -> bool:
+    return bearing_data["indexed"]
+
+
+# field of bearing data -> loader of the bearing keyword argument of the same name.
+_OPTION_LOADERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "factory": _load_factory,
+    "func_args": _load_func_args,
+    "func_kwargs": _load_func_kwargs,
+    "indexed": _load_indexed,
+}
+
+
+def _fallback_classes(course_type: Type[Course]) -> List[Type[BearingAbstract]]:
+    """BEARING_CLASSES of the fallbacks ``course_type`` casts text to"""
+    sample = course_type("name")[0]
+    if isinstance(sample, Fallback):
+        return sample.BEARING_CLASSES
+    return Fallback.BEARING_CLASSES
@@ -1,12 +1,34 @@
-from typing import List, Any
+from typing import List, Any, Dict, Iterable, Iterator, NamedTuple, Sequence
 
 from ._compass import Compass, Optional, Generator, Type, Tuple, Union
+from ._compass import DEFAULT_COMPASSES, DEFAULT_END_POINTS
+from ._bearings import BearingAbstract
 from ._course import Course
-from ._exceptions import NonNavigableError, SuppressedErrors
+from ._chart import Chart, IndexedChart
+from ._columns import Columns, _ColumnBuilder, _check_output
+from ._exceptions import NonNavigableError, NullNameError, SuppressedErrors
 
 
-DEFAULT_COMPASSES: List[Compass] = [Compass()]
-DEFAULT_END_POINTS: Tuple[Type, ...] = (str, int, float, type)
+class SurveyEvent(NamedTuple):
+    """
+    Event yielded by :func:`Surveyor.survey_events`.
+    """
+
+    event: str
+    """``"enter"``, ``"leave"`` or ``"leaf"``."""
+    depth: int
+    """Number of bearings from the root to ``value``. Top-level values are ``1``."""
+    bearing: BearingAbstract
+    """Bearing from the parent value to ``value``."""
+    value: Any
+    """Value the event is for."""
+    course: Optional[Course] = None
+    """Course from the root to ``value``, only set when courses are requested."""
+
+
+EVENT_ENTER = "enter"
+EVENT_LEAVE = "leave"
+EVENT_LEAF = "leaf"
 
 
 class Surveyor:
@@ -156,3 +178,311 @@ class Surveyor:
             raise error
 
         return chart
+
+    def chart_compact(self, target: Any, exceptions: bool = True) -> Chart:
+        """
+        As :func:`Surveyor.chart`, but returns a :class:`Chart`, which stores courses
+        compactly, and does not create a :class:`Course` per node while charting.
+
+        :param target: data structure to chart
+        :param exceptions: As :func:`Surveyor.chart`.
+
+        :return: :class:`Chart` of (:class:`Course`, value) pairs, in the same order
+            as :func:`Surveyor.chart_iter`.
+
+        :raises NonNavigableError: As :func:`Surveyor.chart`.
+        :raises SuppressedErrors: As :func:`Surveyor.chart`. The partial chart in
+            ``SuppressedErrors.chart_partial`` is a :class:`Chart`.
+        """
+        chart = Chart(course_type=self._course_type)
+        exception_list: List[NonNavigableError] = list()
+
+        self._chart_compact_layer(target, -1, chart, exceptions, exception_list)
+
+        if exception_list:
+            error = SuppressedErrors("some objects could not be charted")
+            error.errors.extend(exception_list)
+            error.chart_partial = chart
+            raise error
+
+        return chart
+
+    def _chart_compact_layer(
+        self,
+        target: Any,
+        parent: int,
+        chart: Chart,
+        exceptions: bool,
+        exception_list: List[NonNavigableError],
+    ) -> None:
+        """As :func:`Surveyor._chart_layer`, adding nodes to ``chart``"""
+        try:
+            compass = self._choose_compass(target)
+        except NonNavigableError as error:
+            if exceptions:
+                raise error
+            exception_list.append(error)
+            return
+
+        for bearing, value in compass.bearings_iter(target):
+            position = chart.add(parent, bearing, value)
+
+            if value is None or isinstance(value, self._end_points):
+                continue
+
+            self._chart_compact_layer(
+                value, position, chart, exceptions, exception_list
+            )
+
+    def chart_indexed(self, target: Any, exceptions: bool = True) -> IndexedChart:
+        """
+        As :func:`Surveyor.chart`, but returns an :class:`IndexedChart`, built from
+        :func:`Surveyor.survey_events` as the structure is traversed.
+
+        :param target: data structure to chart
+        :param exceptions: As :func:`Surveyor.chart`.
+
+        :return: :class:`IndexedChart` of (:class:`Course`, value) pairs.
+
+        :raises NonNavigableError: As :func:`Surveyor.chart`.
+        :raises SuppressedErrors: As :func:`Surveyor.chart`. The partial chart in
+            ``SuppressedErrors.chart_partial`` is an :class:`IndexedChart`.
+        """
+        chart = IndexedChart(course_type=self._course_type)
+
+        try:
+            chart._add_events(self.survey_events(target, exceptions=exceptions))
+        except SuppressedErrors as error:
+            error.chart_partial = chart
+            raise error
+
+        return chart
+
+    def survey_events(
+        self, target: Any, exceptions: bool = True, courses: bool = False
+    ) -> Generator[SurveyEvent, None, None]:
+        """
+        Traverses data structure as a stream of :class:`SurveyEvent` records, without
+        creating a :class:`Course` per value.
+
+        :param target: data structure to traverse
+        :param exceptions: As :func:`Surveyor.chart_iter`.
+        :param courses: set :attr:`SurveyEvent.course` on each event. Off by default,
+            since it creates the courses the event stream otherwise avoids.
+
+        :return: yields :class:`SurveyEvent` records, depth first.
+
+        :raises NonNavigableError: As :func:`Surveyor.chart_iter`.
+        :raises SuppressedErrors: As :func:`Surveyor.chart_iter`. Values that could not
+            be navigated are yielded as ``"leaf"`` events.
+
+        Values that are ``None`` or an end point yield a ``"leaf"`` event. Every other
+        value yields an ``"enter"`` event, followed by the events of its contents, and
+        a ``"leave"`` event. ``"enter"`` and ``"leaf"`` events are yielded for the same
+        values, in the same order, as :func:`Surveyor.chart_iter` yields pairs.
+
+        >>> from gemma import Surveyor
+        >>>
+        >>> data = {"a": 1, "b": {"c": 2}}
+        >>> for event in Surveyor().survey_events(data):
+        ...     print(event.event, event.depth, event.bearing, event.value)
+        ...
+        leaf 1 [a] 1
+        enter 1 [b] {'c': 2}
+        leaf 2 [c] 2
+        leave 1 [b] {'c': 2}
+
+        The root ``target`` itself does not have events.
+        """
+        exception_list: List[NonNavigableError] = list()
+        root_course = self._course_type() if courses else None
+
+        try:
+            compass = self._choose_compass(target)
+        except NonNavigableError as error:
+            if exceptions:
+                raise error
+            exception_list.append(error)
+        else:
+            yield from self._survey_events(
+                target, compass, root_course, exceptions, exception_list
+            )
+
+        if exception_list:
+            to_raise = SuppressedErrors("some objects could not be surveyed")
+            to_raise.errors.extend(exception_list)
+            raise to_raise
+
+    def _survey_events(
+        self,
+        target: Any,
+        compass: Compass,
+        root_course: Optional[Course],
+        exceptions: bool,
+        exception_list: List[NonNavigableError],
+    ) -> Generator[SurveyEvent, None, None]:
+        """
+        Walks ``target`` with an explicit stack, so the cost of each event does not
+        grow with depth, as nested generators would.
+        """
+        from_bearings = self._course_type._from_bearings
+        end_points = self._end_points
+
+        # stack of (contents, event the frame was entered with, course).
+        stack: List[
+            Tuple[
+                Iterator[Tuple[BearingAbstract, Any]],
+                Optional[SurveyEvent],
+                Optional[Course],
+            ]
+        ] = [
+            (compass.bearings_iter(target), None, root_course)
+        ]
+
+        while stack:
+            contents, entered, parent_course = stack[-1]
+            depth = len(stack)
+
+            for bearing, value in contents:
+                course = None
+                if parent_course is not None:
+                    course = from_bearings(parent_course._bearings + (bearing,))
+
+                if value is None or isinstance(value, end_points):
+                    yield SurveyEvent(EVENT_LEAF, depth, bearing, value, course)
+                    continue
+
+                try:
+                    compass = self._choose_compass(value)
+                except NonNavigableError as error:
+                    if exceptions:
+                        raise error
+                    exception_list.append(error)
+                    yield SurveyEvent(EVENT_LEAF, depth, bearing, value, course)
+                    continue
+
+                event = SurveyEvent(EVENT_ENTER, depth, bearing, value, course)
+                yield event
+                stack.append((compass.bearings_iter(value), event, course))
+                break
+            else:
+                stack.pop()
+                if entered is not None:
+                    yield entered._replace(event=EVENT_LEAVE)
+
+    def to_columns(
+        self, records: Iterable[Any], output: str = "list", exceptions: bool = True
+    ) -> Columns:
+        """
+        Pivots a sequence of records into one column per course, streaming through the
+        records without charting them.
+
+        :param records: iterable of data structures, like a list of dicts.
+        :param output: type of the columns and masks returned:
+
+            - ``"list"``: ``list`` columns and ``list`` of ``bool`` masks.
+            - ``"array"``: ``array.array`` columns of typecode ``"q"`` when every value
+              is an ``int``, or ``"d"`` when every value is an ``int`` or ``float``.
+              Other columns are left as lists. Masks are ``array.array("B")``.
+            - ``"numpy"``: ``int64`` or ``float64`` arrays for numeric columns,
+              ``object`` arrays otherwise, and ``bool`` masks.
+
+        :param exceptions: As :func:`Surveyor.chart`.
+
+        :return: :class:`Columns` mapping of ``str(course)`` to column.
+
+        :raises ValueError: if ``output`` is unknown, or a record has two courses with
+            the same string.
+        :raises ImportError: if ``output`` is ``"numpy"`` and numpy is not installed.
+        :raises NonNavigableError: As :func:`Surveyor.chart`.
+        :raises SuppressedErrors: As :func:`Surveyor.chart`, once every record has been
+            read. No partial chart is set.
+
+        >>> from gemma import Surveyor
+        >>>
+        >>> records = [{"a": 1, "b": {"c": "x"}}, {"a": 2}, {"a": 3, "b": {"c": "z"}}]
+        >>> columns = Surveyor().to_columns(records)
+        >>> columns["[a]"], columns["[b]/[c]"]
+        ([1, 2, 3], ['x', None, 'z'])
+        >>> columns.mask("[b]/[c]")
+        [False, True, False]
+
+        A column is added the first time its course is found, with earlier records
+        marked missing. A value is masked when its record has nothing at the course,
+        or the value is ``None``. Missing values are ``None`` in list and object
+        columns, ``0`` in integer columns and ``nan`` in float columns.
+
+        Only end points are columns: values that are containers, like the ``dict`` at
+        ``"[b]"`` above, are not.
+
+        Courses with the same string, like ``Item(1)`` and ``Item("1")``, share a
+        column. A record with values at more than one of them cannot fit in a row, and
+        raises ``ValueError``.
+        """
+        _check_output(output)
+
+        builders: Dict[str, _ColumnBuilder] = dict()
+        exception_list: List[Union[NullNameError, NonNavigableError]] = list()
+        rows = 0
+
+        for record in records:
+            try:
+                for key, value in self._flat_items(record, exceptions, False):
+                    try:
+                        builder = builders[key]
+                    except KeyError:
+                        builder = _ColumnBuilder(rows)
+                        builders[key] = builder
+                    else:
+                        builder.pad(rows)
+                        if len(builder.values) > rows:
+                            raise ValueError(
+                                f"record {rows} has more than one course {key}"
+                            )
+                    builder.add(value)
+            except SuppressedErrors as error:
+                exception_list.extend(error.errors)
+            rows += 1
+
+        columns: Dict[str, Sequence] = dict()
+        masks: Dict[str, Sequence] = dict()
+        for key, builder in builders.items():
+            builder.pad(rows)
+            columns[key] = builder.build(output)
+            masks[key] = builder.build_mask(output)
+
+        if exception_list:
+            to_raise = SuppressedErrors("some objects could not be surveyed")
+            to_raise.errors.extend(exception_list)
+            raise to_raise
+
+        return Columns(columns, masks, rows)
+
+    def _flat_items(
+        self, target: Any, exceptions: bool, keep_empty: bool
+    ) -> Generator[Tuple[str, Any], None, None]:
+        """
+        Yields ``str(course)``, value pairs for the end points of ``target``, built from
+        :func:`Surveyor.survey_events`. When ``keep_empty`` is set, containers with
+        nothing in them are yielded as well.
+        """
+        # keys of the entered values, and whether anything was found in them.
+        keys: List[str] = [""]
+        empty: List[bool] = [False]
+
+        for event in self.survey_events(target, exceptions=exceptions):
+            if event.event == EVENT_LEAVE:
+                key = keys.pop()
+                if empty.pop() and keep_empty:
+                    yield key, event.value
+                continue
+
+            empty[-1] = False
+            parent_key = keys[-1]
+            key = f"{parent_key}/{event.bearing}" if parent_key else str(event.bearing)
+
+            if event.event == EVENT_ENTER:
+                keys.append(key)
+                empty.append(True)
+            else:
+                yield key, event.value
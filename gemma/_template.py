@@ -0,0 +1,376 @@
+import keyword
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from ._bearings import BearingAbstract, Attr, Item, Fallback
+from ._course import Course
+from ._exceptions import NullNameError
+from ._flags import NO_DEFAULT
+
+
+PLACEHOLDER_REGEX = re.compile(r"{([A-Za-z]\w*)(?::(\w+))?}")
+PLACEHOLDER_TYPES: Dict[str, Callable[[Any], Any]] = {
+    "int": int,
+    "float": float,
+    "str": str,
+}
+
+# stands in for a placeholder when casting a segment, to find its bearing type.
+_MARKER = "gemma_placeholder_marker"
+# placeholder names that would collide with the signature of compiled fetches.
+_RESERVED = {"default"}
+
+
+class _Segment(NamedTuple):
+    """One ``/`` separated part of a template"""
+
+    text: str
+    # bearings of a segment without placeholders.
+    bearings: Tuple[BearingAbstract, ...]
+    # names and converters of the placeholders in the segment, in order.
+    placeholders: Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...]
+    # bearing with _MARKER for a name, when the segment is a single placeholder that
+    #   becomes the whole bearing name. Bound by replacing the name.
+    sample: Optional[BearingAbstract]
+
+
+class CourseTemplate:
+    def __init__(self, template: str, course_type: Type[Course] = Course):
+        """
+        Course with placeholders, parsed once and bound to values many times.
+
+        :param template: course string containing ``{name}`` or ``{name:type}``
+            placeholders.
+        :param course_type: :class:`Course` subclass used to cast the template and to
+            return bound courses.
+        :raises ValueError: if a placeholder type is unknown, or a placeholder name is
+            reserved.
+
+        >>> from gemma import CourseTemplate
+        >>>
+        >>> template = CourseTemplate("rows/[{i:int}]/value")
+        >>> template.bind(i=1)
+        <Course: <Fallback: 'rows'> / <Item: 1> / <Fallback: 'value'>>
+        >>> template.fetch({"rows": [{"value": "a"}, {"value": "b"}]}, 1)
+        'b'
+
+        Placeholder types are the keys of ``gemma._template.PLACEHOLDER_TYPES``:
+        ``int``, ``float`` and ``str``. Untyped placeholders are bound to the value
+        passed, unchanged.
+
+        Segments without placeholders are cast once, when the template is created.
+        A segment that is a single placeholder, inside of any shorthand, like
+        ``"[{key}]"``, ``"@{attr}"`` or ``"{name}"``, is bound by creating its bearing
+        type directly with the value. Any other segment, like ``"row_{i}"``, has its
+        values substituted into the text, and is cast normally.
+        """
+        self._template: str = template
+        self._course_type: Type[Course] = course_type
+        self._segments: Tuple[_Segment, ...] = tuple(
+            self._parse_segment(x) for x in template.split("/") if x != ""
+        )
+
+        names: List[str] = list()
+        for segment in self._segments:
+            for name, _ in segment.placeholders:
+                if name not in names:
+                    names.append(name)
+        self._placeholders: Tuple[str, ...] = tuple(names)
+
+    def __repr__(self) -> str:
+        return f"<CourseTemplate: {repr(self._template)}>"
+
+    def __str__(self) -> str:
+        return self._template
+
+    @property
+    def placeholders(self) -> Tuple[str, ...]:
+        """
+        Read-only property.
+
+        :return: placeholder names, in the order they are first used. This is the
+            order of positional arguments to :func:`CourseTemplate.bind`.
+        """
+        return self._placeholders
+
+    def bind(self, *args: Any, **kwargs: Any) -> Course:
+        """
+        Creates a course with each placeholder replaced by a value.
+
+        :param args: placeholder values, in the order of
+            :func:`CourseTemplate.placeholders`.
+        :param kwargs: placeholder values by name.
+        :return: course of ``course_type``.
+        :raises TypeError: if a placeholder has no value.
+        """
+        values = self._values(args, kwargs)
+
+        bearings: Tuple[BearingAbstract, ...] = tuple()
+        for segment in self._segments:
+            bearings += self._bind_segment(segment, values)
+
+        return self._course_type._from_bearings(bearings)
+
+    def fetch(
+        self, target: Any, *args: Any, default: Any = NO_DEFAULT, **kwargs: Any
+    ) -> Any:
+        """
+        Shorthand for ``template.bind(*args, **kwargs).fetch(target, default=default)``
+        """
+        return self.bind(*args, **kwargs).fetch(target, default=default)
+
+    def place(self, target: Any, value: Any, *args: Any, **kwargs: Any) -> None:
+        """
+        Shorthand for ``template.bind(*args, **kwargs).place(target, value)``
+        """
+        self.bind(*args, **kwargs).place(target, value)
+
+    def compile(self) -> Callable[..., Any]:
+        """
+        Generates a fetch function specialized to this template.
+
+        :return: function with the signature
+            ``fetch(target, <placeholders>, *, default=NO_DEFAULT)``
+
+        >>> from gemma import CourseTemplate
+        >>>
+        >>> fetch_value = CourseTemplate("rows/[{i:int}]/value").compile()
+        >>> fetch_value({"rows": [{"value": "a"}, {"value": "b"}]}, 1)
+        'b'
+
+        No course is created when the function is called. :class:`Item` bearings, and
+        :class:`Fallback` bearings that try :class:`Item` first, become a subscript.
+        :class:`Attr` bearings become ``getattr()``. When one of these fails, the
+        rest of the fetch is handed to the bearings themselves, so errors, defaults
+        and the other types a :class:`Fallback` tries behave as :func:`Course.fetch`.
+
+        Other bearings are called through their ``fetch()`` method.
+
+        The inlined subscripts and ``getattr()`` calls do not check for
+        ``__gemma_fetch__`` hooks (see :ref:`protocol-hooks`) on objects that also
+        support them natively.
+        """
+        return _compile_fetch(self)
+
+    def _values(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if len(args) > len(self._placeholders):
+            raise TypeError(
+                f"{repr(self)} takes {len(self._placeholders)} values, "
+                f"{len(args)} given"
+            )
+
+        values = dict(zip(self._placeholders, args))
+        values.update(kwargs)
+
+        for name in self._placeholders:
+            if name not in values:
+                raise TypeError(f"{repr(self)} missing value for {repr(name)}")
+
+        return values
+
+    def _bind_segment(
+        self, segment: _Segment, values: Dict[str, Any]
+    ) -> Tuple[BearingAbstract, ...]:
+        if not segment.placeholders:
+            return segment.bearings
+
+        if segment.sample is not None:
+            name, convert = segment.placeholders[0]
+            value = values[name]
+            if convert is not None:
+                value = convert(value)
+            return (_bind_sample(segment.sample, value),)
+
+        text = segment.text
+        for name, convert in segment.placeholders:
+            value = values[name]
+            if convert is not None:
+                value = convert(value)
+            text = PLACEHOLDER_REGEX.sub(lambda _: str(value), text, count=1)
+
+        return self._course_type(text)._bearings
+
+    def _parse_segment(self, text: str) -> _Segment:
+        placeholders: List[Tuple[str, Optional[Callable[[Any], Any]]]] = list()
+        for match in PLACEHOLDER_REGEX.finditer(text):
+            name, type_name = match.group(1), match.group(2)
+            if name in _RESERVED or keyword.iskeyword(name):
+                raise ValueError(f"{repr(name)} cannot be used as a placeholder name")
+
+            convert = None
+            if type_name is not None:
+                try:
+                    convert = PLACEHOLDER_TYPES[type_name]
+                except KeyError:
+                    raise ValueError(f"unknown placeholder type {repr(type_name)}")
+
+            placeholders.append((name, convert))
+
+        if not placeholders:
+            bearings = self._course_type(text)._bearings
+            return _Segment(text, bearings, tuple(), None)
+
+        sample = None
+        if len(placeholders) == 1:
+            marked = self._course_type(PLACEHOLDER_REGEX.sub(_MARKER, text))
+            if len(marked) == 1 and marked[0].name == _MARKER:
+                sample = marked[0]
+
+        return _Segment(text, tuple(), tuple(placeholders), sample)
+
+
+def _bind_sample(sample: BearingAbstract, value: Any) -> BearingAbstract:
+    """creates a bearing of the same type as ``sample``, named ``value``"""
+    new = type(sample)(value)
+    if isinstance(sample, Fallback) and isinstance(new, Fallback):
+        new.BEARING_CLASSES = sample.BEARING_CLASSES
+    return new
+
+
+def _inline_kind(bearing_obj: BearingAbstract) -> Optional[str]:
+    """
+    "item" or "attr" if fetching the bearing can be written as a subscript or
+    getattr(), otherwise None.
+    """
+    kind = type(bearing_obj)
+    if kind is Item:
+        return "item"
+    if kind is Attr:
+        return "attr"
+    if kind is Fallback and isinstance(bearing_obj, Fallback):
+        return "item" if bearing_obj.BEARING_CLASSES[:1] == [Item] else None
+    return None
+
+
+class _FetchWriter:
+    """
+    Writes the body of a compiled fetch, one step per bearing. Every step is written
+    as ``_t_node = <expression>``. Steps that are inlined are wrapped so a failure
+    resumes the fetch from that step with the bearings of a bound course.
+    """
+
+    def __init__(self, template: CourseTemplate) -> None:
+        # every generated name, builtins included, starts with "_t_" so placeholders,
+        #   which must start with a letter, never shadow them.
+        self.namespace: Dict[str, Any] = {
+            "_t_no_default": NO_DEFAULT,
+            "_t_null_name_error": NullNameError,
+            "_t_exception": Exception,
+            "_t_getattr": getattr,
+            "_t_template": template,
+            "_t_resume": _resume,
+            "_t_bind_sample": _bind_sample,
+        }
+        self.lines: List[str] = list()
+        self.step: int = 0
+
+        # finishes the fetch with a bound course from bearing number {step} on.
+        values = ", ".join(f"{repr(x)}: {x}" for x in template.placeholders)
+        self._resume: str = (
+            "return _t_resume(_t_template, _t_node, {step}, "
+            f"{{{{{values}}}}}, default)"
+        )
+
+    def resume(self) -> str:
+        return self._resume.format(step=self.step)
+
+    def constant(self, value: Any) -> str:
+        constant_name = f"_t_const_{len(self.namespace)}"
+        self.namespace[constant_name] = value
+        return constant_name
+
+    def write_step(self, expression: str, inline: bool) -> None:
+        self.lines.append("    try:")
+        self.lines.append(f"        _t_node = {expression}")
+        if inline:
+            self.lines.append("    except _t_exception:")
+            self.lines.append("        " + self.resume())
+        else:
+            self.lines.append("    except _t_null_name_error:")
+            self.lines.append("        if default is _t_no_default:")
+            self.lines.append("            raise")
+            self.lines.append("        return default")
+        self.step += 1
+
+    def write_segment(self, segment: _Segment) -> bool:
+        """
+        Writes the steps of ``segment``. Returns ``False`` if the rest of the fetch
+        is resumed on a bound course instead.
+        """
+        if not segment.placeholders:
+            for this_bearing in segment.bearings:
+                if _inline_kind(this_bearing) is None:
+                    expression = f"{self.constant(this_bearing)}.fetch(_t_node)"
+                    self.write_step(expression, False)
+                else:
+                    name = self.constant(this_bearing.name)
+                    self.write_step(_inline_expression(this_bearing, name), True)
+            return True
+
+        name, convert = segment.placeholders[0]
+        value = name if convert is None else f"{self.constant(convert)}({name})"
+
+        if segment.sample is not None:
+            if _inline_kind(segment.sample) is None:
+                sample = self.constant(segment.sample)
+                expression = f"_t_bind_sample({sample}, {value}).fetch(_t_node)"
+                self.write_step(expression, False)
+            else:
+                self.write_step(_inline_expression(segment.sample, value), True)
+            return True
+
+        # segments that are substituted as text may cast to any number of bearings,
+        #   so the rest of the fetch is done on a bound course.
+        self.lines.append("    " + self.resume())
+        return False
+
+
+def _inline_expression(bearing_obj: BearingAbstract, name: str) -> str:
+    """source fetching ``name`` from ``_t_node`` as inlinable ``bearing_obj`` would"""
+    if _inline_kind(bearing_obj) == "item":
+        return f"_t_node[{name}]"
+    return f"_t_getattr(_t_node, {name})"
+
+
+def _compile_fetch(template: CourseTemplate) -> Callable[..., Any]:
+    """
+    Writes and execs the source of a fetch function for ``template``.
+    """
+    writer = _FetchWriter(template)
+    for segment in template._segments:
+        if not writer.write_segment(segment):
+            break
+    else:
+        writer.lines.append("    return _t_node")
+
+    params = "".join(f", {x}" for x in template.placeholders)
+    source = "\n".join(
+        [f"def fetch(_t_node{params}, *, default=_t_no_default):"] + writer.lines
+    )
+    exec(compile(source, f"<CourseTemplate {template}>", "exec"), writer.namespace)
+
+    fetch: Callable[..., Any] = writer.namespace["fetch"]
+    fetch.__doc__ = f"fetches {repr(str(template))}"
+    return fetch
+
+
+def _resume(
+    template: CourseTemplate,
+    node: Any,
+    step: int,
+    values: Dict[str, Any],
+    default: Any,
+) -> Any:
+    """finishes a compiled fetch from bearing number ``step`` of the bound course"""
+    course = template.bind(**values)
+    remaining = type(course)._from_bearings(course._bearings[step:])
+    return remaining.fetch(node, default=default)
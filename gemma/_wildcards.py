@@ -0,0 +1,189 @@
+import re
+from typing import Any, Generator, List, Optional, Tuple, Type, Union
+
+from ._bearings import BearingAbstract
+from ._compass import Compass, DEFAULT_COMPASSES, DEFAULT_END_POINTS
+from ._exceptions import NonNavigableError
+
+
+FanOutType = Generator[Tuple[Tuple[BearingAbstract, ...], Any], None, None]
+
+
+class Wildcard(BearingAbstract[str]):
+    REGEX = re.compile(r"(\*)$")
+    FAN_OUT = True
+    FALLBACK_CANDIDATE = False
+
+    def __new__(cls, name: str = "*", *args: Any, **kwargs: Any) -> "Wildcard":
+        return super().__new__(cls, name, *args, **kwargs)  # type: ignore
+
+    def __init__(
+        self,
+        name: str = "*",
+        compasses: Optional[List[Compass]] = None,
+        end_points: Optional[Union[Tuple[Type, ...], Type]] = None,
+    ):
+        """
+        Matches every key, index or attribute one level below a target.
+
+        :param name: ``"*"``
+        :param compasses: compasses used to list the bearings of a target. Defaults to
+            the same compasses as :class:`Surveyor`.
+        :param end_points: types that are never expanded. Defaults to the same end
+            points as :class:`Surveyor`.
+
+        **inherits from:** :class:`BearingAbstract`
+
+        **name types:** ``"*"`` only.
+
+        **shorthand:** ``"*"``, only for course types that list :class:`Wildcard` in
+        their ``BEARINGS``. :class:`Course` does not, so a ``"*"`` key stays a
+        :class:`Fallback` name; see :ref:`bearing-shorthand`.
+
+        A wildcard addresses many values, so it cannot be used with
+        :func:`Course.fetch` or :func:`Course.place`. Use :func:`Course.fetch_iter`,
+        which expands wildcards through :func:`Wildcard.fan_out`.
+
+        >>> from gemma import PORT, Wildcard
+        >>>
+        >>> data = {"users": [{"name": "ann"}, {"name": "bob"}, {"id": 3}]}
+        >>> names = PORT / "users" / Wildcard() / "name"
+        >>> for course, value in names.fetch_iter(data):
+        ...     print(course, value)
+        ...
+        users/[0]/name ann
+        users/[1]/name bob
+        """
+        super().__init__(name)
+
+        if compasses is None:
+            compasses = DEFAULT_COMPASSES
+        if end_points is None:
+            end_points = DEFAULT_END_POINTS
+
+        self._compasses: List[Compass] = compasses
+        self._end_points: Union[Tuple[Type, ...], Type] = end_points
+
+    def __str__(self) -> str:
+        return self.name
+
+    @classmethod
+    def is_compatible(cls, name: Any) -> bool:
+        """
+        Only ``"*"`` can be cast to a :class:`Wildcard`.
+        """
+        return name == "*"
+
+    def fetch(self, target: Any) -> Any:
+        """
+        Not supported.
+
+        :raises TypeError: always. Use :func:`Course.fetch_iter`.
+        """
+        raise TypeError(f"{repr(self)} matches many values, use Course.fetch_iter()")
+
+    def place(self, target: Any, value: Any, **kwargs: dict) -> None:
+        """
+        Not supported.
+
+        :raises TypeError: always.
+        """
+        raise TypeError(f"{repr(self)} matches many values, and cannot be placed")
+
+    def fan_out(self, target: Any) -> FanOutType:
+        """
+        Yields (bearings, value) pairs for every value this bearing matches on
+        ``target``.
+
+        :param target: object to expand.
+        :return: tuple of concrete bearings leading from ``target`` to each value,
+            and the value.
+
+        Bearings are supplied by the first of ``compasses`` that can navigate
+        ``target``. Targets that are ``None``, an end point, or that no compass can
+        navigate yield nothing.
+        """
+        for this_bearing, value in self._children(target):
+            yield (this_bearing,), value
+
+    def _children(
+        self, target: Any
+    ) -> Generator[Tuple[BearingAbstract, Any], None, None]:
+        """bearings and values one level below ``target``"""
+        if target is None or isinstance(target, self._end_points):
+            return
+
+        for compass in self._compasses:
+            if compass.is_navigable(target):
+                break
+        else:
+            return
+
+        try:
+            yield from compass.bearings_iter(target)
+        except NonNavigableError:
+            return
+
+
+class RecursiveWildcard(Wildcard):
+    REGEX = re.compile(r"(\*\*)$")
+
+    def __new__(
+        cls, name: str = "**", *args: Any, **kwargs: Any
+    ) -> "RecursiveWildcard":
+        return super().__new__(cls, name, *args, **kwargs)  # type: ignore
+
+    def __init__(
+        self,
+        name: str = "**",
+        compasses: Optional[List[Compass]] = None,
+        end_points: Optional[Union[Tuple[Type, ...], Type]] = None,
+    ):
+        """
+        Matches a target and everything below it, at any depth.
+
+        :param name: ``"**"``
+        :param compasses: As :class:`Wildcard`.
+        :param end_points: As :class:`Wildcard`.
+
+        **inherits from:** :class:`Wildcard`
+
+        **name types:** ``"**"`` only.
+
+        **shorthand:** ``"**"``, only for course types that list
+        :class:`RecursiveWildcard` in their ``BEARINGS``, as :class:`Wildcard`.
+
+        The remaining bearings of a course are tried at every level, so only branches
+        that contain a match are yielded. Values are visited lazily, depth first.
+
+        >>> from gemma import PORT, RecursiveWildcard
+        >>>
+        >>> data = {"name": "root", "child": {"name": "leaf", "size": 1}}
+        >>> for course, value in (PORT / RecursiveWildcard() / "name").fetch_iter(data):
+        ...     print(course, value)
+        ...
+        name root
+        [child]/name leaf
+        """
+        super().__init__(name, compasses=compasses, end_points=end_points)
+
+    @classmethod
+    def is_compatible(cls, name: Any) -> bool:
+        """
+        Only ``"**"`` can be cast to a :class:`RecursiveWildcard`.
+        """
+        return name == "**"
+
+    def fan_out(self, target: Any) -> FanOutType:
+        """
+        As :func:`Wildcard.fan_out`, but yields ``target`` itself with an empty tuple
+        of bearings, followed by every value below it.
+        """
+        yield tuple(), target
+        yield from self._descend(target, tuple())
+
+    def _descend(self, target: Any, path: Tuple[BearingAbstract, ...]) -> FanOutType:
+        for this_bearing, value in self._children(target):
+            this_path = path + (this_bearing,)
+            yield this_path, value
+            yield from self._descend(value, this_path)
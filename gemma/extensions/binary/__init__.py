@@ -0,0 +1,7 @@
+from ._blayout import BLayout, BView, BRecords
+from ._bfield_bearing import BField, bbearing
+from ._bcourse import BCourse, BPATH
+from ._bcompass import BCompass
+from ._bsurveyor import bsurveyor
+
+(BLayout, BView, BRecords, BField, bbearing, BCourse, BPATH, BCompass, bsurveyor)
@@ -0,0 +1,43 @@
+from typing import Any, Generator, Tuple
+
+from gemma import Compass, Attr, Item, Call
+from ._bfield_bearing import BField
+from ._blayout import BView, BRecords
+
+
+class BCompass(Compass):
+    def __init__(self) -> None:
+        super().__init__(target_types=(BView, BRecords))
+
+    def attr_iter(self, target: Any) -> Generator[Tuple[Attr, Any], None, None]:
+        """
+        Not Implemented. No :class:`Attr` bearings returned.
+        """
+        raise NotImplementedError
+
+    def item_iter(self, target: Any) -> Generator[Tuple[Item, Any], None, None]:
+        """
+        Not Implemented. No :class:`Item` bearings returned.
+        """
+        raise NotImplementedError
+
+    def call_iter(self, target: Any) -> Generator[Tuple[Call, Any], None, None]:
+        """
+        Not Implemented. No :class:`Call` bearings returned.
+        """
+        raise NotImplementedError
+
+    def field_iter(self, target: Any) -> Generator[Tuple[BField, Any], None, None]:
+        """
+        Yields :class:`BField` bearing for each field of a :class:`BView`, or each
+        record of :class:`BRecords`.
+
+        :param target: view or records to describe.
+        :return: (BField, value) pairs
+        """
+        if isinstance(target, BRecords):
+            for index, record in enumerate(target):
+                yield BField(index), record
+        else:
+            for name, value in target.layout.items(target.buffer, target.offset):
+                yield BField(name), value
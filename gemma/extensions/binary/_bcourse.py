@@ -0,0 +1,9 @@
+from gemma import Course
+from ._bfield_bearing import BField
+
+
+class BCourse(Course):
+    BEARINGS_EXTENSION = [BField]
+
+
+BPATH: BCourse = BCourse()
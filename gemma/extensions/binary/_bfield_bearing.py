@@ -0,0 +1,104 @@
+import re
+from typing import Any, Union, Optional, Type, List
+
+from gemma import BearingAbstract, NullNameError, bearing
+from ._blayout import BView, BRecords
+
+
+class BField(BearingAbstract[Union[str, int]]):
+    REGEX = re.compile(r"<(.+)>")
+    NAME_TYPES = [str, int]
+
+    def __str__(self) -> str:
+        return f"<{self.name}>"
+
+    def fetch(self, target: Any) -> Any:
+        """
+        Fetches a field of a :class:`BView`, or a record of :class:`BRecords`.
+
+        :param target: view or records to fetch from.
+        :return: unpacked field value, or :class:`BView` of record / nested layout.
+        :raises NullNameError: if the field or record does not exist, or ``target`` is
+            not a view or records object.
+
+        Example:
+            >>> from gemma.extensions.binary import BLayout, BRecords, BField
+            >>>
+            >>> layout = BLayout([("id", "<I"), ("price", "<d")])
+            >>> records = BRecords(bytearray(layout.size * 2), layout)
+            >>> BField("price").fetch(BField(1).fetch(records))
+            0.0
+        """
+        if isinstance(target, BView) and isinstance(self.name, str):
+            return target.layout.read(target.buffer, target.offset, self.name)
+        if isinstance(target, BRecords) and isinstance(self.name, int):
+            try:
+                return target[self.name]
+            except IndexError:
+                raise NullNameError(str(self))
+        raise NullNameError(f"{str(self)} cannot be fetched from {type(target)}")
+
+    def place(self, target: Any, value: Any, **kwargs: dict) -> None:
+        """
+        Packs ``value`` into a field of a :class:`BView`, or copies a record into
+        :class:`BRecords`.
+
+        :param target: view or records to place on.
+        :param value: value to pack. Records and nested layouts take a
+            :class:`BView` or ``bytes`` of the right size.
+        :return: None
+        :raises NullNameError: if the field or record does not exist, or ``target`` is
+            not a view or records object.
+
+        Equivalent to ``struct.pack_into(format, buffer, offset, value)``.
+        """
+        if isinstance(target, BView) and isinstance(self.name, str):
+            target.layout.write(target.buffer, target.offset, self.name, value)
+            return
+        if isinstance(target, BRecords) and isinstance(self.name, int):
+            try:
+                target[self.name] = value
+            except IndexError:
+                raise NullNameError(str(self))
+            return
+        raise NullNameError(f"{str(self)} cannot be placed on {type(target)}")
+
+    @classmethod
+    def name_from_str(cls, text: str) -> Union[str, int]:
+        """
+        Field name or record index.
+
+        :param text: text to be converted
+        :return: name, or index if ``text`` is a whole number.
+
+        Allowed conventions:
+
+            - <name>
+            - <1042>
+        """
+        name: str = super().name_from_str(text)
+        try:
+            return int(name)
+        except ValueError:
+            return name
+
+
+def bbearing(
+    name: Any,
+    bearing_classes: Optional[List[Type[BearingAbstract]]] = None,
+    bearing_classes_extra: Optional[List[Type[BearingAbstract]]] = None,
+) -> BearingAbstract:
+    """
+    As :func:`bearing`, but inserts :class:`BField` at head of
+    ``bearing_classes_extra``
+    """
+    if bearing_classes_extra is None:
+        bearing_classes_extra = list()
+
+    if BField not in bearing_classes_extra:
+        bearing_classes_extra.insert(0, BField)
+    return bearing(
+        name,
+        bearing_classes=bearing_classes,
+        bearing_classes_extra=bearing_classes_extra,
+    )
@@ -0,0 +1,266 @@
+import struct
+from collections.abc import Sequence
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence as SequenceType,
+    Tuple,
+    Union,
+    overload,
+)
+
+from gemma import NullNameError
+
+
+FormatType = Union[str, "BLayout"]
+FieldInput = Union[Tuple[str, FormatType], Tuple[str, FormatType, int]]
+
+
+class _FieldSpec(NamedTuple):
+    offset: int
+    size: int
+    packer: Optional[struct.Struct]
+    layout: Optional["BLayout"]
+    single: bool
+
+
+class BLayout:
+    def __init__(self, fields: SequenceType[FieldInput], size: Optional[int] = None):
+        """
+        Describes the fields of a fixed-size binary record.
+
+        :param fields: ``(name, format)`` or ``(name, format, offset)`` tuples. Format
+            is a ``struct`` format string, or another :class:`BLayout` for nested
+            records. When no offset is given, the field starts where the previous field
+            ended.
+        :param size: size of the record in bytes. Defaults to the end of the last field.
+
+        Formats are compiled once into ``struct.Struct`` objects. Formats that unpack to
+        a single value are returned as that value, others are returned as a ``tuple``.
+        """
+        self._fields: Dict[str, _FieldSpec] = dict()
+
+        end = 0
+        for field_input in fields:
+            name, field_format = field_input[0], field_input[1]
+            offset = field_input[2] if len(field_input) > 2 else end  # type: ignore
+
+            if isinstance(field_format, BLayout):
+                spec = _FieldSpec(offset, field_format.size, None, field_format, False)
+            else:
+                packer = struct.Struct(field_format)
+                single = len(packer.unpack(bytes(packer.size))) == 1
+                spec = _FieldSpec(offset, packer.size, packer, None, single)
+
+            self._fields[name] = spec
+            end = max(end, offset + spec.size)
+
+        if size is None:
+            size = end
+        elif size < end:
+            raise ValueError(f"fields end at byte {end}, past layout size {size}")
+
+        self.size: int = size
+
+    def __repr__(self) -> str:
+        return f"<BLayout: {', '.join(self._fields)}>"
+
+    @property
+    def names(self) -> List[str]:
+        """
+        :return: field names, in declaration order.
+        """
+        return list(self._fields)
+
+    def read(self, buffer: Any, offset: int, name: str) -> Any:
+        """
+        Unpacks field ``name`` of the record at ``offset`` in ``buffer``
+
+        :param buffer: ``bytes``, ``bytearray``, ``memoryview`` or ``mmap`` object.
+        :param offset: offset of the record in ``buffer``.
+        :param name: field to read.
+        :return: unpacked value, or a :class:`BView` for nested layouts.
+        :raises NullNameError: if the layout has no field ``name``.
+
+        Values are unpacked in-place with ``struct.unpack_from``, the buffer is never
+        sliced.
+        """
+        try:
+            spec = self._fields[name]
+        except (KeyError, TypeError):
+            raise NullNameError(f"<{name}>")
+
+        if spec.layout is not None:
+            return BView(buffer, spec.layout, offset + spec.offset)
+
+        # The struct is always set when the layout is not.
+        values = spec.packer.unpack_from(buffer, offset + spec.offset)  # type: ignore
+        return values[0] if spec.single else values
+
+    def write(self, buffer: Any, offset: int, name: str, value: Any) -> None:
+        """
+        Packs ``value`` into field ``name`` of the record at ``offset`` in ``buffer``.
+
+        :param buffer: writable buffer, like a ``bytearray`` or writable ``mmap``.
+        :param offset: offset of the record in ``buffer``.
+        :param name: field to write.
+        :param value: value to pack. Nested layouts take a :class:`BView` or bytes.
+        :raises NullNameError: if the layout has no field ``name``.
+        :raises TypeError: if ``buffer`` is read-only.
+        """
+        try:
+            spec = self._fields[name]
+        except (KeyError, TypeError):
+            raise NullNameError(f"<{name}>")
+
+        start = offset + spec.offset
+
+        if spec.layout is not None:
+            _write_record(buffer, start, spec.size, value)
+        elif spec.single:
+            spec.packer.pack_into(buffer, start, value)  # type: ignore
+        else:
+            spec.packer.pack_into(buffer, start, *value)  # type: ignore
+
+    def items(
+        self, buffer: Any, offset: int
+    ) -> Generator[Tuple[str, Any], None, None]:
+        """
+        Yields (name, value) pairs of every field of the record at ``offset`` in
+        ``buffer``.
+        """
+        for name in self._fields:
+            yield name, self.read(buffer, offset, name)
+
+
+class BView:
+    __slots__ = ("buffer", "layout", "offset")
+
+    def __init__(self, buffer: Any, layout: BLayout, offset: int = 0):
+        """
+        A record of ``layout`` at ``offset`` of ``buffer``. Nothing is copied.
+
+        :param buffer: ``bytes``, ``bytearray``, ``memoryview`` or ``mmap`` object.
+        :param layout: layout of the record.
+        :param offset: offset of the record in ``buffer``.
+
+        Views implement gemma's fetch and place :ref:`protocol-hooks`, so any
+        :class:`Course` can navigate them by field name.
+        """
+        self.buffer: Any = buffer
+        self.layout: BLayout = layout
+        self.offset: int = offset
+
+    def __repr__(self) -> str:
+        return f"<BView: {', '.join(self.layout.names)} @ {self.offset}>"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BView):
+            return NotImplemented
+        return bytes(self) == bytes(other)
+
+    def __bytes__(self) -> bytes:
+        end = self.offset + self.layout.size
+        return bytes(self.buffer[self.offset:end])
+
+    def __gemma_fetch__(self, this_bearing: Any) -> Any:
+        # Names that are not fields fall through to the bearing's own fetch, so
+        # ``Attr("layout")`` or ``Call("__bytes__")`` still work on a view.
+        name: Any = getattr(this_bearing, "name", None)
+        if not _is_field(self.layout, name):
+            return NotImplemented
+        return self.layout.read(self.buffer, self.offset, name)
+
+    def __gemma_place__(self, this_bearing: Any, value: Any) -> Any:
+        name: Any = getattr(this_bearing, "name", None)
+        if not _is_field(self.layout, name):
+            return NotImplemented
+        self.layout.write(self.buffer, self.offset, name, value)
+        return None
+
+
+class BRecords(Sequence):
+    def __init__(
+        self,
+        buffer: Any,
+        layout: BLayout,
+        offset: int = 0,
+        count: Optional[int] = None,
+    ):
+        """
+        Sequence of consecutive records of ``layout`` in ``buffer``.
+
+        :param buffer: ``bytes``, ``bytearray``, ``memoryview`` or ``mmap`` object.
+        :param layout: layout of each record.
+        :param offset: offset of the first record in ``buffer``.
+        :param count: number of records. Defaults to as many whole records as fit in
+            ``buffer`` after ``offset``.
+
+        Indexing returns a :class:`BView` of the record.
+        """
+        if count is None:
+            count = (len(buffer) - offset) // layout.size
+
+        self.buffer: Any = buffer
+        self.layout: BLayout = layout
+        self.offset: int = offset
+        self._count: int = count
+
+    def __repr__(self) -> str:
+        return f"<BRecords: {self._count} x {self.layout!r}>"
+
+    def __len__(self) -> int:
+        return self._count
+
+    # flake8 does not understand overloads, noqa comments are to ignore re-definition
+    # errors during lint
+    @overload  # noqa: F811
+    def __getitem__(self, index: int) -> BView:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[BView]:  # noqa: F811
+        ...
+
+    def __getitem__(  # noqa: F811
+        self, index: Union[int, slice]
+    ) -> Union[BView, List[BView]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        return BView(self.buffer, self.layout, self._record_offset(index))
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        start = self._record_offset(index)
+        _write_record(self.buffer, start, self.layout.size, value)
+
+    def _record_offset(self, index: int) -> int:
+        if not isinstance(index, int):
+            raise TypeError(f"record index must be int, not {type(index).__name__}")
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"record {index} out of range")
+        return self.offset + index * self.layout.size
+
+
+def _is_field(layout: BLayout, name: Any) -> bool:
+    """whether ``name`` is a field of ``layout``"""
+    try:
+        return name in layout._fields
+    except TypeError:
+        return False
+
+
+def _write_record(buffer: Any, start: int, size: int, value: Any) -> None:
+    """copies the bytes of ``value`` over a record"""
+    if isinstance(value, BView):
+        end = value.offset + value.layout.size
+        value = value.buffer[value.offset:end]
+    if len(value) != size:
+        raise ValueError(f"record must be {size} bytes, got {len(value)}")
+    end = start + size
+    buffer[start:end] = value
@@ -0,0 +1,8 @@
+from gemma import Surveyor
+
+from ._bcourse import BCourse
+from ._bcompass import BCompass
+
+bsurveyor = Surveyor(
+    compasses_extra=[BCompass()], end_points_extra=(bytes,), course_type=BCourse
+)
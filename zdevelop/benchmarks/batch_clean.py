@@ -0,0 +1,77 @@
+import sys
+import timeit
+from typing import Any, List
+
+from gemma import Cartographer, Coordinate, PORT, batch_cleaner
+
+"""
+compares per-value cleaners in MappingPlan.map_many with batch cleaners in
+MappingPlan.map_chunked, and with numpy batches when numpy is installed
+
+usage, with gemma installed: python zdevelop/benchmarks/batch_clean.py [records]
+"""
+
+
+def make_records(count: int) -> List[dict]:
+    """
+    builds flat records to map
+    :param count: number of records
+    :return: records
+    """
+    return [{"id": i, "feet": i * 1.5, "qty": i % 7} for i in range(count)]
+
+
+def to_meters(value: Any, coord: Coordinate, cache: dict) -> float:
+    return value * 0.3048
+
+
+@batch_cleaner
+def batch_to_meters(values: Any, coord: Coordinate, cache: dict) -> List[float]:
+    return [x * 0.3048 for x in values]
+
+
+def make_coordinates(cleaner: Any) -> List[Coordinate]:
+    return [
+        Coordinate(PORT / "id", PORT / "record_id"),
+        Coordinate(PORT / "feet", PORT / "meters", clean_value=cleaner),
+        Coordinate(PORT / "qty"),
+    ]
+
+
+def map_many(records: List[dict]) -> List[dict]:
+    plan = Cartographer().compile(make_coordinates(to_meters))
+    return list(plan.map_many(records, dict))
+
+
+def map_chunked(records: List[dict], cleaner: Any = batch_to_meters) -> List[dict]:
+    plan = Cartographer().compile(make_coordinates(cleaner))
+    return list(plan.map_chunked(records, dict, chunk_size=1000))
+
+
+def main(count: int) -> None:
+    records = make_records(count)
+    assert map_many(records) == map_chunked(records)
+
+    runs = [("plan.map_many", map_many), ("plan.map_chunked", map_chunked)]
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("numpy is not installed, skipping numpy batches")
+    else:
+
+        @batch_cleaner("numpy")
+        def numpy_to_meters(values: Any, coord: Coordinate, cache: dict) -> Any:
+            return values * 0.3048
+
+        runs.append(
+            ("map_chunked (numpy)", lambda x: map_chunked(x, numpy_to_meters))
+        )
+
+    print(f"records:              {count:,}")
+    for name, func in runs:
+        seconds = min(timeit.repeat(lambda: func(records), number=1, repeat=3))
+        print(f"{name + ':':<22}{seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
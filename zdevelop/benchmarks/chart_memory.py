@@ -0,0 +1,59 @@
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+from gemma import Surveyor
+
+"""
+compares memory used by Surveyor.chart() and Surveyor.chart_compact()
+
+usage, with gemma installed: python zdevelop/benchmarks/chart_memory.py [rows]
+"""
+
+
+def make_data(rows: int) -> dict:
+    """
+    builds a table-like structure, with ``rows`` dicts of 5 fields each
+    :param rows: number of rows
+    :return: data to chart
+    """
+    return {
+        "rows": [
+            {"id": i, "name": f"row {i}", "tags": ["a", "b"], "score": i / 2}
+            for i in range(rows)
+        ]
+    }
+
+
+def measure(make_chart: Callable[[Any], Any], data: Any) -> int:
+    """
+    measures peak memory of charting ``data``, minus the data itself
+    :param make_chart: charting method
+    :param data: data to chart
+    :return: bytes allocated while charting and still held by the chart
+    """
+    tracemalloc.start()
+    chart = make_chart(data)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del chart
+    return size
+
+
+def main(rows: int) -> None:
+    data = make_data(rows)
+    surveyor = Surveyor()
+
+    list_size = measure(surveyor.chart, data)
+    compact_size = measure(surveyor.chart_compact, data)
+    nodes = len(surveyor.chart_compact(data))
+
+    print(f"nodes:          {nodes:,}")
+    print(f"list chart:     {list_size / 2 ** 20:,.1f} MiB")
+    print(f"compact chart:  {compact_size / 2 ** 20:,.1f} MiB")
+    print(f"ratio:          {list_size / compact_size:,.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
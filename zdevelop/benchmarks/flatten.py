@@ -0,0 +1,79 @@
+import sys
+import timeit
+from typing import Any, Dict
+
+from gemma import Course, Item, Surveyor, flatten, unflatten
+
+"""
+compares flatten() and unflatten() with charting, str(course) and Course.place
+
+usage, with gemma installed: python zdevelop/benchmarks/flatten.py [keys]
+"""
+
+
+def make_document(keys: int) -> dict:
+    """
+    builds a nested document with roughly ``keys`` end points
+    :param keys: number of end points
+    :return: document
+    """
+    return {
+        "orders": [
+            {
+                "id": i,
+                "customer": {"name": f"customer {i}", "email": f"{i}@example.com"},
+                "lines": [{"sku": f"sku-{i}", "qty": 1}, {"sku": "other", "qty": 2}],
+                "notes": None,
+            }
+            for i in range(keys // 8)
+        ]
+    }
+
+
+def chart_flatten(document: Any) -> Dict[str, Any]:
+    """flattens the way it is done without flatten()"""
+    return {
+        str(course): value
+        for course, value in Surveyor().chart_iter(document)
+        if value is None or isinstance(value, (str, int, float))
+    }
+
+
+def place_unflatten(flat: Dict[str, Any]) -> dict:
+    """unflattens the way it is done without unflatten()"""
+    root: dict = dict()
+    for key, value in flat.items():
+        bearings = list(Course(key))
+        # every parent needs a factory, chosen by the type of the next bearing
+        with_factories = list()
+        for this_bearing, next_bearing in zip(bearings, bearings[1:]):
+            factory = list if next_bearing.name.isdigit() else dict
+            name = int(this_bearing.name) if this_bearing.name.isdigit() else None
+            if name is None:
+                name = this_bearing.name
+            with_factories.append(Item(name, factory=factory))
+        last = bearings[-1].name
+        with_factories.append(Item(int(last) if last.isdigit() else last))
+        Course(*with_factories).place(root, value)
+    return root
+
+
+def main(keys: int) -> None:
+    document = make_document(keys)
+    flat = flatten(document)
+    assert flat == chart_flatten(document)
+    assert unflatten(flat) == place_unflatten(flat) == document
+
+    print(f"keys:                 {len(flat):,}")
+    for name, func, arg in [
+        ("chart + str(course)", chart_flatten, document),
+        ("flatten()", flatten, document),
+        ("Course.place", place_unflatten, flat),
+        ("unflatten()", unflatten, flat),
+    ]:
+        seconds = min(timeit.repeat(lambda: func(arg), number=1, repeat=3))
+        print(f"{name + ':':<22}{seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,105 @@
+import sys
+import timeit
+from typing import Any, Callable, List
+
+from gemma import Cartographer, Coordinate, Item, PORT, register_cleaner
+
+"""
+compares Cartographer.map, MappingPlan.map_many and a function generated by
+MappingPlan.to_function with a hand-written mapping function
+
+usage, with gemma installed: python zdevelop/benchmarks/generated_map.py [records]
+"""
+
+
+@register_cleaner("benchmarks.total")
+def total(values: Any, coord: Coordinate, cache: dict) -> float:
+    return values[0] * values[1]
+
+
+def make_records(count: int) -> List[dict]:
+    """
+    builds nested records to map
+    :param count: number of records
+    :return: records
+    """
+    return [
+        {
+            "id": i,
+            "customer": {"name": f"name {i}", "address": {"city": "c", "zip": i}},
+            "price": i * 1.5,
+            "qty": i % 7,
+        }
+        for i in range(count)
+    ]
+
+
+COORDINATES = [
+    Coordinate(PORT / "id", PORT / "record_id"),
+    Coordinate(PORT / "customer" / "name", PORT / "name"),
+    Coordinate(
+        PORT / "customer" / "address" / "city",
+        PORT / Item("shipping", factory=dict) / "city",
+    ),
+    Coordinate(
+        PORT / "customer" / "address" / "zip",
+        PORT / Item("shipping", factory=dict) / "zip",
+    ),
+    Coordinate(
+        (PORT / "price", PORT / "qty"), PORT / "total", clean_value="benchmarks.total"
+    ),
+    Coordinate(PORT / "missing", PORT / "flag", default=False),
+]
+
+
+def by_hand(record: dict, dst: dict) -> None:
+    dst["record_id"] = record["id"]
+    customer = record["customer"]
+    dst["name"] = customer["name"]
+    address = customer["address"]
+    dst["shipping"] = {"city": address["city"], "zip": address["zip"]}
+    dst["total"] = record["price"] * record["qty"]
+    dst["flag"] = record.get("missing", False)
+
+
+def time_function(
+    records: List[dict], map_record: Callable[[Any, Any], None]
+) -> float:
+    def run() -> None:
+        for record in records:
+            map_record(record, dict())
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    records = make_records(count)
+
+    cart = Cartographer()
+    plan = cart.compile(COORDINATES)
+    generated = plan.to_function()
+
+    results = {
+        "Cartographer.map": time_function(
+            records, lambda x, y: cart.map(x, y, COORDINATES)
+        ),
+        "MappingPlan.map": time_function(records, plan.map),
+        "to_function()": time_function(records, generated),
+        "hand-written": time_function(records, by_hand),
+    }
+
+    expected = [dict() for _ in records[:100]]
+    for record, dst in zip(records, expected):
+        by_hand(record, dst)
+    for record, dst in zip(records, expected):
+        check: dict = dict()
+        generated(record, check)
+        assert check == dst
+
+    for label, seconds in results.items():
+        print(f"{label:>18}: {count} records in {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import sys
+import timeit
+from typing import Any, List
+
+from gemma import Cartographer, Coordinate, PORT
+
+"""
+compares Cartographer.map per record with a compiled MappingPlan.map_many
+
+usage, with gemma installed: python zdevelop/benchmarks/map_many.py [records]
+"""
+
+
+def make_records(count: int) -> List[dict]:
+    """
+    builds flat records to map
+    :param count: number of records
+    :return: records
+    """
+    return [
+        {"id": i, "name": f"name {i}", "price": i * 1.5, "qty": i % 7, "sku": f"s{i}"}
+        for i in range(count)
+    ]
+
+
+def make_coordinates() -> List[Coordinate]:
+    def total(values: Any, coord: Coordinate, cache: dict) -> float:
+        return values[0] * values[1]
+
+    return [
+        Coordinate(PORT / "id", PORT / "record_id"),
+        Coordinate(PORT / "name"),
+        Coordinate(PORT / "sku", PORT / "item" / "sku"),
+        Coordinate((PORT / "price", PORT / "qty"), PORT / "total", clean_value=total),
+        Coordinate(PORT / "missing", PORT / "flag", default=False),
+    ]
+
+
+def map_each(records: List[dict]) -> List[dict]:
+    cart = Cartographer()
+    coordinates = make_coordinates()
+    results = list()
+    for record in records:
+        destination: dict = {"item": {}}
+        cart.map(record, destination, coordinates)
+        results.append(destination)
+    return results
+
+
+def map_many(records: List[dict]) -> List[dict]:
+    plan = Cartographer().compile(make_coordinates())
+    return list(plan.map_many(records, lambda: {"item": {}}))
+
+
+def main(count: int) -> None:
+    records = make_records(count)
+    assert map_each(records) == map_many(records)
+
+    print(f"records:              {count:,}")
+    for name, func in [("Cartographer.map", map_each), ("plan.map_many", map_many)]:
+        seconds = min(timeit.repeat(lambda: func(records), number=1, repeat=3))
+        print(f"{name + ':':<22}{seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+from typing import Any, Iterator
+
+from gemma import Cartographer, Coordinate, PORT
+
+"""
+maps a stream of records with MappingPlan.map_many, then with
+MappingPlan.map_parallel on 1 to N worker processes
+
+usage, with gemma installed: python zdevelop/benchmarks/parallel_map.py [records]
+"""
+
+
+def total(values: Any, coord: Coordinate, cache: dict) -> float:
+    """module level, so the plan can be pickled for worker processes"""
+    return values[0] * values[1]
+
+
+def make_records(count: int) -> Iterator[dict]:
+    """
+    streams records to map
+    :param count: number of records
+    :return: iterator of records
+    """
+    for i in range(count):
+        yield {
+            "id": i,
+            "name": f"name {i}",
+            "price": i * 1.5,
+            "qty": i % 7,
+            "customer": {"email": f"{i}@example.com", "city": "somewhere"},
+        }
+
+
+def main(count: int) -> None:
+    plan = Cartographer().compile(
+        [
+            Coordinate(PORT / "id", PORT / "record_id"),
+            Coordinate(PORT / "name"),
+            Coordinate(
+                (PORT / "price", PORT / "qty"), PORT / "total", clean_value=total
+            ),
+            Coordinate(PORT / "customer" / "email", PORT / "email"),
+            Coordinate(PORT / "customer" / "city", PORT / "city"),
+        ]
+    )
+
+    start = time.perf_counter()
+    for _ in plan.map_many(make_records(count), dict):
+        pass
+    serial = time.perf_counter() - start
+
+    print(f"records:          {count:,}")
+    print(f"map_many:         {serial:.3f}s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        for _ in plan.map_parallel(make_records(count), dict, workers=workers):
+            pass
+        seconds = time.perf_counter() - start
+        print(f"workers: {workers:<8}{seconds:.3f}s  ({serial / seconds:.2f}x)")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,73 @@
+import sys
+import timeit
+from types import SimpleNamespace
+from typing import Any
+
+from gemma import Cartographer, Coordinate, Item, PORT
+
+"""
+maps records whose coordinates read and place many sibling fields under deep shared
+prefixes, with and without prefix memoization, and reports the origin hit rate.
+Records are dicts, and objects read through attributes, which fallback bearings reach
+after trying items
+
+usage, with gemma installed: python zdevelop/benchmarks/shared_prefix_map.py [records]
+"""
+
+
+FIELDS = ["street", "city", "state", "zip", "country", "unit"]
+PARENTS = ["billing", "shipping", "home"]
+
+
+def make_record(i: int) -> dict:
+    """
+    :param i: record number
+    :return: record with an address of each parent kind, under order/customer
+    """
+    return {
+        "order": {
+            "customer": {
+                parent: {"address": {field: f"{field}-{i}" for field in FIELDS}}
+                for parent in PARENTS
+            }
+        }
+    }
+
+
+def to_object(value: Any) -> Any:
+    if isinstance(value, dict):
+        return SimpleNamespace(**{k: to_object(v) for k, v in value.items()})
+    return value
+
+
+COORDINATES = [
+    Coordinate(
+        PORT / "order" / "customer" / parent / "address" / field,
+        PORT / Item(parent, factory=dict) / Item("address", factory=dict) / field,
+    )
+    for parent in PARENTS
+    for field in FIELDS
+]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    dicts = [make_record(i) for i in range(count)]
+    objects = [to_object(x) for x in dicts]
+    cart = Cartographer()
+
+    for kind, records in (("dict", dicts), ("object", objects)):
+        for memoize in (False, True):
+
+            def run() -> None:
+                for record in records:
+                    cart.map(record, dict(), COORDINATES, memoize=memoize)
+
+            seconds = min(timeit.repeat(run, number=1, repeat=3))
+            print(f"{kind} memoize={memoize}: {count} records in {seconds:.3f}s")
+
+    print(f"hit rate per record: {cart.fetch_stats.hit_rate:.2f}")
+
+
+if __name__ == "__main__":
+    main()
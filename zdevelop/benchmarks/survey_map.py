@@ -0,0 +1,74 @@
+import sys
+import timeit
+from collections import defaultdict
+from typing import Any, List
+
+from gemma import Cartographer, Coordinate, Course, PORT, Surveyor
+
+"""
+maps structures of growing size with surveyor auto-mapping, and times the coverage
+check it replaced: scanning every mapped course with ``in`` for each charted course
+
+usage, with gemma installed: python zdevelop/benchmarks/survey_map.py [max_records]
+"""
+
+
+SCAN_LIMIT = 250
+
+
+def make_document(records: int) -> dict:
+    """
+    builds a document with 4 end points per record
+    :param records: number of records
+    :return: document
+    """
+    return {
+        "records": {
+            f"r{i}": {"id": i, "name": f"name {i}", "tags": {"a": 1, "b": 2}}
+            for i in range(records)
+        }
+    }
+
+
+def nested_dict() -> defaultdict:
+    return defaultdict(nested_dict)
+
+
+def survey_map(document: dict) -> Any:
+    destination = nested_dict()
+    coordinates = [Coordinate(PORT / "records" / "r0" / "id", PORT / "first_id")]
+    Cartographer().map(document, destination, coordinates, surveyor=Surveyor())
+    return destination
+
+
+def scan_coverage(document: dict) -> int:
+    """the check _map_survey_chart made for each course before the coverage index"""
+    chart = sorted(Surveyor().chart(document), key=lambda x: len(x[0]), reverse=True)
+    mapped: List[Course] = list()
+    skipped = 0
+    for course, _ in chart:
+        if any(course in x for x in mapped) or any(x in course for x in mapped):
+            skipped += 1
+            continue
+        mapped.append(course)
+    return skipped
+
+
+def main(max_records: int) -> None:
+    records = 250
+    while records <= max_records:
+        document = make_document(records)
+        mapped = min(timeit.repeat(lambda: survey_map(document), number=1, repeat=3))
+        line = f"end points: {records * 4:>7,}  map(surveyor=): {mapped:.3f}s"
+
+        # the scan is quadratic, so it is only timed for the smallest structure.
+        if records <= SCAN_LIMIT:
+            scanned = timeit.timeit(lambda: scan_coverage(document), number=1)
+            line += f"  old coverage scan alone: {scanned:.3f}s"
+
+        print(line)
+        records *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 16_000)
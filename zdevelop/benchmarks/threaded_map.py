@@ -0,0 +1,62 @@
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from gemma import Cartographer, Coordinate, PORT
+
+"""
+maps records from several threads at once with one shared set of coordinates, checking
+every result, and reports throughput for each thread count
+
+usage, with gemma installed: python zdevelop/benchmarks/threaded_map.py [records]
+"""
+
+
+COORDINATES = [
+    Coordinate(PORT / "id", PORT / "record_id"),
+    Coordinate(PORT / "name"),
+    Coordinate(
+        (PORT / "price", PORT / "qty"),
+        PORT / "total",
+        clean_value=lambda values, coord, cache: values[0] * values[1],
+    ),
+]
+
+
+def map_records(records: List[dict]) -> int:
+    """maps records with the shared coordinates, returning the number that are wrong"""
+    cart = Cartographer()
+    wrong = 0
+    for record in records:
+        destination: dict = dict()
+        cart.map(record, destination, COORDINATES)
+        expected = {
+            "record_id": record["id"],
+            "name": record["name"],
+            "total": record["price"] * record["qty"],
+        }
+        wrong += destination != expected
+    return wrong
+
+
+def main(count: int) -> None:
+    records = [
+        {"id": i, "name": f"name {i}", "price": i * 1.5, "qty": i % 7}
+        for i in range(count)
+    ]
+
+    print(f"records:     {count:,}")
+    for threads in (1, 2, 4, 8):
+        chunks = [records[i::threads] for i in range(threads)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(threads) as executor:
+            wrong = sum(executor.map(map_records, chunks))
+        seconds = time.perf_counter() - start
+
+        assert wrong == 0, f"{wrong} records mapped incorrectly"
+        print(f"threads: {threads}  {count / seconds:>10,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -1,7 +1,23 @@
+import pickle
+import threading
 import pytest
 from typing import Any
 
-from gemma import Fallback, Attr, Item, Call, NullNameError, BearingAbstract, bearing
+import gemma._bearings
+
+from gemma import (
+    Fallback,
+    AdaptiveFallback,
+    Attr,
+    Item,
+    Call,
+    Course,
+    PORT,
+    Where,
+    NullNameError,
+    BearingAbstract,
+    bearing,
+)
 
 
 # ##### HELPER CLASSES #####
@@ -476,3 +492,395 @@ def test_sort_bearings():
     ]
 
     assert sorted(bearing_unsorted) == bearing_sorted
+
+
+class HookedRow:
+    """used for testing the __gemma_fetch__ and __gemma_place__ hooks"""
+
+    def __init__(self):
+        self.data = {"a": "a hooked", "b": "b hooked"}
+        self.calls = list()
+
+    def __gemma_fetch__(self, this_bearing):
+        self.calls.append(this_bearing)
+        if this_bearing.name == "declined":
+            return NotImplemented
+        try:
+            return self.data[this_bearing.name]
+        except KeyError:
+            raise NullNameError(str(this_bearing))
+
+    def __gemma_place__(self, this_bearing, value):
+        self.calls.append(this_bearing)
+        if this_bearing.name == "declined":
+            return NotImplemented
+        self.data[this_bearing.name] = value
+
+    declined = "declined attr"
+
+
+class TestProtocolHooks:
+    @pytest.mark.parametrize("bearing_type", [Fallback, Attr, Item, Call])
+    def test_fetch_hook(self, bearing_type):
+        row = HookedRow()
+        assert bearing_type("a").fetch(row) == "a hooked"
+
+    def test_fetch_hook_fallback_called_once(self):
+        row = HookedRow()
+        Fallback("b").fetch(row)
+        assert row.calls == [Fallback("b")]
+        assert isinstance(row.calls[0], Fallback)
+
+    def test_fetch_hook_raises(self):
+        with pytest.raises(NullNameError):
+            Fallback("c").fetch(HookedRow())
+
+    def test_fetch_hook_declined(self):
+        assert Fallback("declined").fetch(HookedRow()) == "declined attr"
+
+    @pytest.mark.parametrize("bearing_type", [Fallback, Attr, Item, Call])
+    def test_place_hook(self, bearing_type):
+        row = HookedRow()
+        bearing_type("c").place(row, "c placed")
+        assert row.data["c"] == "c placed"
+
+    def test_place_hook_declined(self):
+        row = HookedRow()
+        Attr("declined").place(row, "changed")
+        assert row.declined == "changed"
+        assert "declined" not in row.data
+
+    def test_hooks_kept_per_type(self):
+        row = HookedRow()
+        Fallback("a").fetch(row)
+        Item("a").fetch({"a": 1})
+
+        hooks = gemma._bearings._TYPE_HOOKS
+        expected = (HookedRow.__gemma_fetch__, HookedRow.__gemma_place__)
+        assert hooks[HookedRow] == expected
+        assert dict not in hooks
+
+    def test_hooks_kept_bounded(self, monkeypatch):
+        monkeypatch.setattr(gemma._bearings, "_TYPE_HOOKS", dict())
+        monkeypatch.setattr(gemma._bearings, "_TYPE_HOOKS_SIZE", 2)
+
+        for i in range(5):
+            kind = type(f"Row{i}", (), {"a": i})
+            assert Fallback("a").fetch(kind()) == i
+
+        assert len(gemma._bearings._TYPE_HOOKS) <= 2
+
+    def test_dict_subclass_hook(self):
+        class HookedDict(dict):
+            def __gemma_fetch__(self, this_bearing):
+                return "hooked"
+
+        assert Fallback("a").fetch(HookedDict(a=1)) == "hooked"
+        assert AdaptiveFallback("a").fetch(HookedDict(a=1)) == "hooked"
+        assert Fallback("a").fetch({"a": 1}) == 1
+
+
+class TestAdaptiveFallback:
+    def test_default_order(self):
+        assert list(AdaptiveFallback("a").stats) == [Item, Call, Attr]
+
+    def test_fetch(self, data_structure_1, data_dict):
+        assert AdaptiveFallback("a").fetch(data_structure_1) == "a data"
+        assert AdaptiveFallback("a dict").fetch(data_dict) == "a value"
+
+    def test_fetch_raises(self, data_dict):
+        with pytest.raises(NullNameError):
+            AdaptiveFallback("missing").fetch(data_dict)
+
+    def test_reorders(self, data_structure_1):
+        to_fetch = AdaptiveFallback("a")
+        to_fetch.fetch(data_structure_1)
+
+        assert to_fetch.stats == {Attr: 1, Item: 0, Call: 0}
+        assert list(to_fetch.stats) == [Attr, Item, Call]
+
+    def test_reorders_back(self, data_structure_1):
+        to_fetch = AdaptiveFallback("a")
+        to_fetch.fetch(data_structure_1)
+
+        for _ in range(2):
+            to_fetch.fetch({"a": "a item"})
+
+        assert list(to_fetch.stats) == [Item, Attr, Call]
+
+    def test_ties_keep_order(self, data_structure_1):
+        to_fetch = AdaptiveFallback("a")
+        to_fetch.fetch(data_structure_1)
+        to_fetch.fetch({"a": "a item"})
+
+        assert list(to_fetch.stats) == [Attr, Item, Call]
+
+    def test_adapted_order_is_used(self):
+        class TwoValid(dict):
+            a = "a attr"
+
+        to_fetch = AdaptiveFallback("a")
+        assert to_fetch.fetch(TwoValid(a="a item")) == "a item"
+
+        to_fetch.fetch(TwoValid())
+        to_fetch.fetch(TwoValid())
+        assert to_fetch.fetch(TwoValid(a="a item")) == "a attr"
+
+    def test_place(self, data_structure_1):
+        to_place = AdaptiveFallback("a")
+        to_place.place(data_structure_1, "changed")
+
+        assert data_structure_1.a == "changed"
+        assert to_place.stats[Attr] == 1
+
+    def test_place_raises(self):
+        with pytest.raises(NullNameError):
+            AdaptiveFallback("a").place(1, "value")
+
+    def test_reset_stats(self, data_structure_1):
+        to_fetch = AdaptiveFallback("a")
+        to_fetch.fetch(data_structure_1)
+        to_fetch.reset_stats()
+
+        assert to_fetch.stats == {Item: 0, Call: 0, Attr: 0}
+
+    def test_bearing_classes_replaced(self, data_structure_1):
+        to_fetch = AdaptiveFallback("a")
+        to_fetch.fetch(data_structure_1)
+        to_fetch.BEARING_CLASSES = [Attr]
+
+        assert to_fetch.stats == {Attr: 0}
+
+    def test_factory(self):
+        to_place = AdaptiveFallback("a", factory=dict)
+        assert to_place.factory_type is dict
+
+        data = dict()
+        Course(to_place, "b").place(data, 1)
+        assert data == {"a": {"b": 1}}
+
+    def test_fallback_factory(self):
+        assert Fallback("a", factory=list).factory_type is list
+
+    def test_reuses_casts(self):
+        to_fetch = AdaptiveFallback("a")
+        to_fetch.fetch({"a": 1})
+        casts = to_fetch._cast_bearings()
+        assert all(any(x is y for y in casts) for x in to_fetch._load_attempts())
+
+    def test_threads(self):
+        class Record:
+            def __init__(self):
+                self.a = "a attr"
+
+        to_fetch = AdaptiveFallback("a")
+        targets = [Record(), {"a": "a item"}]
+        errors = list()
+
+        def work(offset):
+            try:
+                for i in range(2000):
+                    to_fetch.fetch(targets[(i + offset) % 2])
+            except NullNameError as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=work, args=(x,)) for x in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert sum(to_fetch.stats.values()) == 16000
+
+    def test_course(self, data_structure_1):
+        class AdaptiveCourse(Course):
+            BEARINGS = [Item, Call, Attr, AdaptiveFallback]
+
+        course = AdaptiveCourse("list_data", 4, "one dict")
+        assert isinstance(course[0], AdaptiveFallback)
+        assert course.fetch(data_structure_1) == 1
+        assert course[0].stats[Attr] == 1
+        assert course[2].stats[Item] == 1
+
+    def test_eq(self):
+        assert AdaptiveFallback("a") == Fallback("a")
+        assert AdaptiveFallback("a") == Attr("a")
+
+
+class TestWhere:
+    @pytest.fixture
+    def items(self):
+        return [
+            {"sku": "A1", "qty": 1},
+            {"sku": "B2", "qty": 5},
+            {"qty": 7},
+            {"sku": "B2", "qty": 9},
+        ]
+
+    @pytest.fixture(autouse=True)
+    def clear_indexes(self):
+        Where.clear_indexes()
+        yield
+        Where.clear_indexes()
+
+    def test_cast_str(self):
+        where = bearing("[sku=B2]", bearing_classes=[Where])
+        assert where.name == ("sku", "B2")
+        assert str(where) == "[sku=B2]"
+        assert where.field == Fallback("sku")
+        assert where.value == "B2"
+
+    def test_name_from_str_bad(self):
+        with pytest.raises(ValueError):
+            Where.name_from_str("[sku]")
+
+    def test_tuple_not_cast_from_bearing(self):
+        assert isinstance(bearing((5, 4)), Item)
+
+    def test_course_shorthand_is_item(self):
+        # "[a=b]" keys of existing data are not read as predicates.
+        course = Course("items/[sku=B2]/qty")
+        assert course[1] == Item("sku=B2")
+        assert not isinstance(course[1], Where)
+        assert course.fetch({"items": {"sku=B2": {"qty": 1}}}) == 1
+
+    def test_course_shorthand_opt_in(self):
+        class PredicateCourse(Course):
+            BEARINGS = [Where] + Course.BEARINGS
+
+        assert isinstance(PredicateCourse("items/[sku=B2]/qty")[1], Where)
+        assert isinstance(PredicateCourse("[1]")[0], Item)
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_fetch_first_match(self, items, indexed):
+        assert Where(("sku", "B2"), indexed=indexed).fetch(items) is items[1]
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_fetch_missing(self, items, indexed):
+        with pytest.raises(NullNameError):
+            Where(("sku", "C3"), indexed=indexed).fetch(items)
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_place(self, items, indexed):
+        Where(("sku", "B2"), indexed=indexed).place(items, {"sku": "B2", "qty": 0})
+        assert items[1] == {"sku": "B2", "qty": 0}
+        assert items[3]["qty"] == 9
+
+    def test_field_bearing(self):
+        class Row:
+            def __init__(self, key):
+                self.key = key
+
+        rows = [Row(1), Row(2)]
+        assert Where(("@key", 2)).fetch(rows) is rows[1]
+
+    def test_index_reused(self, items):
+        Where(("sku", "A1"), indexed=True).fetch(items)
+        items[0] = {"sku": "Z9"}
+
+        # the stale index entry is re-verified, and the index rebuilt.
+        with pytest.raises(NullNameError):
+            Where(("sku", "A1"), indexed=True).fetch(items)
+        assert Where(("sku", "Z9"), indexed=True).fetch(items) is items[0]
+
+    def test_index_miss_rebuilds(self, items):
+        Where(("sku", "A1"), indexed=True).fetch(items)
+        items[1] = {"sku": "C3"}
+
+        # no entry for the replaced element in the stale index.
+        assert Where(("sku", "C3"), indexed=True).fetch(items) is items[1]
+
+    def test_index_place_then_fetch(self, items):
+        Where(("sku", "B2"), indexed=True).place(items, {"sku": "C3", "qty": 0})
+        assert Where(("sku", "C3"), indexed=True).fetch(items) is items[1]
+
+    def test_index_length_invalidates(self, items):
+        where = Where(("sku", "C3"), indexed=True)
+        with pytest.raises(NullNameError):
+            where.fetch(items)
+        items.append({"sku": "C3"})
+        assert where.fetch(items) is items[-1]
+
+    def test_index_cache_bounded(self):
+        for i in range(Where.INDEX_CACHE_SIZE + 5):
+            Where(("sku", "A1"), indexed=True).fetch([{"sku": "A1"}])
+
+        from gemma._bearings import _WHERE_INDEXES
+
+        assert len(_WHERE_INDEXES) <= Where.INDEX_CACHE_SIZE
+
+    def test_unhashable_values_scanned(self):
+        rows = [{"tags": ["a"]}, {"tags": ["b"]}]
+        assert Where(("tags", ["b"]), indexed=True).fetch(rows) is rows[1]
+
+    def test_course_fetch_place(self):
+        order = {"items": [{"sku": "A1", "qty": 1}, {"sku": "B2", "qty": 5}]}
+        course = PORT / "items" / Where(("sku", "B2")) / "qty"
+
+        assert course.fetch(order) == 5
+        course.place(order, 6)
+        assert order["items"][1]["qty"] == 6
+
+    def test_not_fallback_candidate(self):
+        assert Where not in Course("a")[0].BEARING_CLASSES
+
+
+class TestPlaceCopy:
+    def test_item_dict(self, data_dict):
+        updated = Item("a dict").place_copy(data_dict, "changed")
+
+        assert updated["a dict"] == "changed"
+        assert data_dict["a dict"] == "a value"
+
+    def test_item_tuple(self):
+        assert Item(-1).place_copy((1, 2, 3), "changed") == (1, 2, "changed")
+
+    def test_attr_dataclass(self, data_structure_1):
+        updated = Attr("a").place_copy(data_structure_1, "changed")
+
+        assert updated.a == "changed"
+        assert data_structure_1.a == "a data"
+        assert updated.dict_data is data_structure_1.dict_data
+
+    def test_attr_missing(self, data_structure_1):
+        with pytest.raises(NullNameError):
+            Attr("missing").place_copy(data_structure_1, "changed")
+
+    def test_fallback(self, data_structure_1):
+        updated = Fallback("a").place_copy(data_structure_1, "changed")
+        assert updated.a == "changed"
+
+    def test_fallback_missing(self):
+        with pytest.raises(NullNameError):
+            Fallback("missing").place_copy((1, 2), "changed")
+
+    def test_attr_callable(self, data_structure_1):
+        with pytest.raises(TypeError):
+            Attr("caller_set_tester").place_copy(data_structure_1, "changed")
+
+
+class TestPickle:
+    @pytest.mark.parametrize(
+        "bearing_obj",
+        [
+            Item("a"),
+            Item(0, factory=list),
+            Attr("a"),
+            Call("a"),
+            Fallback("a"),
+            AdaptiveFallback("a"),
+            bearing("[sku=A1]", bearing_classes=[Where]),
+        ],
+    )
+    def test_round_trip(self, bearing_obj):
+        loaded = pickle.loads(pickle.dumps(bearing_obj))
+
+        assert type(loaded) is type(bearing_obj)
+        assert loaded == bearing_obj
+        assert loaded.factory_type is bearing_obj.factory_type
+
+    def test_fallback_classes(self):
+        loaded = pickle.loads(pickle.dumps(Course("a/b")))
+        assert loaded[0].BEARING_CLASSES == Course("a/b")[0].BEARING_CLASSES
+        assert loaded.fetch({"a": {"b": 1}}) == 1
@@ -0,0 +1,359 @@
+import pickle
+import threading
+
+import pytest
+
+import gemma._cache
+from gemma import (
+    CacheStats,
+    Cartographer,
+    CleanerCache,
+    Coordinate,
+    PORT,
+    memoize_cleaner,
+)
+
+
+class Clock:
+    """stands in for time.monotonic, so TTLs pass without waiting"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(gemma._cache, "_now", clock)
+    return clock
+
+
+@memoize_cleaner
+def square(value, coord, cache):
+    cache.setdefault("calls", list()).append(value)
+    return value * value
+
+
+class TestCleanerCache:
+    def test_mapping(self):
+        cache = CleanerCache()
+        cache["a"] = 1
+        cache.setdefault("b", list()).append(2)
+
+        assert cache == {"a": 1, "b": [2]}
+        assert cache.get("c") is None
+        del cache["a"]
+        assert "a" not in cache
+        assert len(cache) == 1
+
+    def test_lru(self):
+        cache = CleanerCache(max_size=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["a"] == 1
+
+        cache["c"] = 3
+        assert list(cache) == ["a", "c"]
+        assert cache.stats == CacheStats(hits=1, misses=0, evictions=1)
+
+    def test_set_existing_is_recent(self):
+        cache = CleanerCache(max_size=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"] = 10
+        cache["c"] = 3
+
+        assert dict(cache) == {"a": 10, "c": 3}
+
+    def test_contains_not_counted(self):
+        cache = CleanerCache(max_size=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert "a" in cache
+
+        # "in" did not make "a" recently used.
+        cache["c"] = 3
+        assert "a" not in cache
+        assert cache.stats == CacheStats(0, 0, 1)
+
+    def test_ttl(self, clock):
+        cache = CleanerCache(ttl=10)
+        cache["a"] = 1
+        clock.now = 5
+        cache["b"] = 2
+
+        clock.now = 12
+        assert "a" not in cache
+        with pytest.raises(KeyError):
+            cache["a"]
+        assert cache["b"] == 2
+        assert cache.stats == CacheStats(hits=1, misses=1, evictions=1)
+
+        clock.now = 20
+        assert len(cache) == 0
+        assert cache.stats.evictions == 2
+
+    def test_clear_keeps_stats(self):
+        cache = CleanerCache()
+        cache["a"] = 1
+        cache.get("a")
+        cache.get("b")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats == CacheStats(1, 1, 0)
+        assert cache.stats.hit_rate == 0.5
+
+    def test_hit_rate_empty(self):
+        assert CleanerCache().stats.hit_rate == 0.0
+
+    @pytest.mark.parametrize("kwargs", [{"max_size": 0}, {"ttl": 0}, {"scope": "run"}])
+    def test_bad_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            CleanerCache(**kwargs)
+
+    def test_pickle(self):
+        cache = CleanerCache(max_size=3, ttl=60, scope="map")
+        cache["a"] = 1
+        cache.get("a")
+
+        loaded = pickle.loads(pickle.dumps(cache))
+        assert (loaded.max_size, loaded.ttl, loaded.scope) == (3, 60, "map")
+        assert loaded.stats == CacheStats(0, 0, 0)
+        assert loaded == {"a": 1}
+
+    def test_run(self):
+        cache = CleanerCache(scope="map")
+        cache["outside"] = 1
+
+        with cache.run():
+            assert "outside" not in cache
+            cache["outer"] = 1
+            with cache.run():
+                assert len(cache) == 0
+                cache["inner"] = 2
+            assert dict(cache) == {"outer": 1}
+
+        # the last run to exit is left in place.
+        assert dict(cache) == {"outer": 1}
+
+    def test_run_continued(self):
+        cache = CleanerCache(scope="map")
+        first, second = cache.run(), cache.run()
+
+        with first:
+            cache["a"] = 1
+        with second:
+            cache["b"] = 2
+        with first:
+            assert dict(cache) == {"a": 1}
+
+    def test_run_persistent(self):
+        cache = CleanerCache()
+        cache["a"] = 1
+        with cache.run():
+            cache["b"] = 2
+        assert dict(cache) == {"a": 1, "b": 2}
+
+    def test_threads(self):
+        cache = CleanerCache(max_size=50)
+
+        def work(offset):
+            for i in range(1000):
+                cache[offset + i] = i
+                cache.get(offset + i - 1)
+
+        threads = [threading.Thread(target=work, args=(x * 1000,)) for x in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 50
+        assert cache.stats.evictions == 4000 - 50
+
+
+class TestCartographerCache:
+    def test_default_persistent(self):
+        cart = Cartographer()
+        assert isinstance(cart.cache, CleanerCache)
+
+        cart.cache["kept"] = True
+        cart.map({"a": 1}, dict(), [Coordinate(PORT / "a")])
+        assert cart.cache["kept"] is True
+
+    def test_settings(self):
+        cart = Cartographer(cache_size=10, cache_ttl=5, cache_scope="map")
+        cache = cart.cache
+        assert (cache.max_size, cache.ttl, cache.scope) == (10, 5, "map")
+
+    def test_map_scope(self):
+        cart = Cartographer(cache_scope="map")
+        coordinates = [Coordinate(PORT / "a", clean_value=square)]
+
+        cart.map({"a": 3}, dict(), coordinates)
+        cart.map({"a": 3}, dict(), coordinates)
+        assert cart.cache.stats.hits == 0
+        assert cart.cache["calls"] == [3]
+
+    def test_map_scope_plan(self):
+        cart = Cartographer(cache_scope="map")
+        plan = cart.compile([Coordinate(PORT / "a", clean_value=square)])
+        records = [{"a": 2}, {"a": 2}, {"a": 3}]
+
+        assert list(plan.map_many(records, dict)) == [{"a": 4}, {"a": 4}, {"a": 9}]
+        assert cart.cache["calls"] == [2, 3]
+
+        list(plan.map_chunked(records, dict))
+        assert cart.cache["calls"] == [2, 3]
+
+        plan.map({"a": 5}, dict())
+        assert cart.cache["calls"] == [5]
+
+    def test_map_scope_nested(self):
+        cart = Cartographer(cache_scope="map")
+        inner = [Coordinate(PORT / "x", clean_value=square)]
+
+        def nested(value, coord, cache):
+            cart.map({"x": 7}, dict(), inner)
+            return value
+
+        coordinates = [
+            Coordinate(PORT / "a", PORT / "a", clean_value=square),
+            Coordinate(PORT / "b", PORT / "b", clean_value=nested),
+            Coordinate(PORT / "a", PORT / "c", clean_value=square),
+        ]
+        destination = dict()
+        cart.map({"a": 3, "b": 0}, destination, coordinates)
+
+        assert destination == {"a": 9, "b": 0, "c": 9}
+        # the nested run did not clear the entries of the outer one.
+        assert cart.cache["calls"] == [3]
+
+    def test_map_scope_interleaved(self):
+        calls = list()
+
+        @memoize_cleaner
+        def double(value, coord, cache):
+            calls.append(value)
+            return value * 2
+
+        cart = Cartographer(cache_scope="map")
+        plan = cart.compile([Coordinate(PORT / "a", clean_value=double)])
+        twos = plan.map_many([{"a": 2}] * 3, dict)
+        threes = plan.map_many([{"a": 3}] * 3, dict)
+
+        assert list(zip(twos, threes)) == [({"a": 4}, {"a": 6})] * 3
+        assert calls == [2, 3]
+
+    def test_map_scope_threads(self):
+        calls = list()
+
+        @memoize_cleaner
+        def double(value, coord, cache):
+            calls.append(value)
+            return value * 2
+
+        cart = Cartographer(cache_scope="map")
+        plan = cart.compile([Coordinate(PORT / "a", clean_value=double)])
+        barrier = threading.Barrier(4)
+
+        def work(value):
+            barrier.wait()
+            for _ in plan.map_many([{"a": value}] * 500, dict):
+                pass
+
+        threads = [threading.Thread(target=work, args=(x,)) for x in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(calls) == [0, 1, 2, 3]
+
+    def test_persistent_plan(self):
+        cart = Cartographer()
+        plan = cart.compile([Coordinate(PORT / "a", clean_value=square)])
+
+        list(plan.map_many([{"a": 2}, {"a": 3}], dict))
+        list(plan.map_many([{"a": 2}, {"a": 4}], dict))
+        assert cart.cache["calls"] == [2, 3, 4]
+
+
+class TestMemoizeCleaner:
+    def test_memoized(self):
+        cart = Cartographer()
+        coordinates = [
+            Coordinate(PORT / "a", PORT / "a", clean_value=square),
+            Coordinate(PORT / "b", PORT / "b", clean_value=square),
+        ]
+        plan = cart.compile(coordinates)
+        records = [{"a": 2, "b": 2}, {"a": 2, "b": 3}]
+
+        assert list(plan.map_many(records, dict)) == [
+            {"a": 4, "b": 4},
+            {"a": 4, "b": 9},
+        ]
+        # shared by coordinates, so only 2 and 3 were squared.
+        assert cart.cache["calls"] == [2, 3]
+
+    def test_types_kept_apart(self):
+        @memoize_cleaner
+        def as_text(value, coord, cache):
+            return str(value)
+
+        coordinates = [
+            Coordinate(PORT / "a", PORT / "a", clean_value=as_text),
+            Coordinate(PORT / "b", PORT / "b", clean_value=as_text),
+        ]
+        destination = dict()
+        Cartographer().map({"a": 1, "b": True}, destination, coordinates)
+
+        assert destination == {"a": "1", "b": "True"}
+
+    def test_unhashable(self):
+        @memoize_cleaner
+        def total(value, coord, cache):
+            cache["calls"] = cache.get("calls", 0) + 1
+            return sum(value)
+
+        cart = Cartographer()
+        plan = cart.compile([Coordinate(PORT / "a", clean_value=total)])
+        results = list(plan.map_many([{"a": [1, 2]}, {"a": [1, 2]}], dict))
+
+        assert results == [{"a": 3}, {"a": 3}]
+        assert cart.cache["calls"] == 2
+
+    def test_bounded(self):
+        cart = Cartographer(cache_size=2)
+        plan = cart.compile([Coordinate(PORT / "a", clean_value=square)])
+        list(plan.map_many([{"a": x} for x in range(10)], dict))
+
+        assert len(cart.cache) == 2
+        assert cart.cache.stats.evictions == 9
+
+    def test_ttl(self, clock):
+        calls = list()
+
+        @memoize_cleaner
+        def double(value, coord, cache):
+            calls.append(value)
+            return value * 2
+
+        cart = Cartographer(cache_ttl=10)
+        coordinates = [Coordinate(PORT / "a", clean_value=double)]
+
+        cart.map({"a": 2}, dict(), coordinates)
+        clock.now = 5
+        cart.map({"a": 2}, dict(), coordinates)
+        clock.now = 11
+        cart.map({"a": 2}, dict(), coordinates)
+
+        assert calls == [2, 2]
+        assert cart.cache.stats == CacheStats(hits=1, misses=2, evictions=1)
+
+    def test_pickle(self):
+        assert pickle.loads(pickle.dumps(square)) is square
@@ -1,9 +1,16 @@
+import pickle
 import pytest
+import threading
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import Optional
 
 from gemma import (
+    MappingPlan,
+    FetchStats,
+    Item,
+    Attr,
+    Call,
     Surveyor,
     Cartographer,
     Coordinate,
@@ -14,9 +21,30 @@ from gemma import (
     NonNavigableError,
     Compass,
     NO_DEFAULT,
+    batch_cleaner,
+    register_cleaner,
 )
 
 
+def double_value(value, coord, cache):
+    """module level, so plans using it can be sent to worker processes"""
+    return value * 2
+
+
+@batch_cleaner
+def double_batch(values, coord, cache):
+    cache.setdefault("batches", list()).append(len(values))
+    return [x * 2 for x in values]
+
+
+class BatchCart(Cartographer):
+    """module level, so plans using its batch method can be sent to workers"""
+
+    @batch_cleaner
+    def clean_value(self, values, coordinate):
+        return [str(x) for x in values]
+
+
 class TestBasicMapping:
     def test_dataclass_to_dict(
         self,
@@ -665,3 +693,800 @@ class TestSuppressErrors:
         assert isinstance(raised.errors[0], NullNameError)
 
         assert destination == Dest("a value")
+
+
+class TestMapColumns:
+    def test_rename(self):
+        origin = {"[a]": [1, 2], "[b]": ["x", "y"]}
+        destination = dict()
+
+        coordinates = [Coordinate(PORT / "a", PORT / "renamed"), Coordinate(PORT / "b")]
+        Cartographer().map_columns(origin, destination, coordinates)
+
+        assert destination == {"renamed": [1, 2], "b": ["x", "y"]}
+        assert destination["renamed"] is origin["[a]"]
+
+    def test_exact_key(self):
+        origin = {"a/b": [1], "[a]/[b]": [2]}
+        destination = dict()
+
+        Cartographer().map_columns(
+            origin, destination, [Coordinate(Course("[a]/[b]"), PORT / "x")]
+        )
+        assert destination == {"x": [2]}
+
+    def test_clean_value_whole_column(self):
+        calls = list()
+
+        def double(column, coord, cache):
+            calls.append(column)
+            return [x * 2 for x in column]
+
+        destination = dict()
+        Cartographer().map_columns(
+            {"a": [1, 2, 3]},
+            destination,
+            [Coordinate(PORT / "a", PORT / "b", clean_value=double)],
+        )
+
+        assert calls == [[1, 2, 3]]
+        assert destination == {"b": [2, 4, 6]}
+
+    def test_many_to_many(self):
+        def split(columns, coord, cache):
+            first, last = columns
+            return first, [f"{x} {y}" for x, y in zip(first, last)]
+
+        destination = dict()
+        coordinate = Coordinate(
+            (PORT / "first", PORT / "last"),
+            (PORT / "given", PORT / "full"),
+            clean_value=split,
+        )
+        Cartographer().map_columns(
+            {"first": ["a", "b"], "last": ["c", "d"]}, destination, [coordinate]
+        )
+
+        assert destination == {"given": ["a", "b"], "full": ["a c", "b d"]}
+
+    def test_cartographer_clean_value(self):
+        class Summing(Cartographer):
+            def clean_value(self, values, coordinate):
+                return sum(values)
+
+        destination = dict()
+        Summing().map_columns({"a": [1, 2, 3]}, destination, [Coordinate(PORT / "a")])
+        assert destination == {"a": 6}
+
+    def test_from_to_columns(self):
+        records = [{"user": {"age": 30}}, {"user": {}}, {"user": {"age": 40}}]
+        columns = Surveyor().to_columns(records)
+
+        destination = dict()
+        Cartographer().map_columns(
+            columns, destination, [Coordinate(Course("user/age"), PORT / "age")]
+        )
+        assert destination == {"age": [30, None, 40]}
+
+    def test_default(self):
+        destination = dict()
+        Cartographer().map_columns(
+            {"a": [1, 2]},
+            destination,
+            [Coordinate(PORT / "missing", PORT / "b", default=0)],
+        )
+        assert destination == {"b": [0, 0]}
+
+    def test_missing(self):
+        with pytest.raises(NullNameError):
+            Cartographer().map_columns({"a": [1]}, dict(), [Coordinate(PORT / "b")])
+
+    def test_suppressed(self):
+        destination = dict()
+        coordinates = [Coordinate(PORT / "b"), Coordinate(PORT / "a")]
+
+        with pytest.raises(SuppressedErrors) as error:
+            Cartographer().map_columns(
+                {"a": [1]}, destination, coordinates, exceptions=False
+            )
+
+        assert len(error.value.errors) == 1
+        assert destination == {"a": [1]}
+
+    def test_numpy(self):
+        numpy = pytest.importorskip("numpy")
+
+        destination = dict()
+        Cartographer().map_columns(
+            {"a": numpy.array([1.0, 2.0])},
+            destination,
+            [Coordinate(PORT / "a", clean_value=lambda c, coord, cache: c * 10)],
+        )
+        assert destination["a"].tolist() == [10.0, 20.0]
+
+
+class TestCompile:
+    def test_map_many(self):
+        coordinates = [
+            Coordinate(PORT / "a", PORT / "x"),
+            Coordinate(PORT / "b", PORT / "y" / "z"),
+        ]
+        plan = Cartographer().compile(coordinates)
+
+        records = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+        results = list(plan.map_many(records, lambda: {"y": {}}))
+
+        assert results == [{"x": 1, "y": {"z": 2}}, {"x": 3, "y": {"z": 4}}]
+        assert plan.coordinates == tuple(coordinates)
+        assert len(plan) == 2
+
+    def test_matches_map(self, data_simple):
+        def join(values, coord, cache):
+            return " ".join(values)
+
+        coordinates = [
+            Coordinate(PORT / "a", PORT / "strings" / "a-mapped"),
+            Coordinate(PORT / "one"),
+            Coordinate((PORT / "a", PORT / "b"), PORT / "ab", clean_value=join),
+        ]
+
+        expected: dict = defaultdict(dict)
+        Cartographer().map(data_simple, expected, coordinates)
+
+        result: dict = defaultdict(dict)
+        Cartographer().compile(coordinates).map(data_simple, result)
+
+        assert result == expected
+
+    def test_course_cleaners_called_once(self):
+        calls = list()
+
+        class Counting(Cartographer):
+            def clean_org(self, course, coordinate):
+                calls.append(course)
+                return course
+
+        plan = Counting().compile([Coordinate(PORT / "a")])
+        list(plan.map_many([{"a": 1}] * 5, dict))
+
+        assert len(calls) == 1
+
+    def test_clean_value_per_record(self):
+        def double(value, coord, cache):
+            cache["calls"] = cache.get("calls", 0) + 1
+            return value * 2
+
+        cart = Cartographer()
+        plan = cart.compile([Coordinate(PORT / "a", clean_value=double)])
+        results = list(plan.map_many([{"a": 1}, {"a": 2}], dict))
+
+        assert results == [{"a": 2}, {"a": 4}]
+        assert cart.cache["calls"] == 2
+
+    def test_default(self):
+        plan = Cartographer().compile([Coordinate(PORT / "a", default=None)])
+        assert list(plan.map_many([{}], dict)) == [{"a": None}]
+
+    def test_missing(self):
+        plan = Cartographer().compile([Coordinate(PORT / "a")])
+        with pytest.raises(NullNameError):
+            list(plan.map_many([{"a": 1}, {}], dict))
+
+    def test_suppressed(self):
+        plan = Cartographer().compile([Coordinate(PORT / "a"), Coordinate(PORT / "b")])
+
+        results = list()
+        with pytest.raises(SuppressedErrors) as error:
+            for result in plan.map_many([{"a": 1}, {"b": 2}], dict, exceptions=False):
+                results.append(result)
+
+        assert results == [{"a": 1}, {"b": 2}]
+        assert len(error.value.errors) == 2
+
+
+class TestMappingState:
+    def test_coordinates_unchanged(self):
+        coordinate = Coordinate(PORT / "a", clean_value=lambda v, c, cache: v + 1)
+        Cartographer().map({"a": 1}, dict(), [coordinate])
+        Cartographer().compile([coordinate])
+
+        assert not hasattr(coordinate, "clean")
+
+    def test_generator_coordinates(self):
+        destination = dict()
+        coordinates = (Coordinate(PORT / x) for x in "ab")
+        Cartographer().map({"a": 1, "b": 2}, destination, coordinates)
+
+        assert destination == {"a": 1, "b": 2}
+
+    def test_nested_map(self):
+        cart = Cartographer()
+
+        def map_children(children, coord, cache):
+            mapped = list()
+            for child in children:
+                destination = dict()
+                cart.map(child, destination, coordinates)
+                mapped.append(destination)
+            return mapped
+
+        # the same coordinates are mapped again while each parent is being mapped.
+        coordinates = [
+            Coordinate(PORT / "x", PORT / "y", clean_value=lambda v, c, cache: v * 2),
+            Coordinate(PORT / "children", PORT / "kids", clean_value=map_children),
+        ]
+        data = {"x": 1, "children": [{"x": 2, "children": []}]}
+
+        destination = dict()
+        cart.map(data, destination, coordinates)
+        assert destination == {"y": 2, "kids": [{"y": 4, "kids": []}]}
+
+    @pytest.mark.parametrize("compiled", [False, True])
+    def test_threads(self, compiled):
+        import threading
+        import time
+
+        def slow_double(value, coord, cache):
+            # gives other threads a chance to run between fetch and place.
+            time.sleep(0)
+            return value * 2
+
+        cart = Cartographer()
+        coordinates = [
+            Coordinate(PORT / "a", PORT / "doubled", clean_value=slow_double),
+            Coordinate((PORT / "a", PORT / "b"), PORT / "pair"),
+        ]
+        plan = cart.compile(coordinates)
+        failures = list()
+
+        def work(offset: int) -> None:
+            for i in range(offset, offset + 300):
+                destination = dict()
+                if compiled:
+                    plan.map({"a": i, "b": -i}, destination)
+                else:
+                    cart.map({"a": i, "b": -i}, destination, coordinates)
+                if destination != {"doubled": i * 2, "pair": (i, -i)}:
+                    failures.append(destination)
+
+        threads = [
+            threading.Thread(target=work, args=(x * 1000,)) for x in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert failures == []
+
+
+class TestFetchMemo:
+    @pytest.fixture
+    def data(self) -> dict:
+        return {
+            "customer": {
+                "address": {"street": "Main", "city": "Here"},
+                "name": "Joe",
+            }
+        }
+
+    def test_shared_prefixes(self, data):
+        cart = Cartographer()
+        destination = dict()
+        coordinates = [
+            Coordinate(PORT / "customer" / "address" / "street", PORT / "street"),
+            Coordinate(PORT / "customer" / "address" / "city", PORT / "city"),
+            Coordinate(PORT / "customer" / "name", PORT / "name"),
+        ]
+        cart.map(data, destination, coordinates, memoize=True)
+
+        assert destination == {"street": "Main", "city": "Here", "name": "Joe"}
+        assert cart.fetch_stats == FetchStats(hits=3, misses=5)
+        assert cart.fetch_stats.hit_rate == 3 / 8
+
+    def test_stats_per_run(self, data):
+        cart = Cartographer()
+        assert cart.fetch_stats == FetchStats(0, 0)
+        assert cart.fetch_stats.hit_rate == 0.0
+
+        coordinates = [Coordinate(PORT / "customer" / "name", PORT / "name")]
+        cart.map(data, dict(), coordinates, memoize=True)
+        cart.map(data, dict(), coordinates, memoize=True)
+
+        assert cart.fetch_stats == FetchStats(hits=0, misses=2)
+
+    def test_stats_per_thread(self, data):
+        cart = Cartographer()
+        shared = [
+            Coordinate(PORT / "customer" / "address" / "street", PORT / "street"),
+            Coordinate(PORT / "customer" / "address" / "city", PORT / "city"),
+        ]
+        single = [Coordinate(PORT / "customer" / "name", PORT / "name")]
+        barrier = threading.Barrier(2)
+        results = {"shared": set(), "single": set()}
+
+        def work(name, coordinates):
+            barrier.wait()
+            for _ in range(200):
+                cart.map(data, dict(), coordinates, memoize=True)
+                results[name].add(cart.fetch_stats)
+
+        threads = [
+            threading.Thread(target=work, args=("shared", shared)),
+            threading.Thread(target=work, args=("single", single)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results["shared"] == {FetchStats(hits=2, misses=4)}
+        assert results["single"] == {FetchStats(hits=0, misses=2)}
+        assert cart.fetch_stats == FetchStats(0, 0)
+
+    def test_stats_pickle(self, data):
+        cart = Cartographer()
+        coordinates = [Coordinate(PORT / "customer" / "name", PORT / "name")]
+        cart.map(data, dict(), coordinates, memoize=True)
+
+        loaded = pickle.loads(pickle.dumps(cart))
+        assert loaded.fetch_stats == FetchStats(0, 0)
+
+    def test_memoize_off(self, data):
+        cart = Cartographer()
+        destination = dict()
+        coordinates = [
+            Coordinate(PORT / "customer" / "address" / "street", PORT / "street"),
+            Coordinate(PORT / "customer" / "address" / "city", PORT / "city"),
+        ]
+        cart.map(data, dict(), coordinates, memoize=True)
+        cart.map(data, destination, coordinates, memoize=False)
+
+        assert destination == {"street": "Main", "city": "Here"}
+        assert cart.fetch_stats == FetchStats(0, 0)
+
+    @pytest.mark.parametrize("memoize", [True, False])
+    def test_defaults_and_errors(self, data, memoize):
+        cart = Cartographer()
+        destination = dict()
+        coordinates = [
+            Coordinate(PORT / "customer" / "phone" / "home", PORT / "phone", default=0),
+            Coordinate(PORT / "customer" / "phone", PORT / "phone2", default=None),
+            Coordinate(
+                (PORT / "customer" / "name", PORT / "customer" / "age"),
+                PORT / "pair",
+                default=(NO_DEFAULT, 0),
+            ),
+        ]
+        cart.map(data, destination, coordinates, memoize=memoize)
+        assert destination == {"phone": 0, "phone2": None, "pair": ("Joe", 0)}
+
+        bad = [Coordinate(PORT / "customer" / "phone" / "home", PORT / "phone")]
+        with pytest.raises(NullNameError):
+            cart.map(data, dict(), bad, memoize=memoize)
+
+    def test_matches_unmemoized(self):
+        data = {"a": [{"b": 1, "c": 2}, {"b": 3}], "d": {"e": {"f": 4}}}
+        coordinates = [
+            Coordinate(PORT / "a" / 0 / "b", PORT / "one"),
+            Coordinate(PORT / "a" / Item(0) / "c", PORT / "two"),
+            Coordinate(PORT / "a" / 1 / "b", PORT / "three"),
+            Coordinate(PORT / "d" / "e" / "f", PORT / "four"),
+            Coordinate(PORT / "d" / "e" / Call("keys"), PORT / "keys"),
+            Coordinate(PORT / "a" / 1 / "c", PORT / "five", default=5),
+        ]
+
+        memoized = dict()
+        Cartographer().map(data, memoized, coordinates, memoize=True)
+        plain = dict()
+        Cartographer().map(data, plain, coordinates, memoize=False)
+
+        assert memoized == plain
+        assert memoized["one"] == 1
+        assert memoized["two"] == 2
+        assert memoized["five"] == 5
+
+    def test_default_off(self, data):
+        cart = Cartographer()
+        coordinates = [
+            Coordinate(PORT / "customer" / "address" / "street", PORT / "street"),
+            Coordinate(PORT / "customer" / "address" / "city", PORT / "city"),
+        ]
+        cart.map(data, dict(), coordinates)
+        assert cart.fetch_stats == FetchStats(0, 0)
+
+    def test_in_place(self):
+        coordinates = [
+            Coordinate(PORT / "a", PORT / "c"),
+            Coordinate(PORT / "b", PORT / "a"),
+            Coordinate(PORT / "a", PORT / "d"),
+        ]
+        data = {"a": {"x": 1}, "b": {"x": 2}}
+        cart = Cartographer()
+        cart.map(data, data, coordinates, memoize=True)
+
+        assert data["c"] == {"x": 1}
+        assert data["d"] == {"x": 2}
+        assert cart.fetch_stats == FetchStats(0, 0)
+
+    def test_item_and_attr_kept_apart(self):
+        @dataclass
+        class Both(dict):
+            value: str = "attr"
+
+        data = Both()
+        data["value"] = "item"
+
+        destination = dict()
+        coordinates = [
+            Coordinate(PORT / Item("value"), PORT / "item"),
+            Coordinate(PORT / Attr("value"), PORT / "attr"),
+        ]
+        cart = Cartographer()
+        cart.map(data, destination, coordinates, memoize=True)
+
+        assert destination == {"item": "item", "attr": "attr"}
+        assert cart.fetch_stats.hits == 0
+
+
+class FetchCounter(dict):
+    """dict that records the keys fetched from it"""
+
+    fetched: list = list()
+
+    def __getitem__(self, key):
+        self.fetched.append(key)
+        return super().__getitem__(key)
+
+
+class TestParentMemo:
+    @pytest.fixture
+    def coordinates(self) -> list:
+        shipping = PORT / Item("shipping", factory=dict) / Item("address", factory=dict)
+        return [
+            Coordinate(PORT / "street", shipping / "street"),
+            Coordinate(PORT / "city", shipping / "city"),
+            Coordinate(PORT / "zip", shipping / "zip"),
+        ]
+
+    def test_coordinate_replaces_cached_parent(self):
+        data = {"a": 1, "new": {"kept": True}, "b": 2}
+        coordinates = [
+            Coordinate(PORT / "a", PORT / "x" / "a"),
+            Coordinate(PORT / "new", PORT / "x"),
+            Coordinate(PORT / "b", PORT / "x" / "b"),
+        ]
+        destination = {"x": dict()}
+        Cartographer().map(data, destination, coordinates, memoize=True)
+
+        assert destination == {"x": {"kept": True, "b": 2}}
+        assert destination["x"] is data["new"]
+
+    def test_cleaner_replaces_parent_by_default(self):
+        destination = {"x": dict()}
+
+        def replace_parent(value, coord, cache):
+            destination["x"] = {"replaced": True}
+            return value
+
+        coordinates = [
+            Coordinate(PORT / "a", PORT / "x" / "a"),
+            Coordinate(PORT / "b", PORT / "x" / "b", clean_value=replace_parent),
+            Coordinate(PORT / "c", PORT / "x" / "c"),
+        ]
+        Cartographer().map({"a": 1, "b": 2, "c": 3}, destination, coordinates)
+
+        assert destination == {"x": {"replaced": True, "b": 2, "c": 3}}
+
+    @pytest.mark.parametrize("memoize, fetches", [(True, 1), (False, 3)])
+    def test_siblings(self, coordinates, memoize, fetches):
+        destination = FetchCounter()
+        destination.fetched = list()
+        data = {"street": "Main", "city": "Here", "zip": 1}
+        Cartographer().map(data, destination, coordinates, memoize=memoize)
+
+        assert destination == {"shipping": {"address": data}}
+        assert destination.fetched.count("shipping") == fetches
+
+    @pytest.mark.parametrize(
+        "coordinates",
+        [
+            # a kept parent is replaced by a placed value.
+            [
+                Coordinate(PORT / "a", PORT / Item("x", factory=dict) / "a"),
+                Coordinate(PORT / "new", PORT / "x"),
+                Coordinate(PORT / "b", PORT / Item("x", factory=dict) / "b"),
+            ],
+            # ... through a bearing of another type.
+            [
+                Coordinate(PORT / "a", PORT / "x" / "a"),
+                Coordinate(PORT / "new", PORT / Item("x")),
+                Coordinate(PORT / "b", PORT / "x" / "b"),
+            ],
+            # a kept parent is replaced by a factory node.
+            [
+                Coordinate(PORT / "a", PORT / "x" / "a"),
+                Coordinate(PORT / "b", PORT / Item("x", factory=list) / Item(0)),
+                Coordinate(PORT / "a", PORT / "x" / Item(1)),
+            ],
+            # a list index is replaced through a negative index.
+            [
+                Coordinate(PORT / "a", PORT / "items" / 1 / "a"),
+                Coordinate(PORT / "new", PORT / "items" / -1),
+                Coordinate(PORT / "b", PORT / "items" / 1 / "b"),
+            ],
+            # a bearing that is not kept places the value.
+            [
+                Coordinate(PORT / "a", PORT / "x" / "a"),
+                Coordinate(PORT / "new", PORT / Call("update")),
+                Coordinate(PORT / "b", PORT / "x" / "b"),
+            ],
+        ],
+    )
+    def test_matches_unmemoized(self, coordinates):
+        def data() -> dict:
+            return {"a": 1, "b": 2, "new": {"x": {"c": 3}}}
+
+        def destination() -> dict:
+            return {"x": {"z": 0}, "items": [{"i": 0}, {"i": 1}]}
+
+        memoized = destination()
+        plain = destination()
+        try:
+            Cartographer().map(data(), plain, coordinates, memoize=False)
+        except Exception as error:
+            with pytest.raises(type(error)):
+                Cartographer().map(data(), memoized, coordinates, memoize=True)
+        else:
+            Cartographer().map(data(), memoized, coordinates, memoize=True)
+
+        assert memoized == plain
+
+
+class TestMapParallel:
+    @pytest.fixture
+    def plan(self) -> MappingPlan:
+        return Cartographer().compile(
+            [
+                Coordinate(PORT / "a", PORT / "doubled", clean_value=double_value),
+                Coordinate(PORT / "b", PORT / "b", default=None),
+            ]
+        )
+
+    def test_ordered(self, plan):
+        records = ({"a": i, "b": -i} for i in range(25))
+        results = list(plan.map_parallel(records, dict, workers=2, chunk_size=4))
+
+        assert results == [{"doubled": i * 2, "b": -i} for i in range(25)]
+
+    def test_unordered(self, plan):
+        records = [{"a": i} for i in range(25)]
+        results = plan.map_parallel(
+            records, dict, workers=2, chunk_size=3, ordered=False
+        )
+
+        assert sorted(x["doubled"] for x in results) == [i * 2 for i in range(25)]
+
+    def test_matches_map_many(self, plan):
+        records = [{"a": i, "b": str(i)} for i in range(10)]
+        parallel = list(plan.map_parallel(records, dict, workers=2, chunk_size=3))
+        assert parallel == list(plan.map_many(records, dict))
+
+    def test_empty(self, plan):
+        assert list(plan.map_parallel([], dict, workers=2)) == []
+
+    def test_missing(self, plan):
+        records = [{"a": 1}, {"b": 2}]
+        with pytest.raises(NullNameError):
+            list(plan.map_parallel(records, dict, workers=2, chunk_size=1))
+
+    def test_suppressed(self, plan):
+        records = [{"a": 1}, {"b": 2}, {"c": 3}, {"a": 4}]
+
+        results = list()
+        with pytest.raises(SuppressedErrors) as error:
+            for result in plan.map_parallel(
+                records, dict, workers=2, chunk_size=1, exceptions=False
+            ):
+                results.append(result)
+
+        assert len(error.value.errors) == 2
+        assert all(isinstance(x, NullNameError) for x in error.value.errors)
+        assert results == [
+            {"doubled": 2, "b": None},
+            {"b": 2},
+            {"b": None},
+            {"doubled": 8, "b": None},
+        ]
+
+    def test_chunk_size(self, plan):
+        with pytest.raises(ValueError):
+            list(plan.map_parallel([{"a": 1}], dict, chunk_size=0))
+
+    def test_batch_cleaner(self):
+        plan = Cartographer().compile(
+            [Coordinate(PORT / "a", PORT / "doubled", clean_value=double_batch)]
+        )
+        records = [{"a": i} for i in range(10)]
+        results = list(plan.map_parallel(records, dict, workers=2, chunk_size=4))
+
+        assert results == [{"doubled": i * 2} for i in range(10)]
+
+    def test_batch_cleaner_method(self):
+        plan = BatchCart().compile([Coordinate(PORT / "a")])
+        records = [{"a": i} for i in range(10)]
+        results = list(plan.map_parallel(records, dict, workers=2, chunk_size=4))
+
+        assert results == [{"a": str(i)} for i in range(10)]
+
+
+class TestMapChunked:
+    def test_batches(self):
+        cart = Cartographer()
+        coordinates = [
+            Coordinate(PORT / "a", PORT / "doubled", clean_value=double_batch),
+            Coordinate(PORT / "b", PORT / "b", clean_value=double_value),
+        ]
+        records = [{"a": i, "b": -i} for i in range(7)]
+        results = list(cart.map_chunked(records, dict, coordinates, chunk_size=3))
+
+        assert results == [{"doubled": i * 2, "b": -i * 2} for i in range(7)]
+        assert cart.cache["batches"] == [3, 3, 1]
+
+    def test_matches_map_many(self):
+        coordinates = [
+            Coordinate(PORT / "a", PORT / "a", clean_value=double_batch),
+            Coordinate((PORT / "a", PORT / "b"), (PORT / "x", PORT / "y")),
+            Coordinate(PORT / "c", PORT / "c", default=0),
+        ]
+        plan = Cartographer().compile(coordinates)
+        records = [{"a": i, "b": str(i), "c": i} for i in range(5)]
+        records.append({"a": 1, "b": "x"})
+
+        chunked = list(plan.map_chunked(records, dict, chunk_size=2))
+        assert chunked == list(plan.map_many(records, dict))
+
+    def test_map_calls_batch_of_one(self):
+        cart = Cartographer()
+        coordinates = [Coordinate(PORT / "a", PORT / "a", clean_value=double_batch)]
+
+        destination = dict()
+        cart.map({"a": 2}, destination, coordinates)
+
+        assert destination == {"a": 4}
+        assert cart.cache["batches"] == [1]
+
+    def test_multiple_origins(self):
+        @batch_cleaner
+        def total(values, coord, cache):
+            return [x * y for x, y in values]
+
+        coordinates = [
+            Coordinate(
+                (PORT / "price", PORT / "qty"), PORT / "total", clean_value=total
+            )
+        ]
+        records = [{"price": 2, "qty": 3}, {"price": 5, "qty": 1}]
+        results = list(Cartographer().map_chunked(records, dict, coordinates))
+
+        assert results == [{"total": 6}, {"total": 5}]
+
+    def test_registered_by_name(self):
+        @register_cleaner("tests.chunked.negate")
+        @batch_cleaner
+        def negate(values, coord, cache):
+            return [-x for x in values]
+
+        coordinates = [Coordinate(PORT / "a", clean_value="tests.chunked.negate")]
+        records = [{"a": 1}, {"a": 2}]
+        results = list(Cartographer().map_chunked(records, dict, coordinates))
+
+        assert results == [{"a": -1}, {"a": -2}]
+
+    def test_cartographer_method(self):
+        class Batches(Cartographer):
+            @batch_cleaner
+            def clean_value(self, values, coordinate):
+                self.cache.setdefault("batches", list()).append(len(values))
+                return [str(x) for x in values]
+
+        cart = Batches()
+        coordinates = [Coordinate(PORT / "a")]
+        results = list(cart.map_chunked([{"a": 1}, {"a": 2}], dict, coordinates))
+
+        assert results == [{"a": "1"}, {"a": "2"}]
+        assert cart.cache["batches"] == [2]
+
+    def test_missing_left_out_of_batch(self):
+        cart = Cartographer()
+        coordinates = [Coordinate(PORT / "a", PORT / "a", clean_value=double_batch)]
+        records = [{"a": 1}, {"b": 2}, {"a": 3}]
+
+        results = list()
+        with pytest.raises(SuppressedErrors) as error:
+            for result in cart.map_chunked(
+                records, dict, coordinates, exceptions=False
+            ):
+                results.append(result)
+
+        assert results == [{"a": 2}, {}, {"a": 6}]
+        assert len(error.value.errors) == 1
+        assert cart.cache["batches"] == [2]
+
+    def test_missing_raises(self):
+        coordinates = [Coordinate(PORT / "a", clean_value=double_batch)]
+        with pytest.raises(NullNameError):
+            list(Cartographer().map_chunked([{"b": 1}], dict, coordinates))
+
+    def test_wrong_length(self):
+        @batch_cleaner
+        def drop_one(values, coord, cache):
+            return values[1:]
+
+        coordinates = [Coordinate(PORT / "a", clean_value=drop_one)]
+        with pytest.raises(ValueError):
+            list(Cartographer().map_chunked([{"a": 1}, {"a": 2}], dict, coordinates))
+
+    def test_numpy(self):
+        numpy = pytest.importorskip("numpy")
+
+        @batch_cleaner("numpy")
+        def to_meters(values, coord, cache):
+            assert isinstance(values, numpy.ndarray)
+            return values * 0.5
+
+        coordinates = [Coordinate(PORT / "feet", PORT / "m", clean_value=to_meters)]
+        records = [{"feet": 2.0}, {"feet": 4.0}]
+        results = list(Cartographer().map_chunked(records, dict, coordinates))
+
+        assert results == [{"m": 1.0}, {"m": 2.0}]
+        assert type(results[0]["m"]) is float
+
+    def test_bad_output(self):
+        with pytest.raises(ValueError):
+            batch_cleaner("tuple")
+
+    def test_chunk_size(self):
+        coordinates = [Coordinate(PORT / "a")]
+        with pytest.raises(ValueError):
+            list(Cartographer().map_chunked([{"a": 1}], dict, coordinates, 0))
+
+    def test_pickle(self):
+        import pickle
+
+        assert pickle.loads(pickle.dumps(double_batch)) is double_batch
+
+
+class TestSurveyCoverage:
+    def test_explicit_parent_skips_children(self):
+        data = {"a": {"b": 1, "c": 2}, "d": 3}
+        destination = dict()
+        coordinates = [Coordinate(PORT / "a", PORT / "x")]
+
+        Cartographer().map(data, destination, coordinates, surveyor=Surveyor())
+        assert destination == {"x": {"b": 1, "c": 2}, "d": 3}
+
+    def test_explicit_child_skips_parent(self):
+        data = {"a": {"b": 1, "c": 2}}
+        destination: dict = defaultdict(dict)
+        coordinates = [Coordinate(PORT / "a" / "b", PORT / "x")]
+
+        Cartographer().map(data, destination, coordinates, surveyor=Surveyor())
+        assert destination == {"x": 1, "a": {"c": 2}}
+
+    def test_same_name_elsewhere_is_mapped(self):
+        # only parents and children of a mapped course are skipped, not courses that
+        #   contain it further down.
+        data = {"name": "a", "customer": {"name": "b"}}
+        destination: dict = defaultdict(dict)
+        coordinates = [Coordinate(PORT / "name", PORT / "x")]
+
+        Cartographer().map(data, destination, coordinates, surveyor=Surveyor())
+        assert destination == {"x": "a", "customer": {"name": "b"}}
+
+    def test_root_course_covers_everything(self):
+        destination = dict()
+        coordinates = [Coordinate(Course(), PORT / "all")]
+
+        Cartographer().map({"a": 1}, destination, coordinates, surveyor=Surveyor())
+        assert destination == {"all": {"a": 1}}
@@ -0,0 +1,292 @@
+import pytest
+
+from gemma import (
+    Chart,
+    IndexedChart,
+    Surveyor,
+    Compass,
+    Course,
+    PORT,
+    Item,
+    Attr,
+    Call,
+    NonNavigableError,
+    SuppressedErrors,
+)
+from gemma.extensions.xml import XCourse
+
+
+@pytest.fixture
+def chart_nested(data_structure_1, surveyor_generic) -> Chart:
+    return surveyor_generic.chart_compact(data_structure_1)
+
+
+class TestSurveyorChartCompact:
+    def test_matches_chart(self, data_structure_1, surveyor_generic, chart_nested):
+        expected = surveyor_generic.chart(data_structure_1)
+
+        assert list(chart_nested) == expected
+        assert len(chart_nested) == len(expected)
+
+    def test_course_type(self):
+        surveyor = Surveyor(course_type=XCourse)
+        chart = surveyor.chart_compact({"a": {"b": 1}})
+
+        assert all(isinstance(course, XCourse) for course, _ in chart)
+        assert isinstance(chart[1][0], XCourse)
+
+    def test_raises(self):
+        surveyor = Surveyor(compasses=[Compass(target_types=dict)])
+        with pytest.raises(NonNavigableError):
+            surveyor.chart_compact([1, 2, 3])
+
+    def test_suppressed(self):
+        surveyor = Surveyor(compasses=[Compass(target_types=dict)])
+        data = {"a": "a value", "list": [1, 2, 3], "b": "b value"}
+
+        with pytest.raises(SuppressedErrors) as info:
+            surveyor.chart_compact(data, exceptions=False)
+
+        partial = info.value.chart_partial
+        assert isinstance(partial, Chart)
+        assert len(info.value.errors) == 1
+        assert list(partial) == [
+            (PORT / "[a]", "a value"),
+            (PORT / "[list]", [1, 2, 3]),
+            (PORT / "[b]", "b value"),
+        ]
+
+
+class TestChart:
+    def test_repr(self, chart_nested):
+        assert repr(chart_nested) == f"<Chart: {len(chart_nested)} nodes>"
+
+    def test_getitem(self, data_structure_1, surveyor_generic, chart_nested):
+        expected = surveyor_generic.chart(data_structure_1)
+
+        for i in range(len(expected)):
+            assert chart_nested[i] == expected[i]
+        assert chart_nested[-1] == expected[-1]
+
+    def test_getitem_out_of_range(self, chart_nested):
+        with pytest.raises(IndexError):
+            chart_nested[len(chart_nested)]
+
+    def test_slice(self, data_structure_1, surveyor_generic, chart_nested):
+        expected = surveyor_generic.chart(data_structure_1)
+
+        assert chart_nested[2:6] == expected[2:6]
+        assert chart_nested[::-3] == expected[::-3]
+
+    def test_lookup(self, data_structure_1, chart_nested):
+        assert chart_nested.lookup(PORT / "@list_data" / 4 / "one dict") == 1
+        assert chart_nested.lookup("dict_data/a dict") == "a value"
+        assert chart_nested.lookup(PORT / "@list_data") is data_structure_1.list_data
+
+    def test_lookup_missing(self, chart_nested):
+        with pytest.raises(KeyError):
+            chart_nested.lookup(PORT / "@list_data" / 10)
+
+        with pytest.raises(KeyError):
+            chart_nested.lookup(PORT)
+
+    def test_contains(self, chart_nested):
+        assert PORT / "@dict_data" / 3 in chart_nested
+        assert PORT / "@dict_data" / "@a dict" not in chart_nested
+
+    def test_index_course_round_trip(self, chart_nested):
+        for position in range(len(chart_nested)):
+            course = chart_nested.course(position)
+            assert chart_nested.index(course) == position
+
+    def test_bearings_interned(self):
+        chart = Surveyor().chart_compact([{"a": 1}, {"a": 2}, {"a": 3}])
+
+        assert len(chart) == 6
+        # [0], [1], [2] and a single [a]
+        assert len(chart._bearings) == 4
+
+    def test_append(self):
+        chart = Chart()
+        chart.append(PORT / "a", {"b": 1})
+        chart.append(PORT / "a" / "b", 1)
+
+        assert chart.lookup(PORT / "a" / "b") == 1
+        assert list(chart) == [(PORT / "a", {"b": 1}), (PORT / "a" / "b", 1)]
+
+    def test_append_missing_parent(self):
+        with pytest.raises(KeyError):
+            Chart().append(PORT / "a" / "b", 1)
+
+    def test_append_empty(self):
+        with pytest.raises(ValueError):
+            Chart().append(PORT, 1)
+
+    def test_add_out_of_order(self):
+        chart = Chart()
+        a = chart.add(-1, Item("a"), "a")
+        chart.add(-1, Item("b"), "b")
+        chart.add(a, Attr("c"), "c")
+
+        assert [str(course) for course, _ in chart] == ["[a]", "[b]", "[a]/@c"]
+
+    def test_add_bad_parent(self):
+        with pytest.raises(IndexError):
+            Chart().add(0, Item("a"), 1)
+
+    def test_index_updated_by_add(self):
+        chart = Chart()
+        a = chart.add(-1, Item("a"), "a")
+        assert chart.index(PORT / Item("a")) == a
+
+        b = chart.add(a, Item("b"), "b")
+        assert chart.index(PORT / Item("a") / Item("b")) == b
+
+    def test_call_args_not_merged(self):
+        chart = Chart()
+        chart.add(-1, Call("get", func_args=("a",)), 1)
+        chart.add(-1, Call("get", func_args=("b",)), 2)
+
+        assert len(chart._bearings) == 2
+
+    def test_unhashable_name(self):
+        chart = Chart()
+        chart.add(-1, Item(["a"]), 1)
+
+        assert list(chart) == [(Course(Item(["a"])), 1)]
+
+
+@pytest.fixture
+def indexed_nested(data_structure_1, surveyor_generic) -> IndexedChart:
+    return surveyor_generic.chart_indexed(data_structure_1)
+
+
+class TestSurveyorChartIndexed:
+    def test_matches_chart(self, data_structure_1, surveyor_generic, indexed_nested):
+        expected = surveyor_generic.chart(data_structure_1)
+
+        assert list(indexed_nested) == expected
+        assert len(indexed_nested) == len(expected)
+
+    def test_from_chart_iter(self, data_structure_1, surveyor_generic):
+        chart = IndexedChart(surveyor_generic.chart_iter(data_structure_1))
+        assert list(chart) == surveyor_generic.chart(data_structure_1)
+
+    def test_suppressed(self):
+        surveyor = Surveyor(compasses=[Compass(target_types=dict)])
+        data = {"a": "a value", "list": [1, 2, 3], "b": "b value"}
+
+        with pytest.raises(SuppressedErrors) as info:
+            surveyor.chart_indexed(data, exceptions=False)
+
+        partial = info.value.chart_partial
+        assert isinstance(partial, IndexedChart)
+        assert partial.lookup("b") == "b value"
+
+
+class TestIndexedChart:
+    def test_repr(self, indexed_nested):
+        assert repr(indexed_nested) == f"<IndexedChart: {len(indexed_nested)} nodes>"
+
+    def test_lookup(self, data_structure_1, indexed_nested):
+        assert indexed_nested.lookup(PORT / "@list_data" / 4 / "one dict") == 1
+        assert indexed_nested.lookup("dict_data/a dict") == "a value"
+
+    def test_lookup_missing(self, indexed_nested):
+        with pytest.raises(KeyError):
+            indexed_nested.lookup(PORT / "@list_data" / 10)
+
+        with pytest.raises(KeyError):
+            indexed_nested.lookup(PORT)
+
+    def test_contains(self, indexed_nested):
+        assert "dict_data/a dict" in indexed_nested
+        assert PORT / "dict_data" / "@a dict" not in indexed_nested
+        assert PORT not in indexed_nested
+
+    def test_iter_prefix(self, data_structure_1, surveyor_generic, indexed_nested):
+        prefix = PORT / "list_data" / 4
+        chart = surveyor_generic.chart(data_structure_1)
+        expected = [x for x in chart if x[0].starts_with(prefix)]
+
+        result = list(indexed_nested.iter_prefix(prefix))
+        assert result == expected
+        # stored bearing types are returned, not the Fallback passed in
+        assert all(isinstance(course[0], Attr) for course, _ in result)
+
+    def test_iter_prefix_missing(self, indexed_nested):
+        assert list(indexed_nested.iter_prefix("missing")) == []
+
+    def test_iter_prefix_root(self, indexed_nested):
+        assert list(indexed_nested.iter_prefix(PORT)) == list(indexed_nested)
+
+    def test_add_intermediate(self):
+        chart = IndexedChart()
+        chart.add(PORT / "a" / "b", 1)
+
+        assert len(chart) == 1
+        assert "a" not in chart
+        assert list(chart) == [(PORT / "a" / "b", 1)]
+
+    def test_add_replaces(self):
+        chart = IndexedChart()
+        chart.add(PORT / Item("a"), 1)
+        chart.add(PORT / "a", 2)
+
+        assert len(chart) == 1
+        assert list(chart) == [(PORT / Item("a"), 2)]
+
+    def test_add_empty(self):
+        with pytest.raises(ValueError):
+            IndexedChart().add(PORT, 1)
+
+    def test_same_name_different_types(self):
+        chart = IndexedChart()
+        chart.add(PORT / Item("a"), "item")
+        chart.add(PORT / Attr("a"), "attr")
+
+        assert chart.lookup(PORT / Attr("a")) == "attr"
+        assert chart.lookup(PORT / Item("a")) == "item"
+        assert len(chart) == 2
+
+    def test_unhashable_name(self):
+        chart = IndexedChart()
+        chart.add(PORT / Item(["a"]), 1)
+
+        assert chart.lookup(PORT / Item(["a"])) == 1
+
+    def test_delete(self, data_structure_1, indexed_nested):
+        before = len(indexed_nested)
+        removed = indexed_nested.delete(PORT / "list_data" / 4)
+
+        assert removed == 7
+        assert len(indexed_nested) == before - 7
+        assert PORT / "@list_data" / 4 not in indexed_nested
+        assert PORT / "@list_data" / 3 in indexed_nested
+
+    def test_delete_missing(self, indexed_nested):
+        with pytest.raises(KeyError):
+            indexed_nested.delete("missing")
+
+        with pytest.raises(KeyError):
+            indexed_nested.delete(PORT)
+
+    def test_merge(self):
+        first = IndexedChart([(PORT / "a", 1), (PORT / "a" / "b", 2)])
+        second = IndexedChart([(PORT / "a" / "b", 3), (PORT / "a" / "c", 4)])
+
+        first.merge(second)
+
+        assert len(first) == 3
+        assert list(first) == [
+            (PORT / "a", 1),
+            (PORT / "a" / "b", 3),
+            (PORT / "a" / "c", 4),
+        ]
+        assert len(second) == 2
+
+    def test_merge_pairs(self):
+        chart = IndexedChart([(PORT / "a", 1)])
+        chart.merge([(PORT / "b", 2)])
+
+        assert list(chart) == [(PORT / "a", 1), (PORT / "b", 2)]
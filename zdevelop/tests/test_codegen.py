@@ -0,0 +1,245 @@
+import importlib
+import sys
+
+import pytest
+
+from gemma import (
+    Attr,
+    Call,
+    Cartographer,
+    CleanerCache,
+    Coordinate,
+    Item,
+    NO_DEFAULT,
+    NullNameError,
+    PORT,
+    memoize_cleaner,
+    register_cleaner,
+)
+from gemma import test_objects as objects
+
+
+@register_cleaner("tests.codegen.upper")
+def upper(value, coord, cache):
+    cache["calls"] = cache.get("calls", 0) + 1
+    return str(value).upper()
+
+
+@register_cleaner("tests.codegen.pair")
+def join_pair(values, coord, cache):
+    assert isinstance(coord, Coordinate)
+    return " & ".join(str(x) for x in values)
+
+
+class Inventory:
+    """object with a custom __getitem__, so inlined subscripts fall back"""
+
+    def __init__(self):
+        self.items = {"pens": 3}
+
+    def __getitem__(self, key):
+        raise TypeError("no subscripts")
+
+
+# (name of origin in test_objects(), destination factory, coordinates)
+CASES = [
+    (
+        "data_dict",
+        dict,
+        [
+            Coordinate(PORT / "a", PORT / "a_value"),
+            Coordinate(PORT / "nested" / "one key", PORT / "one"),
+            Coordinate(PORT / Item(1), PORT / "first"),
+            Coordinate(PORT / "simple" / "text", PORT / "simple_text"),
+            Coordinate(PORT / "simple" / Attr("number"), PORT / "simple_number"),
+            Coordinate(PORT / "missing" / "key", PORT / "defaulted", default=None),
+            Coordinate(PORT / "nested" / Call("keys"), PORT / "keys"),
+            Coordinate(PORT / "nested" / "absent", PORT / "absent", default=0),
+            Coordinate(PORT / "simple" / "absent", PORT / "absent_attr", default=0),
+            Coordinate(PORT / "nested" / "items", PORT / "items", default=None),
+        ],
+    ),
+    (
+        "data_list",
+        dict,
+        [
+            Coordinate(PORT / 0, PORT / "zero"),
+            Coordinate(PORT / 4 / "nested" / "two key", PORT / "two"),
+            Coordinate(PORT / 5 / -1, PORT / "last"),
+            Coordinate(PORT / 6 / "text", PORT / "text"),
+            Coordinate(PORT / 20, PORT / "out_of_range", default="none"),
+        ],
+    ),
+    (
+        "structured",
+        lambda: objects.test_objects()[4],
+        [
+            Coordinate(PORT / "a", PORT / "text_target"),
+            Coordinate(PORT / "one", PORT / "number_target"),
+            Coordinate(PORT / "list_data" / 2, PORT / "list_target" / Call("append")),
+            Coordinate(PORT / "list_data" / 3, PORT / "list_target" / Call("append")),
+            Coordinate(
+                PORT / "dict_data" / "nested" / "one key", PORT / "dict_target" / "one"
+            ),
+            Coordinate(PORT / "simple" / "text", PORT / "dict_target" / "text"),
+        ],
+    ),
+    (
+        "simple",
+        dict,
+        [
+            Coordinate(PORT / "text", clean_value="tests.codegen.upper"),
+            Coordinate(PORT / "number"),
+            Coordinate(
+                (PORT / "text", PORT / "number"),
+                PORT / "joined",
+                clean_value="tests.codegen.pair",
+            ),
+            Coordinate(
+                (PORT / "text", PORT / "absent"),
+                (PORT / "pair_text", PORT / "pair_absent"),
+                default=(NO_DEFAULT, 0),
+            ),
+        ],
+    ),
+    (
+        "data_dict",
+        dict,
+        [
+            Coordinate(
+                PORT / "nested" / "one key",
+                PORT / Item("deep", factory=dict) / Item("er", factory=dict) / "one",
+            ),
+            Coordinate(
+                PORT / "nested" / "two key",
+                PORT / Item("deep", factory=dict) / Item("er", factory=dict) / "two",
+            ),
+            Coordinate(PORT / "a", PORT / Item("listed", factory=list) / Item(0)),
+            Coordinate(PORT / "b", PORT / Item("listed", factory=list) / Item(2)),
+        ],
+    ),
+]
+
+
+def origin(name: str):
+    simple, data_dict, data_list, structured, target = objects.test_objects()
+    return locals()[name]
+
+
+@pytest.mark.parametrize("origin_name, dst_factory, coordinates", CASES)
+def test_matches_map(origin_name, dst_factory, coordinates):
+    plan = Cartographer().compile(coordinates)
+    map_record = plan.to_function()
+
+    expected = dst_factory()
+    Cartographer().map(origin(origin_name), expected, coordinates)
+
+    generated = dst_factory()
+    map_record(origin(origin_name), generated)
+
+    assert generated == expected
+
+
+def test_cleaner_cache():
+    coordinates = [Coordinate(PORT / "text", clean_value="tests.codegen.upper")]
+    map_record = Cartographer().compile(coordinates).to_function()
+
+    destination = dict()
+    map_record({"text": "a"}, destination)
+    map_record({"text": "b"}, destination)
+
+    assert destination == {"text": "B"}
+    assert map_record.__globals__["_CACHE"] == {"calls": 2}
+
+
+def test_fallback_to_course():
+    # subscripts fail, so the courses' own fallback bearings find the attributes.
+    coordinates = [Coordinate(PORT / "items" / "pens", PORT / "pens")]
+    map_record = Cartographer().compile(coordinates).to_function()
+
+    destination = dict()
+    map_record(Inventory(), destination)
+    assert destination == {"pens": 3}
+
+
+@pytest.mark.parametrize(
+    "coordinate",
+    [
+        Coordinate(PORT / "missing", PORT / "a"),
+        Coordinate(PORT / "a" / "missing", PORT / "a"),
+        Coordinate(PORT / "a" / Call("missing"), PORT / "a"),
+    ],
+)
+def test_errors(coordinate):
+    map_record = Cartographer().compile([coordinate]).to_function()
+
+    with pytest.raises(NullNameError):
+        map_record({"a": {"b": 1}}, dict())
+
+
+def test_module(tmp_path, monkeypatch):
+    coordinates = [
+        Coordinate(PORT / "a" / "b", PORT / Item("c", factory=dict) / "d"),
+        Coordinate(PORT / "text", PORT / "upper", clean_value="tests.codegen.upper"),
+    ]
+    source = Cartographer().compile(coordinates).to_source(name="convert")
+    (tmp_path / "generated_plan.py").write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    module = importlib.import_module("generated_plan")
+    try:
+        destination = dict()
+        module.convert({"a": {"b": 1}, "text": "x"}, destination)
+    finally:
+        del sys.modules["generated_plan"]
+
+    assert destination == {"c": {"d": 1}, "upper": "X"}
+
+
+@pytest.mark.parametrize(
+    "coordinate",
+    [
+        Coordinate(PORT / "a", clean_value=lambda value, coord, cache: value),
+        Coordinate(PORT / "a", default=object()),
+        Coordinate(PORT / Item(object()), PORT / "a"),
+        Coordinate(PORT / "a", PORT / Item("b", factory=Inventory) / "c"),
+    ],
+)
+def test_not_writable(coordinate):
+    plan = Cartographer().compile([coordinate])
+
+    with pytest.raises(ValueError):
+        plan.to_source()
+
+
+def test_bad_name():
+    plan = Cartographer().compile([Coordinate(PORT / "a")])
+
+    with pytest.raises(ValueError):
+        plan.to_source(name="not valid")
+
+
+@register_cleaner("tests.codegen.square")
+@memoize_cleaner
+def square(value, coord, cache):
+    cache.setdefault("calls", list()).append(value)
+    return value * value
+
+
+@pytest.mark.parametrize(
+    "scope, expected_calls", [("persistent", [2, 3]), ("map", [2])]
+)
+def test_cleaner_cache_settings(scope, expected_calls):
+    cart = Cartographer(cache_size=5, cache_ttl=60, cache_scope=scope)
+    plan = cart.compile([Coordinate(PORT / "a", clean_value="tests.codegen.square")])
+    source = plan.to_source()
+    assert "CleanerCache(max_size=5, ttl=60" in source
+    assert ("with _CACHE.run():" in source) is (scope == "map")
+
+    map_record = plan.to_function()
+    for value in [2, 3, 2]:
+        map_record({"a": value}, dict())
+
+    cache = map_record.__globals__["_CACHE"]
+    assert isinstance(cache, CleanerCache)
+    assert cache["calls"] == expected_calls
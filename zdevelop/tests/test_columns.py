@@ -0,0 +1,113 @@
+import math
+from array import array
+
+import pytest
+
+from gemma import Columns, Compass, Surveyor, NonNavigableError, SuppressedErrors
+from gemma.extensions.xml import XCourse
+
+
+@pytest.fixture
+def records() -> list:
+    return [
+        {"id": 1, "price": 2.5, "tags": ["a"], "owner": {"name": "x"}},
+        {"id": 2, "price": 3, "owner": None},
+        {"id": 3, "price": None, "tags": ["b", "c"], "owner": {"name": "z"}},
+    ]
+
+
+class TestToColumns:
+    def test_list(self, records):
+        columns = Surveyor().to_columns(records)
+
+        assert isinstance(columns, Columns)
+        assert columns.rows == 3
+        assert list(columns) == [
+            "[id]",
+            "[price]",
+            "[tags]/[0]",
+            "[owner]/[name]",
+            "[owner]",
+            "[tags]/[1]",
+        ]
+        assert columns["[id]"] == [1, 2, 3]
+        assert columns["[price]"] == [2.5, 3, None]
+        assert columns["[tags]/[1]"] == [None, None, "c"]
+        assert columns.mask("[tags]/[1]") == [True, True, False]
+        assert columns.mask("[price]") == [False, False, True]
+
+    def test_none_container(self, records):
+        # a None in place of a container is a column of its own, that is masked.
+        columns = Surveyor().to_columns(records)
+        assert columns["[owner]"] == [None, None, None]
+        assert columns.mask("[owner]") == [True, True, True]
+
+    def test_same_length(self, records):
+        columns = Surveyor().to_columns(records)
+        for key, column in columns.items():
+            assert len(column) == columns.rows
+            assert len(columns.mask(key)) == columns.rows
+
+    def test_array(self, records):
+        columns = Surveyor().to_columns(records, output="array")
+
+        assert columns["[id]"] == array("q", [1, 2, 3])
+        assert columns["[price]"][:2] == array("d", [2.5, 3.0])
+        assert math.isnan(columns["[price]"][2])
+        assert columns.mask("[price]") == array("B", [0, 0, 1])
+        assert columns["[tags]/[0]"] == ["a", None, "b"]
+
+    def test_array_bool_not_numeric(self):
+        columns = Surveyor().to_columns([{"a": True}, {"a": 1}], output="array")
+        assert columns["[a]"] == [True, 1]
+
+    def test_array_overflow(self):
+        columns = Surveyor().to_columns([{"a": 2 ** 70}, {"a": 1}], output="array")
+        assert columns["[a]"] == [2 ** 70, 1]
+
+    def test_numpy(self, records):
+        numpy = pytest.importorskip("numpy")
+        columns = Surveyor().to_columns(records, output="numpy")
+
+        assert columns["[id]"].dtype == numpy.int64
+        assert columns["[price]"].dtype == numpy.float64
+        assert columns["[tags]/[0]"].dtype == object
+        assert columns.mask("[price]").tolist() == [False, False, True]
+
+    def test_unknown_output(self, records):
+        with pytest.raises(ValueError):
+            Surveyor().to_columns(records, output="frame")
+
+    def test_empty(self):
+        columns = Surveyor().to_columns([])
+        assert columns.rows == 0
+        assert len(columns) == 0
+
+    def test_generator(self, records):
+        columns = Surveyor().to_columns(x for x in records)
+        assert columns["[id]"] == [1, 2, 3]
+
+    def test_course_type(self):
+        surveyor = Surveyor(course_type=XCourse)
+        columns = surveyor.to_columns([{"a": 1}])
+        assert columns["[a]"] == [1]
+
+    def test_same_string_courses(self):
+        columns = Surveyor().to_columns([{1: "x"}, {"1": "y"}])
+        assert columns["[1]"] == ["x", "y"]
+
+        with pytest.raises(ValueError):
+            Surveyor().to_columns([{"a": 0}, {1: "x", "1": "y"}])
+
+    def test_non_navigable(self):
+        surveyor = Surveyor(compasses=[Compass(target_types=dict)])
+        with pytest.raises(NonNavigableError):
+            surveyor.to_columns([{"a": [1]}])
+
+    def test_suppressed(self):
+        surveyor = Surveyor(compasses=[Compass(target_types=dict)])
+        records = [{"a": [1], "b": 1}, {"a": [2], "b": 2}]
+        with pytest.raises(SuppressedErrors) as error:
+            surveyor.to_columns(records, exceptions=False)
+
+        assert len(error.value.errors) == 2
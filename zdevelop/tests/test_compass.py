@@ -145,3 +145,33 @@ def test_not_implemented_iter(data_callable):
 def test_ignore_underscore_slots(compass_generic):
     data = Fraction("3/4")
     assert compass_generic.bearings(data) == []
+
+
+class HookedBearings:
+    def __init__(self, declines: bool = False):
+        self.declines = declines
+        self.a = "a value"
+
+    def __gemma_bearings__(self):
+        if self.declines:
+            return NotImplemented
+        return [(Item("hooked"), "hooked value")]
+
+
+def test_bearings_hook(compass_generic):
+    assert compass_generic.bearings(HookedBearings()) == [
+        (Item("hooked"), "hooked value")
+    ]
+
+
+def test_bearings_hook_declined(compass_generic):
+    assert compass_generic.bearings(HookedBearings(declines=True)) == [
+        (Attr("declines"), True),
+        (Attr("a"), "a value"),
+    ]
+
+
+def test_bearings_hook_not_navigable():
+    compass = Compass(target_types=dict)
+    with pytest.raises(NonNavigableError):
+        compass.bearings(HookedBearings())
@@ -1,8 +1,22 @@
 import pytest
 from dataclasses import dataclass
-from typing import Optional
-
-from gemma import Course, PORT, Item, Fallback, Attr, Call, NullNameError
+from typing import Optional, NamedTuple, Any
+
+from gemma import (
+    Course,
+    PORT,
+    Item,
+    Fallback,
+    Attr,
+    Call,
+    Where,
+    Wildcard,
+    RecursiveWildcard,
+    Compass,
+    NullNameError,
+    flatten,
+    unflatten,
+)
 
 
 class TestBasicAPI:
@@ -232,3 +246,285 @@ class TestOperations:
         course.place(data, "yay!")
 
         assert data == {"nested": ["yay!", "one", "two"]}
+
+
+class TestSorting:
+    def test_lt(self):
+        assert PORT / "a" < PORT / "b"
+        assert not PORT / "b" < PORT / "a"
+
+    @pytest.mark.parametrize(
+        "course, other",
+        [
+            (PORT / Fallback("a"), PORT / Item("a")),
+            (PORT / Fallback("a"), PORT / Attr("a")),
+            (PORT / "a" / Fallback(0), PORT / "a" / Item(0)),
+            (PORT / Item(1), PORT / Item(1.0)),
+        ],
+    )
+    def test_equal_not_ordered(self, course, other):
+        assert course == other
+        assert not course < other
+        assert not other < course
+        assert course <= other and other <= course
+
+    def test_types_tie(self):
+        # unequal, but neither can sort first without contradicting a Fallback.
+        assert PORT / Item("a") != PORT / Attr("a")
+        assert not PORT / Item("a") < PORT / Attr("a")
+        assert not PORT / Attr("a") < PORT / Item("a")
+
+    def test_sorted_dedup(self):
+        courses = sorted([PORT / Item("b"), PORT / Fallback("a"), PORT / Item("a")])
+        deduped = [x for i, x in enumerate(courses) if i == 0 or x != courses[i - 1]]
+        assert deduped == [PORT / "a", PORT / "b"]
+
+    def test_parent_first(self):
+        assert PORT / "a" < PORT / "a" / "b"
+        assert PORT / "a" / "b" > PORT / "a"
+
+    def test_le_ge(self):
+        assert PORT / "a" <= PORT / "a"
+        assert PORT / "a" >= PORT / "a"
+        assert PORT / "a" <= PORT / "b"
+
+    def test_compare_str(self):
+        assert PORT / "a" < "a/b"
+
+    def test_sorted(self):
+        courses = [PORT / "b" / 1, PORT / 2, PORT / "a" / "z", PORT / "a", PORT / 1]
+        assert sorted(courses) == [
+            PORT / 1,
+            PORT / 2,
+            PORT / "a",
+            PORT / "a" / "z",
+            PORT / "b" / 1,
+        ]
+
+    def test_bisect(self):
+        import bisect
+
+        courses = sorted(PORT / Item(i) for i in range(0, 100, 2))
+        assert bisect.bisect_left(courses, PORT / Item(10)) == 5
+        assert bisect.bisect_left(courses, PORT / Item(11)) == 6
+
+    def test_sorted_uncomparable_names(self):
+        # same-type names that cannot be compared fall back to ordering by repr.
+        courses = [PORT / Item(("a", 1)), PORT / Item(None), PORT / Item(("a", "b"))]
+        assert sorted(courses) == [
+            PORT / Item(None),
+            PORT / Item(("a", "b")),
+            PORT / Item(("a", 1)),
+        ]
+        assert PORT / Item(("a", "b")) < PORT / Item(("a", 1))
+        assert PORT / Item(("a", 1)) <= PORT / Item(("a", 1))
+        assert not PORT / Item(("a", 1)) <= PORT / Item(("a", "b"))
+        assert PORT / Item(("a", 1)) < PORT / Item(("a", 2))
+
+    def test_sort_key_cached(self):
+        course = PORT / "a" / 1
+        assert course._sort_key() is course._sort_key()
+
+
+class TestFetchIter:
+    @pytest.fixture
+    def users(self) -> dict:
+        return {
+            "users": [
+                {"name": "ann", "pets": [{"name": "rex"}]},
+                {"name": "bob", "pets": []},
+                {"id": 3},
+                "not a user",
+            ],
+            "name": "root",
+        }
+
+    def test_cast(self):
+        class PatternCourse(Course):
+            BEARINGS = [RecursiveWildcard, Wildcard] + Course.BEARINGS
+
+        course = PatternCourse("a/*/**/b")
+        assert isinstance(course[1], Wildcard)
+        assert isinstance(course[2], RecursiveWildcard)
+        assert str(course) == "a/*/**/b"
+
+    def test_shorthand_is_plain_name(self):
+        # Course does not cast shorthand to wildcards, so "*" keys keep working.
+        course = PORT / "*" / "**"
+        assert [type(x) for x in course] == [Fallback, Fallback]
+        assert course.fetch({"*": {"**": 1}}) == 1
+
+    def test_flatten_round_trip(self):
+        data = {"*": {"**": 1}, "a": 2}
+        assert unflatten(flatten(data)) == data
+
+    def test_defaults(self):
+        assert Wildcard().name == "*"
+        assert RecursiveWildcard().name == "**"
+
+    def test_fallback_excludes_wildcards(self):
+        assert Wildcard not in Course("a")[0].BEARING_CLASSES
+        assert RecursiveWildcard not in Course("a")[0].BEARING_CLASSES
+
+    def test_wildcard_cast_raises(self):
+        with pytest.raises(TypeError):
+            Wildcard("a")
+        with pytest.raises(TypeError):
+            RecursiveWildcard("*")
+
+    def test_concrete(self, users):
+        assert list((PORT / "users" / 0 / "name").fetch_iter(users)) == [
+            (PORT / "users" / 0 / "name", "ann")
+        ]
+
+    def test_concrete_missing(self, users):
+        assert list((PORT / "users" / 10 / "name").fetch_iter(users)) == []
+
+    def test_wildcard(self, users):
+        result = list((PORT / "users" / Wildcard() / "name").fetch_iter(users))
+        assert result == [
+            (PORT / "users" / Item(0) / "name", "ann"),
+            (PORT / "users" / Item(1) / "name", "bob"),
+        ]
+
+    def test_wildcard_end(self, users):
+        course = PORT / "users" / 0 / Wildcard()
+        result = [str(x) for x, _ in course.fetch_iter(users)]
+        assert result == ["users/[0]/[name]", "users/[0]/[pets]"]
+
+    def test_wildcard_attrs(self, data_simple):
+        result = [x for _, x in (PORT / Wildcard()).fetch_iter(data_simple)]
+        assert result == ["a data", "b data", 1, 2]
+
+    def test_double_wildcard(self, users):
+        course = PORT / "users" / Wildcard() / "pets" / Wildcard() / "name"
+        result = [x for _, x in course.fetch_iter(users)]
+        assert result == ["rex"]
+
+    def test_recursive(self, users):
+        course = PORT / RecursiveWildcard() / "name"
+        result = [(str(x), y) for x, y in course.fetch_iter(users)]
+        assert result == [
+            ("name", "root"),
+            ("[users]/[0]/name", "ann"),
+            ("[users]/[0]/[pets]/[0]/name", "rex"),
+            ("[users]/[1]/name", "bob"),
+        ]
+
+    def test_recursive_end(self):
+        data = {"a": {"b": 1}, "c": [2]}
+        course = PORT / "a" / RecursiveWildcard()
+        result = [(str(x), y) for x, y in course.fetch_iter(data)]
+        assert result == [("a", {"b": 1}), ("a/[b]", 1)]
+
+    def test_is_lazy(self, users):
+        fetched = (PORT / RecursiveWildcard()).fetch_iter(users)
+        assert next(fetched) == (PORT, users)
+
+    def test_course_type(self, users):
+        class SubCourse(Course):
+            pass
+
+        result = next(SubCourse("users", Wildcard()).fetch_iter(users))
+        assert isinstance(result[0], SubCourse)
+
+    def test_fetch_raises(self, users):
+        with pytest.raises(TypeError):
+            (PORT / "users" / Wildcard() / "name").fetch(users)
+
+    def test_place_raises(self, users):
+        with pytest.raises(TypeError):
+            (PORT / "users" / Wildcard()).place(users, "value")
+
+    def test_custom_compass(self, users):
+        compass = Compass(target_types=dict, items=["name"])
+        course = PORT / "users" / 0 / Wildcard(compasses=[compass])
+        assert list(course.fetch_iter(users)) == [
+            (PORT / "users" / 0 / Item("name"), "ann")
+        ]
+
+
+class TestReplaceIn:
+    @dataclass(frozen=True)
+    class Frozen:
+        name: str
+        child: Optional["TestReplaceIn.Frozen"] = None
+        values: tuple = ()
+
+    class Pair(NamedTuple):
+        left: Any
+        right: Any
+
+    def test_frozen_dataclass(self):
+        leaf = self.Frozen("leaf", values=(1, 2))
+        sibling = {"shared": True}
+        root = self.Frozen("root", child=leaf, values=(sibling,))
+
+        updated = (PORT / "child" / "values" / 1).replace_in(root, 3)
+
+        assert updated.child.values == (1, 3)
+        assert leaf.values == (1, 2)
+        assert updated is not root
+        assert updated.values[0] is sibling
+
+    def test_named_tuple(self):
+        untouched = [1, 2, 3]
+        pair = self.Pair(left=untouched, right={"a": 1})
+
+        updated = Course("right/a").replace_in(pair, 2)
+
+        assert isinstance(updated, self.Pair)
+        assert updated.right == {"a": 2}
+        assert pair.right == {"a": 1}
+        assert updated.left is untouched
+
+    def test_named_tuple_item(self):
+        updated = (PORT / 0).replace_in(self.Pair(1, 2), "changed")
+        assert updated == self.Pair("changed", 2)
+
+    def test_dict_list(self, data_dict):
+        data = {"list": [data_dict, {"a": 1}], "other": {"x": 1}}
+
+        updated = (PORT / "list" / 1 / "a").replace_in(data, 2)
+
+        assert updated["list"][1] == {"a": 2}
+        assert data["list"][1] == {"a": 1}
+        assert updated["list"][0] is data_dict
+        assert updated["other"] is data["other"]
+
+    def test_where(self):
+        data = ({"sku": "A1", "qty": 1}, {"sku": "B2", "qty": 2})
+        updated = (PORT / Where(("sku", "B2")) / "qty").replace_in(data, 5)
+
+        assert updated == ({"sku": "A1", "qty": 1}, {"sku": "B2", "qty": 5})
+        assert data[1]["qty"] == 2
+
+    def test_factory(self):
+        data = {"a": 1}
+        course = PORT / Item("new", factory=dict) / "key"
+
+        updated = course.replace_in(data, "value")
+        assert updated == {"a": 1, "new": {"key": "value"}}
+        assert data == {"a": 1}
+
+    def test_missing(self):
+        with pytest.raises(NullNameError):
+            Course("a/b").replace_in({"b": 1}, 1)
+
+    def test_tuple_out_of_range(self):
+        with pytest.raises(NullNameError):
+            (PORT / 5).replace_in((1, 2), 1)
+
+    def test_empty_course(self):
+        assert PORT.replace_in({"a": 1}, "value") == "value"
+
+    def test_attr_not_field(self):
+        class Plain:
+            def __init__(self):
+                self.a = 1
+
+        original = Plain()
+        updated = Course("@a").replace_in(original, 2)
+
+        assert updated.a == 2
+        assert original.a == 1
@@ -0,0 +1,109 @@
+import pytest
+from xml.etree.ElementTree import fromstring
+
+from gemma import Cursor, PORT, Item, Attr, NullNameError
+from gemma.extensions.xml import XCourse
+
+
+class CountsFetches(dict):
+    """dict that counts item fetches, for checking ancestors are not re-resolved"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fetches = 0
+
+    def __getitem__(self, item):
+        self.fetches += 1
+        return super().__getitem__(item)
+
+
+class TestCursor:
+    def test_course_cursor(self, data_structure_1):
+        cursor = (PORT / "list_data" / 4).cursor(data_structure_1)
+
+        assert isinstance(cursor, Cursor)
+        assert cursor.root is data_structure_1
+        assert cursor.node is data_structure_1.list_data[4]
+        assert cursor.course == PORT / "list_data" / 4
+
+    def test_init_default_course(self, data_dict):
+        cursor = Cursor(data_dict)
+        assert cursor.node is data_dict
+        assert cursor.course == PORT
+
+    def test_init_missing(self, data_dict):
+        with pytest.raises(NullNameError):
+            Cursor(data_dict, "missing")
+
+    def test_repr(self, data_structure_1):
+        cursor = Cursor(data_structure_1, "@dict_data")
+        assert repr(cursor) == "<Cursor: <Course: <Attr: 'dict_data'>>>"
+
+    def test_fetch(self, data_structure_1):
+        cursor = (PORT / "list_data" / 4).cursor(data_structure_1)
+
+        assert cursor.fetch("a dict") == "a value"
+        assert cursor.fetch(3) == "three int"
+        assert cursor.fetch(PORT / "one dict") == 1
+
+    def test_fetch_default(self, data_structure_1):
+        cursor = Cursor(data_structure_1, "dict_data")
+        assert cursor.fetch("missing", default=None) is None
+
+        with pytest.raises(NullNameError):
+            cursor.fetch("missing")
+
+    def test_place(self, data_structure_1):
+        cursor = Cursor(data_structure_1, "dict_data")
+        cursor.place("a dict", "changed")
+
+        assert data_structure_1.dict_data["a dict"] == "changed"
+
+    def test_place_factory(self, data_structure_1):
+        cursor = Cursor(data_structure_1, "dict_data")
+        cursor.place(PORT / Item("new", factory=dict) / "key", "value")
+
+        assert data_structure_1.dict_data["new"] == {"key": "value"}
+
+    def test_descend(self, data_structure_1):
+        cursor = Cursor(data_structure_1, "list_data")
+        child = cursor / 4 / "one dict"
+
+        assert child.node == 1
+        assert child.root is data_structure_1
+        assert child.course == PORT / "list_data" / 4 / "one dict"
+        assert cursor.course == PORT / "list_data"
+
+    def test_descend_missing(self, data_structure_1):
+        with pytest.raises(NullNameError):
+            Cursor(data_structure_1, "list_data") / 10
+
+    def test_ancestors_not_resolved(self):
+        data = CountsFetches(a=CountsFetches(b={"c": 1, "d": 2}))
+
+        cursor = Cursor(data, "a/b")
+        assert data.fetches == 1
+        assert data["a"].fetches == 1
+
+        cursor.fetch("c")
+        (cursor / "d").node
+        assert data.fetches == 2
+        assert data["a"].fetches == 1
+
+    def test_relative_cast_cached(self, data_dict):
+        cursor = Cursor(data_dict)
+        cursor.fetch("a dict")
+
+        assert cursor._cast_relative("a dict") is cursor._cast_relative("a dict")
+
+    def test_unhashable_bearing(self, data_structure_1):
+        cursor = Cursor(data_structure_1)
+        assert cursor.fetch(Attr("one")) == 1
+
+    def test_course_type_kept(self):
+        root = fromstring("<root><child><leaf>text</leaf></child></root>")
+        cursor = XCourse("<child>").cursor(root)
+
+        assert isinstance(cursor.course, XCourse)
+        assert cursor.fetch("<leaf>").text == "text"
+        assert isinstance((cursor / "<leaf>").course, XCourse)
@@ -0,0 +1,218 @@
+import mmap
+import struct
+import pytest
+
+from gemma import PORT, Attr, Call, Fallback, Item, NullNameError, Surveyor
+from gemma.extensions.binary import (
+    BLayout,
+    BView,
+    BRecords,
+    BField,
+    bbearing,
+    BCourse,
+    BPATH,
+    BCompass,
+    bsurveyor,
+)
+
+
+@pytest.fixture
+def header_layout() -> BLayout:
+    return BLayout([("timestamp", "<q"), ("flags", "<H")])
+
+
+@pytest.fixture
+def record_layout(header_layout) -> BLayout:
+    return BLayout([("header", header_layout), ("value", "<d"), ("point", "<2i")])
+
+
+def pack_record(timestamp: int, flags: int, value: float, point) -> bytes:
+    return struct.pack("<qHd2i", timestamp, flags, value, *point)
+
+
+@pytest.fixture
+def record_bytes() -> bytes:
+    records = [pack_record(i * 10, i, i / 2, (i, -i)) for i in range(5)]
+    return b"".join(records)
+
+
+@pytest.fixture
+def records(record_bytes, record_layout) -> BRecords:
+    return BRecords(bytearray(record_bytes), record_layout)
+
+
+class TestLayout:
+    def test_size(self, header_layout, record_layout):
+        assert header_layout.size == 10
+        assert record_layout.size == 26
+
+    def test_explicit_offsets(self):
+        layout = BLayout([("b", "<H", 4), ("a", "<I", 0)])
+        assert layout.size == 6
+        assert layout.read(struct.pack("<IH", 1, 2), 0, "b") == 2
+
+    def test_explicit_size(self):
+        assert BLayout([("a", "<I")], size=16).size == 16
+
+    def test_size_too_small_raises(self):
+        with pytest.raises(ValueError):
+            BLayout([("a", "<I")], size=2)
+
+    def test_read_missing_raises(self, header_layout):
+        with pytest.raises(NullNameError):
+            header_layout.read(bytes(10), 0, "missing")
+
+    def test_names(self, record_layout):
+        assert record_layout.names == ["header", "value", "point"]
+
+
+class TestRecords:
+    def test_len(self, records):
+        assert len(records) == 5
+
+    def test_len_offset(self, record_bytes, record_layout):
+        assert len(BRecords(b"xx" + record_bytes, record_layout, offset=2)) == 5
+
+    def test_index_raises(self, records):
+        with pytest.raises(IndexError):
+            records[5]
+
+    def test_negative_index(self, records):
+        assert records[-1].offset == 4 * 26
+
+    def test_slice(self, records):
+        assert [x.offset for x in records[1:3]] == [26, 52]
+
+    def test_set_record(self, records):
+        records[0] = records[3]
+        assert (PORT / 0 / "header" / "timestamp").fetch(records) == 30
+
+    def test_set_record_wrong_size_raises(self, records):
+        with pytest.raises(ValueError):
+            records[0] = b"short"
+
+
+class TestBField:
+    @pytest.mark.parametrize(
+        "text, name", [("<header>", "header"), ("<1042>", 1042), ("<-1>", -1)]
+    )
+    def test_name_from_str(self, text, name):
+        assert BField.name_from_str(text) == name
+
+    def test_bbearing(self):
+        assert isinstance(bbearing("<value>"), BField)
+
+    def test_str(self):
+        assert str(BField(3)) == "<3>"
+
+    def test_fetch(self, records):
+        assert BField("value").fetch(BField(3).fetch(records)) == 1.5
+
+    def test_fetch_tuple(self, records):
+        assert BField("point").fetch(records[2]) == (2, -2)
+
+    def test_fetch_missing_record_raises(self, records):
+        with pytest.raises(NullNameError):
+            BField(10).fetch(records)
+
+    def test_fetch_wrong_target_raises(self):
+        with pytest.raises(NullNameError):
+            BField("value").fetch({"value": 1})
+
+    def test_place(self, records):
+        BField("value").place(records[1], 12.5)
+        assert records[1].layout.read(records.buffer, 26, "value") == 12.5
+
+    def test_place_tuple(self, records):
+        BField("point").place(records[1], (7, 8))
+        assert BField("point").fetch(records[1]) == (7, 8)
+
+    def test_place_read_only_raises(self, record_bytes, record_layout):
+        read_only = BRecords(record_bytes, record_layout)
+        with pytest.raises(TypeError):
+            BField("value").place(read_only[0], 1.0)
+
+
+class TestCourses:
+    def test_bcourse(self, records):
+        course = BPATH / "<4>/<header>/<timestamp>"
+        assert isinstance(course, BCourse)
+        assert course.fetch(records) == 40
+
+    def test_generic_course(self, records):
+        assert (PORT / 2 / "header" / "flags").fetch(records) == 2
+
+    def test_generic_course_place(self, records):
+        course = PORT / 2 / "header" / "flags"
+        course.place(records, 300)
+        assert course.fetch(records) == 300
+
+    def test_hook_fallback(self, records):
+        assert Fallback("value").fetch(records[4]) == 2.0
+        assert Item("value").fetch(records[4]) == 2.0
+
+    def test_default(self, records):
+        assert (PORT / 2 / "missing").fetch(records, default=None) is None
+
+    def test_hook_non_field(self, records, record_layout):
+        view = records[1]
+        assert Attr("layout").fetch(view) is record_layout
+        assert Call("__bytes__").fetch(view) == bytes(view)
+        assert (PORT / 1 / "offset").fetch(records) == 26
+
+    def test_hook_non_field_place(self, records):
+        view = records[1]
+        Attr("offset").place(view, 0)
+        assert Item("value").fetch(view) == 0.0
+
+    def test_hook_non_field_missing_raises(self, records):
+        with pytest.raises(NullNameError):
+            Fallback("missing").fetch(records[1])
+
+    def test_mmap(self, tmp_path, record_bytes, record_layout):
+        path = tmp_path / "records.bin"
+        path.write_bytes(record_bytes)
+
+        with open(path, "r+b") as file:
+            mapped = mmap.mmap(file.fileno(), 0)
+            records = BRecords(mapped, record_layout)
+
+            course = BPATH / "<3>/<header>/<timestamp>"
+            assert course.fetch(records) == 30
+            course.place(records, 333)
+            mapped.flush()
+            del records
+            mapped.close()
+
+        assert struct.unpack_from("<q", path.read_bytes(), 3 * 26)[0] == 333
+
+
+class TestSurvey:
+    def test_compass(self, records):
+        assert BCompass().bearings(records[1]) == [
+            (BField("header"), records[1].layout.read(records.buffer, 26, "header")),
+            (BField("value"), 0.5),
+            (BField("point"), (1, -1)),
+        ]
+
+    def test_compass_records(self, records):
+        bearings = BCompass().bearings(records)
+        assert [x for x, _ in bearings] == [BField(i) for i in range(5)]
+
+    def test_compass_not_navigable(self):
+        assert not BCompass().is_navigable(dict())
+
+    def test_surveyor(self, records):
+        chart = bsurveyor.chart(records[0])
+        assert [(str(x), y) for x, y in chart if not isinstance(y, BView)] == [
+            ("<header>/<timestamp>", 0),
+            ("<header>/<flags>", 0),
+            ("<value>", 0.0),
+            ("<point>", (0, 0)),
+            ("<point>/[0]", 0),
+            ("<point>/[1]", 0),
+        ]
+
+    def test_surveyor_compasses_extra(self, records):
+        chart = Surveyor(compasses_extra=[BCompass()]).chart(records[3])
+        assert ("<value>", 1.5) in [(str(x), y) for x, y in chart]
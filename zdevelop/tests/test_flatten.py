@@ -0,0 +1,101 @@
+import pytest
+from dataclasses import dataclass, field
+
+from gemma import (
+    flatten,
+    unflatten,
+    Surveyor,
+    Compass,
+    PORT,
+    Item,
+    NullNameError,
+    NonNavigableError,
+)
+
+
+@dataclass
+class Holder:
+    a: int = 0
+    items: list = field(default_factory=list)
+
+
+@pytest.fixture
+def nested() -> dict:
+    return {
+        "a": [{"b": 1, "c": [1, 2, {"x": None}]}, {"b": 2}],
+        "empty dict": {},
+        "empty list": [],
+        "text": "value",
+    }
+
+
+class TestFlatten:
+    def test_flatten(self, nested):
+        assert flatten(nested) == {
+            "[a]/[0]/[b]": 1,
+            "[a]/[0]/[c]/[0]": 1,
+            "[a]/[0]/[c]/[1]": 2,
+            "[a]/[0]/[c]/[2]/[x]": None,
+            "[a]/[1]/[b]": 2,
+            "[empty dict]": {},
+            "[empty list]": [],
+            "[text]": "value",
+        }
+
+    def test_matches_chart(self, data_structure_1, surveyor_generic):
+        flat = flatten(data_structure_1)
+
+        for course, value in surveyor_generic.chart(data_structure_1):
+            if isinstance(value, (str, int, float)):
+                assert flat[str(course)] == value
+
+    def test_empty_root(self):
+        assert flatten({}) == dict()
+
+    def test_surveyor(self):
+        surveyor = Surveyor(compasses=[Compass(target_types=dict)])
+        with pytest.raises(NonNavigableError):
+            flatten({"list": [1]}, surveyor=surveyor)
+
+
+class TestUnflatten:
+    def test_round_trip(self, nested):
+        assert unflatten(flatten(nested)) == nested
+
+    def test_root_list(self):
+        data = [[1, [2]], {"a": 3}]
+        assert unflatten(flatten(data)) == data
+
+    def test_gaps_filled(self):
+        assert unflatten({"[a]/[2]": "c", "[a]/[0]": "a"}) == {"a": ["a", None, "c"]}
+
+    def test_course_keys(self):
+        pairs = [(PORT / "a" / Item(1), "b"), (PORT / "c", "d")]
+        assert unflatten(pairs) == {"a": [None, "b"], "c": "d"}
+
+    def test_chart_pairs(self, surveyor_generic):
+        data = {"a": [{"b": 1}], "c": 2}
+        assert unflatten(surveyor_generic.chart(data)) == data
+
+    def test_shorthand_keys(self):
+        assert unflatten({"a/0/b": 1, "a/1": 2}) == {"a": [{"b": 1}, 2]}
+
+    def test_existing_root(self):
+        holder = Holder()
+        result = unflatten({"@a": 1, "@items/[1]/[b]": 2}, root=holder)
+
+        assert result is holder
+        assert holder.a == 1
+        assert holder.items == [None, {"b": 2}]
+
+    def test_missing_attr(self):
+        with pytest.raises(NullNameError):
+            unflatten({"[a]/@b/[c]": 1})
+
+    def test_empty_course(self):
+        with pytest.raises(ValueError):
+            unflatten({"": 1})
+
+    def test_unordered_keys(self):
+        flat = {"[a]/[0]/[b]": 1, "[c]": 2, "[a]/[0]/[d]": 3, "[a]/[1]": 4}
+        assert unflatten(flat) == {"a": [{"b": 1, "d": 3}, 4], "c": 2}
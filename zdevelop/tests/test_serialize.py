@@ -0,0 +1,220 @@
+import json
+import pickle
+
+import pytest
+
+from gemma import (
+    AdaptiveFallback,
+    Attr,
+    Call,
+    Cartographer,
+    Coordinate,
+    Course,
+    Item,
+    NO_DEFAULT,
+    PORT,
+    RecursiveWildcard,
+    Where,
+    Wildcard,
+    bearing,
+    dump_coordinates,
+    load_coordinates,
+    register_cleaner,
+    registered_cleaner,
+)
+from gemma.extensions.xml import XCourse, XElm
+
+
+@register_cleaner("tests.double")
+def double(value, coord, cache):
+    return value * 2
+
+
+@register_cleaner
+def join(values, coord, cache):
+    return "-".join(str(x) for x in values)
+
+
+def join_name() -> str:
+    return f"{__name__}.join"
+
+
+class TestRegistry:
+    def test_default_name(self):
+        assert registered_cleaner(f"{__name__}.join") is join
+
+    def test_lookup(self):
+        assert registered_cleaner("tests.double") is double
+
+    def test_unknown(self):
+        with pytest.raises(KeyError):
+            registered_cleaner("tests.missing")
+
+    def test_taken(self):
+        with pytest.raises(ValueError):
+            register_cleaner("tests.double")(lambda v, c, cache: v)
+
+    def test_reregister_same(self):
+        assert register_cleaner("tests.double")(double) is double
+
+    def test_replace(self):
+        def first(value, coord, cache):
+            return 1
+
+        def second(value, coord, cache):
+            return 2
+
+        register_cleaner("tests.replaced")(first)
+        register_cleaner("tests.replaced", replace=True)(second)
+        assert registered_cleaner("tests.replaced") is second
+
+    def test_map_by_name(self):
+        destination = dict()
+        coordinates = [
+            Coordinate(PORT / "a", clean_value="tests.double"),
+            Coordinate((PORT / "a", PORT / "b"), PORT / "ab", clean_value=join_name()),
+        ]
+        Cartographer().map({"a": 1, "b": 2}, destination, coordinates)
+
+        assert destination == {"a": 2, "ab": "1-2"}
+
+    def test_map_unregistered(self):
+        coordinate = Coordinate(PORT / "a", clean_value="tests.missing")
+        with pytest.raises(KeyError):
+            Cartographer().map({"a": 1}, dict(), [coordinate])
+
+    def test_pickle_plan(self):
+        plan = Cartographer().compile(
+            [Coordinate(PORT / "a", PORT / "b", clean_value="tests.double")]
+        )
+        loaded = pickle.loads(pickle.dumps(plan))
+
+        assert list(loaded.map_many([{"a": 2}], dict)) == [{"b": 4}]
+
+
+class TestSerialize:
+    @pytest.mark.parametrize(
+        "course",
+        [
+            Course("a/b/c"),
+            PORT / "a" / 0 / "b",
+            PORT / Item("a") / Attr("b") / Call("c"),
+            PORT / Wildcard() / RecursiveWildcard(),
+            PORT / bearing("[sku=A1]", bearing_classes=[Where]),
+            PORT / Item(("a", 1)),
+            PORT / Item("a", factory=dict) / Item(0, factory=list),
+            PORT / AdaptiveFallback("a"),
+        ],
+    )
+    def test_course_round_trip(self, course):
+        coordinates = [Coordinate(course)]
+        loaded = load_coordinates(dump_coordinates(coordinates))[0]
+
+        assert list(loaded.org) == list(course)
+        assert [type(x) for x in loaded.org] == [type(x) for x in course]
+        assert [x.name for x in loaded.org] == [x.name for x in course]
+        assert [x.factory_type for x in loaded.org] == [
+            x.factory_type for x in course
+        ]
+
+    def test_call_args_round_trip(self):
+        course = PORT / "lst" / Call(
+            "insert", func_args=(0, Call.VALUE_ARG), func_kwargs={"x": Call.VALUE_ARG}
+        )
+        data = json.loads(dump_coordinates([Coordinate(course)]))
+        assert isinstance(data["coordinates"][0]["org"], list)
+
+        loaded = load_coordinates(dump_coordinates([Coordinate(course)]))[0].org[1]
+        assert loaded._func_args == (0, Call.VALUE_ARG)
+        assert loaded._func_args[1] is Call.VALUE_ARG
+        assert loaded._func_kwargs == {"x": Call.VALUE_ARG}
+        assert loaded._func_kwargs["x"] is Call.VALUE_ARG
+
+    def test_call_args_place(self):
+        course = PORT / "lst" / Call("insert", func_args=(0, Call.VALUE_ARG))
+        loaded = load_coordinates(dump_coordinates([Coordinate(course)]))[0].org
+
+        data = {"lst": [1]}
+        loaded.place(data, 0)
+        assert data == {"lst": [0, 1]}
+
+    @pytest.mark.parametrize("indexed", [True, False])
+    def test_where_indexed_round_trip(self, indexed):
+        course = PORT / "items" / Where(("sku", "A1"), indexed=indexed)
+        loaded = load_coordinates(dump_coordinates([Coordinate(course)]))[0].org[1]
+
+        assert isinstance(loaded, Where)
+        assert loaded.name == ("sku", "A1")
+        assert loaded._indexed is indexed
+
+    def test_text_when_lossless(self):
+        data = json.loads(dump_coordinates([Coordinate(Course("a/[b]/@c"))]))
+        assert data["coordinates"][0]["org"] == "a/[b]/@c"
+
+    def test_coordinate_fields(self):
+        coordinates = [
+            Coordinate(
+                (PORT / "a", PORT / "b"),
+                (PORT / "x", PORT / "y"),
+                clean_value=join,
+                clean_org="tests.double",
+                default=(1, NO_DEFAULT),
+            ),
+            Coordinate(PORT / "c", default=[1, 2]),
+        ]
+        loaded = load_coordinates(dump_coordinates(coordinates, indent=2))
+
+        assert loaded[0].org == coordinates[0].org
+        assert loaded[0].dst == coordinates[0].dst
+        assert loaded[0].clean_value == join_name()
+        assert loaded[0].clean_org == "tests.double"
+        assert loaded[0].clean_dst is None
+        assert loaded[0].default == (1, NO_DEFAULT)
+        assert loaded[0].default[1] is NO_DEFAULT
+
+        assert loaded[1].dst is None
+        assert loaded[1].default == [1, 2]
+
+    def test_no_default(self):
+        loaded = load_coordinates(dump_coordinates([Coordinate(PORT / "a")]))
+        assert loaded[0].default is NO_DEFAULT
+
+    def test_loaded_maps(self):
+        coordinates = [Coordinate(PORT / "a", PORT / "b", clean_value=double)]
+        loaded = load_coordinates(dump_coordinates(coordinates))
+
+        destination = dict()
+        Cartographer().map({"a": 3}, destination, loaded)
+        assert destination == {"b": 6}
+
+    def test_unregistered_cleaner(self):
+        coordinate = Coordinate(PORT / "a", clean_value=lambda v, c, cache: v)
+        with pytest.raises(ValueError):
+            dump_coordinates([coordinate])
+
+    def test_custom_factory(self):
+        class Custom(dict):
+            pass
+
+        with pytest.raises(ValueError):
+            dump_coordinates([Coordinate(PORT / Item("a", factory=Custom))])
+
+    def test_unknown_version(self):
+        with pytest.raises(ValueError):
+            load_coordinates(json.dumps({"version": 0, "coordinates": []}))
+
+    def test_unknown_bearing(self):
+        text = json.dumps(
+            {"version": 1, "coordinates": [{"org": [{"type": "Nope", "name": 1}]}]}
+        )
+        with pytest.raises(ValueError):
+            load_coordinates(text)
+
+    def test_course_type(self):
+        course = XCourse("<a>/b")
+        coordinates = [Coordinate(course)]
+        loaded = load_coordinates(dump_coordinates(coordinates), course_type=XCourse)
+
+        assert isinstance(loaded[0].org, XCourse)
+        assert isinstance(loaded[0].org[0], XElm)
+        assert loaded[0].org[1].BEARING_CLASSES == course[1].BEARING_CLASSES
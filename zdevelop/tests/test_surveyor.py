@@ -12,6 +12,7 @@ from gemma import (
     SuppressedErrors,
     PORT,
 )
+from gemma.extensions.xml import XCourse
 
 
 def test_surveyor_chart_raises_navigable():
@@ -125,3 +126,72 @@ def test_surveyor_add_endpoint():
 
     surveyor = Surveyor(end_points_extra=(A,))
     assert surveyor.chart(data) == answer
+
+
+def test_survey_events(surveyor_generic):
+    data = {"a": 1, "b": {"c": [2]}, "d": None}
+
+    events = [
+        (x.event, x.depth, x.bearing, x.value, x.course)
+        for x in surveyor_generic.survey_events(data)
+    ]
+    assert events == [
+        ("leaf", 1, Item("a"), 1, None),
+        ("enter", 1, Item("b"), {"c": [2]}, None),
+        ("enter", 2, Item("c"), [2], None),
+        ("leaf", 3, Item(0), 2, None),
+        ("leave", 2, Item("c"), [2], None),
+        ("leave", 1, Item("b"), {"c": [2]}, None),
+        ("leaf", 1, Item("d"), None, None),
+    ]
+
+
+def test_survey_events_matches_chart(data_structure_1, surveyor_generic):
+    events = surveyor_generic.survey_events(data_structure_1, courses=True)
+    pairs = [(x.course, x.value) for x in events if x.event != "leave"]
+
+    assert pairs == surveyor_generic.chart(data_structure_1)
+
+
+def test_survey_events_balanced(data_structure_1, surveyor_generic):
+    depth = 0
+    for event in surveyor_generic.survey_events(data_structure_1):
+        if event.event == "enter":
+            depth += 1
+            assert event.depth == depth
+        elif event.event == "leave":
+            assert event.depth == depth
+            depth -= 1
+        else:
+            assert event.depth == depth + 1
+
+    assert depth == 0
+
+
+def test_survey_events_raises_navigable():
+    surveyor = Surveyor(compasses=[Compass(target_types=dict)])
+
+    with pytest.raises(NonNavigableError):
+        list(surveyor.survey_events({"list": [1, 2]}))
+
+    with pytest.raises(NonNavigableError):
+        list(surveyor.survey_events([1, 2]))
+
+
+def test_survey_events_suppressed():
+    surveyor = Surveyor(compasses=[Compass(target_types=dict)])
+    events = list()
+
+    with pytest.raises(SuppressedErrors) as info:
+        for event in surveyor.survey_events({"list": [1, 2], "b": 1}, exceptions=False):
+            events.append((event.event, event.bearing))
+
+    assert len(info.value.errors) == 1
+    assert events == [("leaf", Item("list")), ("leaf", Item("b"))]
+
+
+def test_survey_events_course_type():
+    surveyor = Surveyor(course_type=XCourse)
+    events = list(surveyor.survey_events({"a": {"b": 1}}, courses=True))
+
+    assert all(isinstance(x.course, XCourse) for x in events)
@@ -0,0 +1,157 @@
+import pytest
+
+from gemma import (
+    CourseTemplate,
+    Course,
+    PORT,
+    Item,
+    Attr,
+    Call,
+    Fallback,
+    NullNameError,
+)
+from gemma.extensions.xml import XCourse, XElm
+
+
+@pytest.fixture
+def rows() -> dict:
+    return {"rows": [{"value": "zero"}, {"value": "one"}, {"value": "two"}]}
+
+
+class TestBind:
+    def test_placeholders(self):
+        template = CourseTemplate("a/[{key}]/{i:int}/@{key}")
+        assert template.placeholders == ("key", "i")
+
+    def test_str_repr(self):
+        template = CourseTemplate("rows/[{i:int}]/value")
+        assert str(template) == "rows/[{i:int}]/value"
+        assert repr(template) == "<CourseTemplate: 'rows/[{i:int}]/value'>"
+
+    @pytest.mark.parametrize(
+        "template, kwargs, expected",
+        [
+            ("rows/[{i}]/value", {"i": 1}, PORT / "rows" / Item(1) / "value"),
+            ("rows/[{i:int}]/value", {"i": "1"}, PORT / "rows" / Item(1) / "value"),
+            ("rows/[{i:str}]", {"i": 1}, PORT / "rows" / Item("1")),
+            ("{name}", {"name": "a"}, PORT / Fallback("a")),
+            ("@{name}", {"name": "a"}, PORT / Attr("a")),
+            ("{name}()", {"name": "keys"}, PORT / Call("keys")),
+            ("row_{i}/x", {"i": 2}, PORT / "row_2" / "x"),
+            ("{a}_{b:int}", {"a": "x", "b": "3"}, PORT / "x_3"),
+            ("static/path", {}, PORT / "static" / "path"),
+        ],
+    )
+    def test_bind(self, template, kwargs, expected):
+        course = CourseTemplate(template).bind(**kwargs)
+        assert course == expected
+        assert list(type(x) for x in course) == list(type(x) for x in expected)
+
+    def test_bind_positional(self):
+        course = CourseTemplate("{a}/[{b}]").bind("x", 0)
+        assert course == PORT / "x" / Item(0)
+
+    def test_bind_fallback_classes(self):
+        course = CourseTemplate("{a}").bind("b")
+        assert course[0].BEARING_CLASSES == Course("b")[0].BEARING_CLASSES
+
+    def test_bind_missing(self):
+        with pytest.raises(TypeError):
+            CourseTemplate("{a}/{b}").bind(a=1)
+
+    def test_bind_too_many(self):
+        with pytest.raises(TypeError):
+            CourseTemplate("{a}").bind(1, 2)
+
+    def test_unknown_type(self):
+        with pytest.raises(ValueError):
+            CourseTemplate("{a:list}")
+
+    @pytest.mark.parametrize("name", ["default", "class"])
+    def test_reserved_name(self, name):
+        with pytest.raises(ValueError):
+            CourseTemplate(f"[{{{name}}}]")
+
+    def test_course_type(self):
+        template = CourseTemplate("<{tag}>/text", course_type=XCourse)
+        course = template.bind(tag="a")
+
+        assert isinstance(course, XCourse)
+        assert isinstance(course[0], XElm)
+
+    def test_fetch_place(self, rows):
+        template = CourseTemplate("rows/[{i:int}]/value")
+        assert template.fetch(rows, 1) == "one"
+        assert template.fetch(rows, 5, default=None) is None
+
+        template.place(rows, "changed", i=2)
+        assert rows["rows"][2]["value"] == "changed"
+
+
+class TestCompile:
+    def test_fetch(self, rows):
+        fetch = CourseTemplate("rows/[{i:int}]/value").compile()
+        assert [fetch(rows, i) for i in range(3)] == ["zero", "one", "two"]
+        assert fetch(rows, i="1") == "one"
+
+    def test_missing(self, rows):
+        fetch = CourseTemplate("rows/[{i}]/value").compile()
+        with pytest.raises(NullNameError):
+            fetch(rows, 10)
+
+        assert fetch(rows, 10, default="default") == "default"
+
+    def test_fallback_attr(self, data_structure_1):
+        # the subscript fails, so the Fallback goes on to try Attr.
+        fetch = CourseTemplate("dict_data/[{key}]").compile()
+        assert fetch(data_structure_1, "a dict") == "a value"
+
+    def test_attr(self, data_structure_1):
+        fetch = CourseTemplate("@list_data/[{i:int}]").compile()
+        assert fetch(data_structure_1, 1) == "one list"
+
+        with pytest.raises(NullNameError):
+            CourseTemplate("@{name}").compile()(data_structure_1, "missing")
+
+    def test_call(self, data_dict):
+        fetch = CourseTemplate("{method}()").compile()
+        assert fetch(data_dict, "keys") == data_dict.keys()
+
+    def test_call_missing_default(self, data_dict):
+        fetch = CourseTemplate("missing()/[{key}]").compile()
+        assert fetch(data_dict, "key", default=None) is None
+
+    def test_substituted_segment(self):
+        fetch = CourseTemplate("[{a}]/row_{i}/value").compile()
+        data = {"x": {"row_1": {"value": 10}}}
+        assert fetch(data, "x", 1) == 10
+
+    def test_builtin_placeholder_names(self, data_structure_1):
+        # placeholders do not shadow the builtins the compiled source uses.
+        def key(*args):
+            return "shadowed"
+
+        fetch = CourseTemplate("[{getattr}]/@{Exception}").compile()
+        data = {key: data_structure_1}
+        assert fetch(data, key, "list_data") is data_structure_1.list_data
+        assert fetch(data, key, "missing", default=None) is None
+
+    def test_type_error(self):
+        fetch = CourseTemplate("[{i}]").compile()
+        with pytest.raises(TypeError):
+            fetch(10, 0)
+
+    @pytest.mark.parametrize(
+        "template, args",
+        [
+            ("list_data/[{i:int}]/[{key}]", (4, "one dict")),
+            ("dict_data/{key}", ("a dict",)),
+            ("@list_data/{i:int}", ("1",)),
+            ("one/bit_length()", ()),
+            ("dict_data/keys()", ()),
+        ],
+    )
+    def test_matches_course_fetch(self, data_structure_1, template, args):
+        template = CourseTemplate(template)
+        expected = template.bind(*args).fetch(data_structure_1)
+        assert template.compile()(data_structure_1, *args) == expected